@@ -0,0 +1,91 @@
+import argparse
+import sys
+import time
+
+import app.models  # noqa: F401
+from app.crud.test_case import reindex_cases
+from app.crud.test_case_stats import rebuild_case_stats
+from app.crud.test_run import recount_run_counters
+from app.database import SessionLocal, engine
+from app.seeding import SeedConfig, SeedStats, seed_database
+
+
+def recount_runs(args: argparse.Namespace) -> None:
+    with SessionLocal() as db:
+        updated = recount_run_counters(db, args.run_id or None)
+    print(f"Recounted result counters for {updated} run(s)")
+
+
+def rebuild_stats(args: argparse.Namespace) -> None:
+    with SessionLocal() as db:
+        rebuilt = rebuild_case_stats(db, args.case_id or None)
+        db.commit()
+    print(f"Rebuilt stability stats for {rebuilt} test case(s)")
+
+
+def reindex_search(args: argparse.Namespace) -> None:
+    with SessionLocal() as db:
+        reindex_cases(db, args.case_id or None)
+        db.commit()
+    print("Rebuilt the test case search index")
+
+
+def seed(args: argparse.Namespace) -> None:
+    options = dict(users=args.users, seed=args.seed, password=args.password, batch_size=args.batch_size)
+    if args.results:
+        config = SeedConfig.for_results(args.results, args.suites, args.cases_per_suite, **options)
+    else:
+        config = SeedConfig(
+            suites=args.suites, cases_per_suite=args.cases_per_suite, runs_per_suite=args.runs_per_suite, **options
+        )
+    print(
+        f"Seeding {config.users} users, {config.suites} suites, {config.cases} cases, "
+        f"{config.runs} runs, {config.results} results (seed {config.seed})"
+    )
+    started = time.perf_counter()
+
+    def progress(stats: SeedStats) -> None:
+        print(f"  {stats.results:>12,} / {config.results:,} results", end="\r", flush=True)
+
+    try:
+        stats = seed_database(engine, config, progress)
+    except ValueError as exc:
+        sys.exit(str(exc))
+    elapsed = time.perf_counter() - started
+    print(f"\nSeeded {stats.results:,} results in {elapsed:.1f}s ({stats.results / elapsed:,.0f}/s)")
+    print(f"Log in as user1@seed.example.com … user{config.users}@seed.example.com / {config.password}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recount = commands.add_parser("recount-runs", help="Rebuild per-run result counters from test_results")
+    recount.add_argument("--run-id", type=int, action="append", help="Only this run (repeatable)")
+    recount.set_defaults(handler=recount_runs)
+
+    rebuild = commands.add_parser("rebuild-case-stats", help="Rebuild per-case flaky-test stats from test_results")
+    rebuild.add_argument("--case-id", type=int, action="append", help="Only this case (repeatable)")
+    rebuild.set_defaults(handler=rebuild_stats)
+
+    reindex = commands.add_parser("reindex-search", help="Rebuild the test case full-text search index")
+    reindex.add_argument("--case-id", type=int, action="append", help="Only this case (repeatable)")
+    reindex.set_defaults(handler=reindex_search)
+
+    seeder = commands.add_parser("seed", help="Fill an empty database with deterministic synthetic data")
+    seeder.add_argument("--users", type=int, default=5)
+    seeder.add_argument("--suites", type=int, default=100)
+    seeder.add_argument("--cases-per-suite", type=int, default=50)
+    seeder.add_argument("--runs-per-suite", type=int, default=20)
+    seeder.add_argument("--results", type=int, help="Target result count; overrides --runs-per-suite")
+    seeder.add_argument("--seed", type=int, default=0, help="Same seed, same data")
+    seeder.add_argument("--password", default="password123", help="Password for every seeded user")
+    seeder.add_argument("--batch-size", type=int, default=50_000, help="Rows per INSERT batch and commit")
+    seeder.set_defaults(handler=seed)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,98 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "QA Test Management API"
     API_V1_STR: str = "/api/v1"
 
+    # ── Logging ───────────────────────────────────────────────────────────────
+    LOG_LEVEL: str = "INFO"
+    # One JSON object per line (with request_id) instead of the plain-text format
+    LOG_JSON: bool = False
+    # Serve Prometheus metrics at /metrics
+    METRICS_ENABLED: bool = True
+    # Users (by login email) allowed on the /admin diagnostics endpoints
+    ADMIN_EMAILS: list[str] = []
+    # Lets admins profile single requests with `X-Profile: 1` / `?profile=1`.
+    # Off: the middleware isn't installed at all. The last PROFILING_KEEP profiles
+    # are kept in memory at GET /admin/profiles.
+    PROFILING_ENABLED: bool = False
+    PROFILING_INTERVAL_MS: float = 1.0
+    PROFILING_KEEP: int = 20
+
     # ── Database ──────────────────────────────────────────────────────────────
     # SQLite by default; swap for postgresql+psycopg2://... in .env for prod
     DATABASE_URL: str = "sqlite:///./qa_test_management.db"
+    # Serve /test-results through an AsyncSession (aiosqlite / asyncpg) instead of
+    # blocking sessions on the threadpool. ASYNC_DATABASE_URL defaults to
+    # DATABASE_URL with the driver swapped for its async counterpart.
+    ASYNC_DATABASE: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (file-backed SQLite and PostgreSQL; in-memory SQLite keeps its
+    # single-connection pool). Recycle/pre-ping only apply to network databases.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # SQLite pragmas applied to every new connection. WAL lets readers run alongside
+    # the single writer; synchronous=NORMAL is durable under WAL except on power loss;
+    # busy_timeout makes writers wait instead of failing with "database is locked".
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+
+    # Statements slower than this are logged with their query plan and kept in a
+    # top-N list at GET /admin/slow-queries (0 disables the recorder). Each capture
+    # costs one extra EXPLAIN round trip on the same connection.
+    SLOW_QUERY_MS: int = 0
+    SLOW_QUERY_TOP_N: int = 50
+    SLOW_QUERY_EXPLAIN: bool = True
 
     # ── JWT ───────────────────────────────────────────────────────────────────
     # Generate a strong secret in prod: python -c "import secrets; print(secrets.token_hex(32))"
     SECRET_KEY: str = "change-me-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # ── Password hashing ──────────────────────────────────────────────────────
+    # Each +1 doubles bcrypt's cost; existing hashes keep verifying at their own cost
+    BCRYPT_ROUNDS: int = 12
+    # >0 runs bcrypt in a process pool of this size instead of on the request
+    # thread; when more than PASSWORD_HASH_MAX_PENDING hashes are queued, logins
+    # and registrations get a 503 instead of piling up
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_PENDING: int = 32
+
+    # Authenticated principals are cached per token for this long (0 disables)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+
+    # ── Response cache ────────────────────────────────────────────────────────
+    # Run summaries, suite reports and case history are cached until a write
+    # changes them, or for this long at most (0 disables the cache)
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_SIZE: int = 10_000
+    # Share the cache between workers through Redis (needs the `redis` package)
+    RESPONSE_CACHE_REDIS_URL: str | None = None
+    # GET /test-cases/{id}/history returns this many of the latest results
+    CASE_HISTORY_SIZE: int = 50
+
+    # ── Ingestion ─────────────────────────────────────────────────────────────
+    # Upper bound on items accepted by POST /test-results/bulk in one request
+    BULK_RESULTS_MAX_ITEMS: int = 5000
+    # ...and on its body size, checked before the JSON is parsed
+    BULK_RESULTS_MAX_BYTES: int = 16 * 1024 * 1024
+    # Streaming uploads are validated line by line and flushed every N rows
+    INGEST_CHUNK_SIZE: int = 1000
+    NDJSON_MAX_LINE_BYTES: int = 1024 * 1024
+    # Only the first N rejected lines are echoed back; the rest are just counted
+    INGEST_MAX_REPORTED_ERRORS: int = 100
+
+    # ── Export ────────────────────────────────────────────────────────────────
+    # Exports read through a server-side cursor this many rows at a time
+    EXPORT_YIELD_PER: int = 1000
+    # zlib level for gzip-encoded exports (1 = fastest, 9 = smallest)
+    EXPORT_GZIP_LEVEL: int = 5
 
     # Reads from a .env file automatically (values there override the defaults above)
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
@@ -0,0 +1,53 @@
+import csv
+from collections.abc import AsyncIterator
+
+
+async def iter_csv_records(
+    lines: AsyncIterator[bytes | None], max_record_bytes: int
+) -> AsyncIterator[tuple[int, list[str] | None]]:
+    # Reassembles CSV records from the physical lines of iter_ndjson_lines():
+    # a quoted field may span lines, so a record ends on the first line that
+    # leaves an even number of quote characters. Yields (line number the record
+    # starts on, fields). A record over max_record_bytes, or one that can't be
+    # decoded as UTF-8, is dropped and yielded as None.
+    parts: list[bytes] = []
+    size = quotes = 0
+    start = line_no = 0
+    broken = False
+    async for line in lines:
+        line_no += 1
+        if not parts and not broken:
+            start = line_no
+        if line is None:
+            # Too long to read, so the quote count is lost; resync on the next line
+            yield start, None
+            parts.clear()
+            size = quotes = 0
+            broken = False
+            continue
+        quotes += line.count(b'"')
+        size += len(line) + 1
+        if size > max_record_bytes:
+            broken = True
+            parts.clear()
+        if not broken:
+            parts.append(line.removesuffix(b"\r"))
+        if quotes % 2:
+            continue
+        if broken:
+            yield start, None
+        else:
+            yield start, _parse(b"\n".join(parts))
+        parts.clear()
+        size = quotes = 0
+        broken = False
+    if parts or broken:
+        yield start, None if broken else _parse(b"\n".join(parts))
+
+
+def _parse(record: bytes) -> list[str] | None:
+    try:
+        text = record.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return None
+    return next(csv.reader([text]), [])
@@ -0,0 +1,64 @@
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import HTTPException, Request, Response, status
+
+# Strong validators for conditional requests. Cases and suites carry updated_at,
+# so their tag is just (id, updated_at); runs have no such column (their counters
+# move with every result write) and lists have no single row to point at, so
+# those hash the column values themselves. Either way the tag is computed from
+# what was read from the database, before anything is serialized.
+ETAG_HEADER = "ETag"
+
+
+def make_etag(*parts) -> str:
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest() + '"'
+
+
+def entity_etag(obj) -> str:
+    return make_etag(type(obj).__name__, obj.id, obj.updated_at)
+
+
+def row_etag(obj) -> str:
+    # Every mapped column, for entities without an updated_at
+    return make_etag(type(obj).__name__, *(getattr(obj, column.key) for column in obj.__table__.columns))
+
+
+def rows_etag(model_name: str, rows: Iterable) -> str:
+    # Content hash of a list page's column rows
+    return make_etag(model_name, *(tuple(row) for row in rows))
+
+
+def _tags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def _weak_match(etag: str, header: str) -> bool:
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in _tags(header))
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    # The 304 to return when the client's copy is current, else None
+    header = request.headers.get("if-none-match")
+    if header and _weak_match(etag, header):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
+    return None
+
+
+def check_if_match(request: Request, etag: str) -> None:
+    # If-Match uses the strong comparison, so a weak tag never matches
+    header = request.headers.get("if-match")
+    if header and not any(tag == "*" or tag == etag for tag in _tags(header)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Resource has changed since it was fetched (If-Match)",
+        )
+
+
+def conditional(request: Request, response: Response, etag: str) -> Response | None:
+    # GET helper: the 304 if the client is current, otherwise tags `response`
+    cached = not_modified(request, etag)
+    if cached is None:
+        response.headers[ETAG_HEADER] = etag
+    return cached
@@ -42,3 +42,12 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
         status_code=500,
         content=_error_body(500, "An internal server error occurred"),
     )
+
+
+async def password_hashing_busy_handler(request: Request, exc: Exception) -> JSONResponse:
+    logger.warning("Password hashing saturated — %s %s", request.method, request.url.path)
+    return JSONResponse(
+        status_code=503,
+        content=_error_body(503, "Authentication is busy, retry shortly"),
+        headers={"Retry-After": "1"},
+    )
@@ -0,0 +1,105 @@
+import csv
+import enum
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+# Streaming CSV / NDJSON exports. Rows come off a server-side cursor
+# EXPORT_YIELD_PER at a time and are encoded into ~64 KiB chunks, so memory
+# stays flat however large the export is.
+_CHUNK_BYTES = 64 * 1024
+
+
+class ExportFormat(str, enum.Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv; charset=utf-8",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(columns: list[str], rows: Iterable) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(["" if value is None else _plain(value) for value in row])
+        if buffer.tell() >= _CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def iter_ndjson(columns: list[str], rows: Iterable) -> Iterator[bytes]:
+    lines, size = [], 0
+    for row in rows:
+        line = json.dumps(dict(zip(columns, map(_plain, row))), separators=(",", ":"))
+        lines.append(line)
+        size += len(line) + 1
+        if size >= _CHUNK_BYTES:
+            yield ("\n".join(lines) + "\n").encode()
+            lines, size = [], 0
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(settings.EXPORT_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip container
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            try:
+                return float(params.strip().removeprefix("q=") or 1) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def stream_rows(db: Session, query: Select) -> Iterator:
+    # Executed on first iteration, i.e. once the response starts streaming.
+    # yield_per turns on stream_results (a named cursor on PostgreSQL).
+    with db.execute(query.execution_options(yield_per=settings.EXPORT_YIELD_PER)) as result:
+        yield from result
+
+
+def export_response(
+    request: Request, db: Session, query: Select, export_format: ExportFormat, filename: str
+) -> StreamingResponse:
+    # The request's session stays open until the body is sent (FastAPI closes
+    # yield dependencies after the response). Gzip is applied on the fly when
+    # the client accepts it.
+    encode = iter_csv if export_format == ExportFormat.csv else iter_ndjson
+    body = encode(list(query.selected_columns.keys()), stream_rows(db, query))
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"', "Vary": "Accept-Encoding"}
+    if accepts_gzip(request):
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=MEDIA_TYPES[export_format], headers=headers)
@@ -0,0 +1,73 @@
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO
+from xml.etree.ElementTree import Element, iterparse
+
+from app.models.test_result import ResultStatus
+
+# Child element of <testcase> → result status; a testcase with none of these passed
+_OUTCOME_TAGS = {
+    "failure": ResultStatus.failed,
+    "error": ResultStatus.error,
+    "skipped": ResultStatus.skipped,
+}
+
+
+@dataclass
+class JUnitCase:
+    title: str
+    status: ResultStatus
+    duration_ms: int | None
+    message: str | None
+
+
+def _parse_duration_ms(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        ms = float(value.replace(",", "")) * 1000
+    except (ValueError, OverflowError):
+        return None
+    # inf/nan or a negative time would corrupt the run's total duration
+    if not math.isfinite(ms) or ms < 0:
+        return None
+    return round(ms)
+
+
+def _parse_testcase(elem: Element) -> JUnitCase:
+    # A missing or blank name comes through as title="", for the caller to skip
+    status, message = ResultStatus.passed, None
+    for child in elem:
+        if child.tag in _OUTCOME_TAGS:
+            status = _OUTCOME_TAGS[child.tag]
+            message = child.get("message") or (child.text or "").strip() or None
+            break
+    return JUnitCase(
+        title=elem.get("name", "").strip(),
+        status=status,
+        duration_ms=_parse_duration_ms(elem.get("time")),
+        message=message,
+    )
+
+
+def iter_junit_cases(source: IO[bytes]) -> Iterator[JUnitCase]:
+    # Streams <testcase> elements out of a JUnit/xUnit report. Finished elements
+    # are detached from their parent as soon as they are consumed, so memory is
+    # bounded by the largest single <testcase>, not by the report size.
+    # Raises xml.etree.ElementTree.ParseError on malformed XML.
+    stack: list[Element] = []
+    in_testcase = 0
+    for event, elem in iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            if elem.tag == "testcase":
+                in_testcase += 1
+            continue
+
+        stack.pop()
+        if elem.tag == "testcase":
+            in_testcase -= 1
+            yield _parse_testcase(elem)
+        if not in_testcase and stack:
+            stack[-1].remove(elem)
@@ -1,29 +1,136 @@
+import atexit
+import json
 import logging
+import queue
 import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+REQUEST_ID_HEADER = "X-Request-ID"
 
-def configure_logging(level: str = "INFO") -> None:
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+# Set for the duration of each HTTP request by RequestLoggingMiddleware
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+_TEXT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(request_id)s | %(message)s"
+
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", None),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    # The stock QueueHandler runs the full formatter on the calling thread. Only
+    # freeze what can't safely cross threads (the merged message, the traceback)
+    # and leave timestamps, padding and JSON encoding to the listener thread.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: str = "INFO", json_logs: bool = False) -> None:
+    # Request threads only enqueue records; a background QueueListener formats
+    # and writes them, so slow stderr/stdout never stalls a request
+    global _queue_handler, _listener
+    if _listener is not None:
+        _listener.stop()
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+
+    output = logging.StreamHandler()
+    output.setFormatter(JsonFormatter() if json_logs else logging.Formatter(_TEXT_FORMAT, "%Y-%m-%d %H:%M:%S"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _DeferredFormatQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestIdFilter())
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+    root.addHandler(_queue_handler)
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+class RequestLoggingMiddleware:
+    # Plain ASGI middleware: no BaseHTTPMiddleware task/stream wrapping, so
+    # streaming responses pass straight through. Tags each request with an
+    # X-Request-ID (taken from the client when it sends one) and logs one line
+    # when the response has been sent.
     _logger = logging.getLogger(__name__)
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _incoming_request_id(scope) or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        status_code = 500
         start = time.perf_counter()
-        response = await call_next(request)
-        duration_ms = int((time.perf_counter() - start) * 1000)
 
-        log = self._logger.info if response.status_code < 400 else self._logger.warning
-        log("%-5s %s → %d (%dms)", request.method, request.url.path, response.status_code, duration_ms)
-        return response
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration_ms = int((time.perf_counter() - start) * 1000)
+            log = self._logger.info if status_code < 400 else self._logger.warning
+            log("%-5s %s → %d (%dms)", scope["method"], scope["path"], status_code, duration_ms)
+            request_id_var.reset(token)
+
+
+def _incoming_request_id(scope: Scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            if 0 < len(candidate) <= 128 and candidate.isprintable():
+                return candidate
+    return None
@@ -0,0 +1,29 @@
+from collections.abc import AsyncIterator
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[bytes | None]:
+    # Splits a byte stream into lines without ever holding more than one line.
+    # A line longer than max_line_bytes is dropped and yielded as None so the
+    # caller can still count it.
+    buffer = bytearray()
+    overflow = False
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if not overflow:
+                buffer += chunk[start:end]
+            yield None if overflow or len(buffer) > max_line_bytes else bytes(buffer)
+            buffer.clear()
+            overflow = False
+            start = end + 1
+        if not overflow:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                overflow = True
+                buffer.clear()
+    if overflow:
+        yield None
+    elif buffer:
+        yield bytes(buffer)
@@ -0,0 +1,40 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+
+from fastapi import HTTPException, Response
+
+# List endpoints page by primary key: a cursor encodes the id of the last row on
+# the previous page and the next page starts with `WHERE id > :last_id`, so
+# page 10,000 costs the same index seek as page 1. `skip` still works and is
+# applied on top of the cursor.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"id": last_id}).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    if not isinstance(last_id, int):
+        raise ValueError("Cursor id must be an integer")
+    return last_id
+
+
+def cursor_after_id(cursor: str | None = None) -> int | None:
+    # Dependency: turns the opaque `cursor` query param into the id to seek past
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def set_next_cursor(response: Response, items: Sequence, limit: int) -> None:
+    # A full page means there may be more rows; a short page is the last one
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(items[-1].id)
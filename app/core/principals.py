@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from typing import Any
+
+from app.config import settings
+from app.core import metrics
+from app.core.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class Principal:
+    user: Any                              # detached app.models.user.User snapshot
+    scopes: frozenset[str] | None = None   # None for password/JWT logins: unrestricted
+    api_key_id: int | None = None
+
+
+# Bearer token (JWT or API key) → Principal. A hit skips both the credential
+# check and the users lookup; entries never outlive the token's own expiry and
+# are dropped as soon as the user is deactivated or the API key revoked.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def is_admin(principal: Principal) -> bool:
+    # Admins are password logins whose email is listed in ADMIN_EMAILS; API keys never are
+    if principal.api_key_id is not None:
+        return False
+    return principal.user.email.lower() in {email.lower() for email in settings.ADMIN_EMAILS}
+
+
+def invalidate_user(user_id: int) -> None:
+    principal_cache.delete_where(lambda principal: principal.user.id == user_id)
+
+
+def invalidate_api_key(api_key_id: int) -> None:
+    principal_cache.delete_where(lambda principal: principal.api_key_id == api_key_id)
+
+
+def _cache_metrics() -> list[str]:
+    stats = principal_cache.stats()
+    return [
+        "# HELP principal_cache_hits_total Authenticated-principal cache hits.",
+        "# TYPE principal_cache_hits_total counter",
+        f"principal_cache_hits_total {stats['hits']}",
+        "# HELP principal_cache_misses_total Authenticated-principal cache misses.",
+        "# TYPE principal_cache_misses_total counter",
+        f"principal_cache_misses_total {stats['misses']}",
+        "# HELP principal_cache_entries Entries currently in the principal cache.",
+        "# TYPE principal_cache_entries gauge",
+        f"principal_cache_entries {stats['size']}",
+    ]
+
+
+metrics.register_collector(_cache_metrics)
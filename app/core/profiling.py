@@ -0,0 +1,202 @@
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core.logging import request_id_var
+from app.core.principals import is_admin
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+Frame = tuple[str, str, int]  # (function, file, first line)
+
+
+@dataclass
+class Profile:
+    id: str
+    method: str
+    path: str
+    request_id: str | None
+    interval_ms: float
+    created_at: datetime
+    status_code: int = 0
+    duration_ms: float = 0.0
+    samples: int = 0
+    stacks: Counter[tuple[Frame, ...]] = field(default_factory=Counter)
+
+    def top_functions(self, limit: int = 30) -> list[dict]:
+        # Sample counts per function: "self" where it was the innermost frame,
+        # "total" anywhere on the stack
+        own: Counter[Frame] = Counter()
+        total: Counter[Frame] = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for frame in set(stack):
+                total[frame] += count
+        return [
+            {"function": name, "file": filename, "line": line, "self": own[frame], "total": count}
+            for frame, count in total.most_common(limit)
+            for name, filename, line in [frame]
+        ]
+
+    def collapsed(self) -> str:
+        # Brendan Gregg's folded format; loads into flamegraph.pl or speedscope
+        return "".join(
+            ";".join(f"{name} ({filename}:{line})" for name, filename, line in stack) + f" {count}\n"
+            for stack, count in self.stacks.most_common()
+        )
+
+
+# Set while a profiled request is being handled. Sync dependencies and endpoints
+# run on worker threads under a copy of the request's context, which is how the
+# sampler tells this request's threads apart from everyone else's.
+_active_profile: ContextVar[Profile | None] = ContextVar("active_profile", default=None)
+
+_profiles: deque[Profile] = deque(maxlen=settings.PROFILING_KEEP)
+_profiles_lock = threading.Lock()
+
+_PATH_PREFIXES = sorted({p for p in sys.path if p}, key=len, reverse=True)
+
+
+def _short_path(filename: str) -> str:
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix):].lstrip("/\\")
+    return filename
+
+
+def _frame_context(frame: FrameType) -> Context | None:
+    # The Context a frame is running callbacks under: anyio's worker threads keep
+    # it in a `context` local, asyncio's Handle._run in `self._context`
+    f_locals = frame.f_locals
+    candidate = f_locals.get("context")
+    if isinstance(candidate, Context):
+        return candidate
+    candidate = getattr(f_locals.get("self"), "_context", None)
+    return candidate if isinstance(candidate, Context) else None
+
+
+def _owned_stack(frame: FrameType, profile: Profile) -> tuple[Frame, ...] | None:
+    frames: list[FrameType] = []
+    while frame is not None:
+        context = _frame_context(frame)
+        if context is not None:
+            if context.get(_active_profile) is not profile:
+                return None
+            break
+        frames.append(frame)
+        frame = frame.f_back
+    else:
+        return None
+    return tuple(
+        (f.f_code.co_name, _short_path(f.f_code.co_filename), f.f_code.co_firstlineno)
+        for f in reversed(frames)
+    )
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, profile: Profile):
+        super().__init__(name=f"profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        interval = self.profile.interval_ms / 1000
+        own_id = threading.get_ident()
+        while not self.stopped.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = _owned_stack(frame, self.profile)
+                if stack:
+                    self.profile.stacks[stack] += 1
+                    self.profile.samples += 1
+
+
+def get_profiles() -> list[Profile]:
+    with _profiles_lock:
+        return list(reversed(_profiles))
+
+
+def get_profile(profile_id: str) -> Profile | None:
+    return next((p for p in get_profiles() if p.id == profile_id), None)
+
+
+def _wants_profile(scope: Scope) -> bool:
+    if any(name == b"x-profile" and value not in (b"", b"0") for name, value in scope["headers"]):
+        return True
+    return any(part in (b"profile=1", b"profile=true") for part in scope["query_string"].split(b"&"))
+
+
+def start_sampling(request: Request) -> None:
+    # Called by the auth dependency once the request's principal is known, so
+    # only admin requests ever pay for a sampler thread
+    state = request.scope.get("state", {})
+    profile = state.get("profile")
+    principal = state.get("principal")
+    if profile is None or "profile_sampler" in state or principal is None or not is_admin(principal):
+        return
+    sampler = state["profile_sampler"] = _Sampler(profile)
+    sampler.start()
+
+
+class ProfilingMiddleware:
+    # Only installed when PROFILING_ENABLED is set. A request sent with
+    # `X-Profile: 1` (or ?profile=1) gets a Profile; sampling starts once the
+    # request authenticates as an admin (start_sampling) and covers the rest of
+    # it. The id is returned in X-Profile-Id for GET /admin/profiles/{id}.
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(
+            id=uuid.uuid4().hex[:12],
+            method=scope["method"],
+            path=scope["path"],
+            request_id=request_id_var.get(),
+            interval_ms=settings.PROFILING_INTERVAL_MS,
+            created_at=datetime.now(timezone.utc),
+        )
+        # request.state: the auth dependency records the principal and, for
+        # admins, the running sampler here
+        state = scope.setdefault("state", {})
+        state["profile"] = profile
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                if "profile_sampler" in state:
+                    MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile.id)
+            await send(message)
+
+        token = _active_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.duration_ms = (time.perf_counter() - start) * 1000
+            sampler = state.get("profile_sampler")
+            if sampler is not None:
+                sampler.stopped.set()
+                await asyncio.to_thread(sampler.join)
+            _active_profile.reset(token)
+            if sampler is not None:
+                with _profiles_lock:
+                    _profiles.append(profile)
@@ -0,0 +1,268 @@
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Protocol, TypeVar
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.core import metrics
+from app.core.cache import TTLCache
+
+# Cache for computed read-heavy responses (run summaries, suite reports, case
+# history). Entries are keyed by the object they describe and dropped by the
+# CRUD write paths that change them, so the TTL is only a backstop for writes
+# made outside the API (the CLI, another process without a shared backend).
+
+logger = logging.getLogger(__name__)
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+def run_summary_key(run_id: int) -> str:
+    return f"run-summary:{run_id}"
+
+
+def suite_report_key(suite_id: int) -> str:
+    return f"suite-report:{suite_id}"
+
+
+def case_history_key(case_id: int) -> str:
+    return f"case-history:{case_id}"
+
+
+class CacheBackend(Protocol):
+    # load() returns the cached value (or None) and the key's generation;
+    # store() only writes if the key hasn't been invalidated since that
+    # generation was read, so a query that raced a write never caches its result
+    def load(self, key: str, model: type[Model]) -> tuple[Model | None, object]: ...
+    def store(self, key: str, value: BaseModel, generation: object) -> None: ...
+    def delete(self, keys: Iterable[str]) -> None: ...
+    def clear(self) -> None: ...
+
+
+class LocalBackend:
+    # Per-process LRU; values are kept as the model instances themselves.
+    # Each invalidation stamps its key from one increasing counter. Only the
+    # latest `maxsize` stamps are kept; older ones are folded into a floor that
+    # every unstamped key reads as its generation.
+    def __init__(self, maxsize: int, ttl: float):
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.maxsize = maxsize
+        self._stamps: OrderedDict[str, int] = OrderedDict()
+        self._floor = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def load(self, key: str, model: type[Model]) -> tuple[Model | None, object]:
+        with self._lock:
+            generation = self._stamps.get(key, self._floor)
+        return self.entries.get(key), generation
+
+    def store(self, key: str, value: BaseModel, generation: object) -> None:
+        with self._lock:
+            if self._stamps.get(key, self._floor) == generation:
+                self.entries.set(key, value)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self.entries.delete(key)
+                self._stamps[key] = next(self._counter)
+                self._stamps.move_to_end(key)
+            while len(self._stamps) > max(self.maxsize, 1):
+                _, self._floor = self._stamps.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+            self._stamps.clear()
+            self._floor = next(self._counter)
+
+
+# KEYS: value, generation, epoch. ARGV: generation read by load(), value, TTL in ms
+_STORE_IF_CURRENT = """
+local current = (redis.call('GET', KEYS[2]) or '') .. ':' .. (redis.call('GET', KEYS[3]) or '')
+if current == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+end
+"""
+
+
+class RedisBackend:
+    # Shared between workers, so one write invalidates every process's view.
+    # Values are stored as JSON. Needs the `redis` package (not a hard dependency).
+    # Each key has a generation counter beside it, bumped by every invalidation,
+    # and clear() bumps one epoch counter for the whole prefix; a value is
+    # written by a Lua compare-and-set against both, so a worker can't cache
+    # a result computed before another worker's write.
+    # Redis being unreachable never fails a request: loads count as misses and
+    # failed writes or invalidations are logged (the TTL bounds what they leave).
+
+    # Generation counters must outlive any computation that read them
+    GENERATION_TTL_SECONDS = 24 * 3600
+
+    def __init__(self, url: str, ttl: float, prefix: str = "qa-cache:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.errors = redis.RedisError
+        self.ttl = ttl
+        self.prefix = prefix
+        self.epoch_name = prefix + "epoch"
+        self._store_if_current = self.client.register_script(_STORE_IF_CURRENT)
+
+    def _generation_name(self, key: str) -> str:
+        return f"{self.prefix}gen:{key}"
+
+    def load(self, key: str, model: type[Model]) -> tuple[Model | None, object]:
+        try:
+            raw, generation, epoch = self.client.mget(
+                self.prefix + key, self._generation_name(key), self.epoch_name
+            )
+        except self.errors as exc:
+            logger.warning("Response cache read failed for %s: %s", key, exc)
+            return None, None
+        value = None if raw is None else model.model_validate_json(raw)
+        return value, f"{(generation or b'').decode()}:{(epoch or b'').decode()}"
+
+    def store(self, key: str, value: BaseModel, generation: object) -> None:
+        if generation is None:
+            return
+        try:
+            self._store_if_current(
+                keys=[self.prefix + key, self._generation_name(key), self.epoch_name],
+                args=[generation, value.model_dump_json(), int(self.ttl * 1000)],
+            )
+        except self.errors as exc:
+            logger.warning("Response cache write failed for %s: %s", key, exc)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        try:
+            pipe = self.client.pipeline()
+            for key in keys:
+                pipe.incr(self._generation_name(key))
+                pipe.expire(self._generation_name(key), self.GENERATION_TTL_SECONDS)
+            pipe.delete(*(self.prefix + key for key in keys))
+            pipe.execute()
+        except self.errors as exc:
+            logger.error("Response cache invalidation failed for %s: %s", ", ".join(keys), exc)
+
+    def clear(self) -> None:
+        try:
+            self.client.incr(self.epoch_name)
+            for name in self.client.scan_iter(match=self.prefix + "*"):
+                if name.decode() != self.epoch_name:
+                    self.client.delete(name)
+        except self.errors as exc:
+            logger.error("Response cache clear failed: %s", exc)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: BaseModel | None = None
+        self.error: BaseException | None = None
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend | None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, model: type[Model], compute: Callable[[], Model]) -> Model:
+        if self.backend is None:
+            return compute()
+        value, generation = self.backend.load(key, model)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        # Identical concurrent misses wait for the first one's query
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+            # Outside the lock: the backend round trip mustn't hold up other
+            # keys. It's dropped if the key was invalidated after the load.
+            self.backend.store(key, flight.value, generation)
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+
+    def invalidate(self, *keys: str) -> None:
+        if self.backend is None or not keys:
+            return
+        # Requests arriving after the write start their own query rather than
+        # waiting on one that may predate it
+        with self._lock:
+            for key in keys:
+                self._inflight.pop(key, None)
+        self.backend.delete(keys)
+
+    def clear(self) -> None:
+        if self.backend is None:
+            return
+        with self._lock:
+            self._inflight.clear()
+        self.backend.clear()
+
+
+def _make_backend() -> CacheBackend | None:
+    if settings.RESPONSE_CACHE_TTL_SECONDS <= 0:
+        return None
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        return RedisBackend(settings.RESPONSE_CACHE_REDIS_URL, settings.RESPONSE_CACHE_TTL_SECONDS)
+    return LocalBackend(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = ResponseCache(_make_backend())
+
+
+def invalidate_results(run_ids: Iterable[int] = (), case_ids: Iterable[int] = ()) -> None:
+    # Result writes change the summaries of their runs and the history of their cases
+    response_cache.invalidate(*map(run_summary_key, set(run_ids)), *map(case_history_key, set(case_ids)))
+
+
+def _cache_metrics() -> list[str]:
+    return [
+        "# HELP response_cache_hits_total Computed-response cache hits.",
+        "# TYPE response_cache_hits_total counter",
+        f"response_cache_hits_total {response_cache.hits}",
+        "# HELP response_cache_misses_total Computed-response cache misses (one query each).",
+        "# TYPE response_cache_misses_total counter",
+        f"response_cache_misses_total {response_cache.misses}",
+        "# HELP response_cache_coalesced_total Misses that waited on an identical in-flight query.",
+        "# TYPE response_cache_coalesced_total counter",
+        f"response_cache_coalesced_total {response_cache.coalesced}",
+    ]
+
+
+metrics.register_collector(_cache_metrics)
@@ -1,17 +1,91 @@
+import asyncio
+import hashlib
+import hmac
+import multiprocessing
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 
 from app.config import settings
 
 
+# Raised when the hashing pool already has PASSWORD_HASH_MAX_PENDING jobs in flight
+class PasswordHashingBusy(Exception):
+    pass
+
+
+_hash_pool: ProcessPoolExecutor | None = None
+_hash_pool_lock = threading.Lock()
+_hash_slots = threading.BoundedSemaphore(max(settings.PASSWORD_HASH_MAX_PENDING, 1))
+
+
+def _bcrypt_hash(plain: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(plain, bcrypt.gensalt(rounds))
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # spawn, not fork: the server process is multi-threaded
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _hash_pool
+
+
+def _run_hashing(fn, *args):
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return fn(*args)
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        return _get_hash_pool().submit(fn, *args).result()
+    finally:
+        _hash_slots.release()
+
+
+async def _run_hashing_async(fn, *args):
+    # For async handlers: the pool job is awaited, so a pending hash holds no
+    # threadpool thread. The semaphore still caps the backlog.
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return await run_in_threadpool(fn, *args)
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        return await asyncio.wrap_future(_get_hash_pool().submit(fn, *args))
+    finally:
+        _hash_slots.release()
+
+
+def shutdown_password_hashing() -> None:
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(cancel_futures=True)
+            _hash_pool = None
+
+
 def hash_password(plain: str) -> str:
-    return bcrypt.hashpw(plain.encode(), bcrypt.gensalt()).decode()
+    return _run_hashing(_bcrypt_hash, plain.encode(), settings.BCRYPT_ROUNDS).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return bcrypt.checkpw(plain.encode(), hashed.encode())
+    return _run_hashing(bcrypt.checkpw, plain.encode(), hashed.encode())
+
+
+async def hash_password_async(plain: str) -> str:
+    return (await _run_hashing_async(_bcrypt_hash, plain.encode(), settings.BCRYPT_ROUNDS)).decode()
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hashing_async(bcrypt.checkpw, plain.encode(), hashed.encode())
 
 
 def create_access_token(subject: str | int, expires_delta: timedelta | None = None) -> str:
@@ -22,9 +96,44 @@ def create_access_token(subject: str | int, expires_delta: timedelta | None = No
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
-def decode_token(token: str) -> str:
+def decode_token_claims(token: str) -> tuple[str, datetime]:
+    # Returns (sub, exp)
     payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     sub: str | None = payload.get("sub")
     if sub is None:
         raise JWTError("Token missing 'sub' claim")
-    return sub
+    if "exp" not in payload:
+        raise JWTError("Token missing 'exp' claim")
+    return sub, datetime.fromtimestamp(payload["exp"], timezone.utc)
+
+
+def decode_token(token: str) -> str:
+    return decode_token_claims(token)[0]
+
+
+# API keys look like "qak_<prefix>_<secret>". The prefix is stored in clear and
+# indexed; the full key is only stored as an HMAC-SHA256 keyed with SECRET_KEY,
+# which is cheap to check on every request (unlike bcrypt) but useless to anyone
+# holding a copy of the table without the secret.
+API_KEY_MARKER = "qak_"
+
+
+def hash_api_key(key: str) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), key.encode(), hashlib.sha256).hexdigest()
+
+
+def generate_api_key() -> tuple[str, str]:
+    # Returns (full key, prefix)
+    prefix = secrets.token_hex(6)
+    return f"{API_KEY_MARKER}{prefix}_{secrets.token_urlsafe(32)}", prefix
+
+
+def api_key_prefix(key: str) -> str | None:
+    if not key.startswith(API_KEY_MARKER):
+        return None
+    prefix, sep, _ = key[len(API_KEY_MARKER):].partition("_")
+    return prefix if sep else None
+
+
+def verify_api_key(key: str, key_hash: str) -> bool:
+    return hmac.compare_digest(hash_api_key(key), key_hash)
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.core.logging import request_id_var
+from app.core.metrics import current_route
+
+logger = logging.getLogger(__name__)
+
+_EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    params_shape: Any
+    route: str | None
+    request_id: str | None
+    plan: list[str]
+    max_ms: float
+    total_ms: float
+    count: int
+    last_seen: datetime
+
+
+def params_shape(parameters: Any, executemany: bool) -> Any:
+    # Parameter names and types only; values may be credentials or test output
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "each": params_shape(rows[0], False) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def _explain(connection, statement: str, parameters: Any) -> list[str]:
+    # Runs on a fresh DBAPI cursor so the explain itself doesn't re-enter the
+    # engine's cursor events. PostgreSQL wraps it in a savepoint: a failed
+    # EXPLAIN would otherwise abort the caller's transaction.
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        prefix, detail_column = "EXPLAIN QUERY PLAN ", 3
+    elif dialect == "postgresql":
+        prefix, detail_column = "EXPLAIN ", 0
+    else:
+        return []
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        if dialect == "postgresql":
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = [str(row[detail_column]) for row in cursor.fetchall()]
+        except Exception as exc:
+            if dialect == "postgresql":
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return [f"EXPLAIN failed: {exc}"]
+        if dialect == "postgresql":
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    # Times every statement on the engines it's installed on. Statements over the
+    # threshold are logged and folded into a top-N (by worst duration) keyed by
+    # SQL text, so the same slow query seen 1000 times is one entry.
+
+    def __init__(self, threshold_ms: float, top_n: int, explain: bool = True):
+        self.threshold_ms = threshold_ms
+        self.top_n = top_n
+        self.explain = explain
+        self._entries: dict[str, SlowQuery] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._slow_query_start = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        start = getattr(context, "_slow_query_start", None)
+        if start is None:
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        plan: list[str] = []
+        if self.explain and not executemany and statement.lstrip().lower().startswith(_EXPLAINABLE):
+            plan = _explain(conn, statement, parameters)
+        shape = params_shape(parameters, executemany)
+        route = current_route()
+        logger.warning(
+            "Slow query %.1fms [%s]: %s | params=%s | plan=%s",
+            elapsed_ms, route or "-", " ".join(statement.split()), shape, " / ".join(plan) or "-",
+        )
+        self.record(statement, shape, route, plan, elapsed_ms)
+
+    def record(self, statement: str, shape: Any, route: str | None, plan: list[str], elapsed_ms: float) -> None:
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            entry = self._entries.get(statement)
+            if entry is None:
+                entry = self._entries[statement] = SlowQuery(
+                    statement, shape, route, request_id_var.get(), plan, elapsed_ms, 0.0, 0, now,
+                )
+            elif elapsed_ms >= entry.max_ms:
+                # Keep the context of the worst occurrence
+                entry.params_shape, entry.route, entry.request_id = shape, route, request_id_var.get()
+                entry.plan, entry.max_ms = plan or entry.plan, elapsed_ms
+            entry.count += 1
+            entry.total_ms += elapsed_ms
+            entry.last_seen = now
+            if len(self._entries) > self.top_n:
+                fastest = min(self._entries.values(), key=lambda e: e.max_ms)
+                del self._entries[fastest.statement]
+
+    def top(self) -> list[SlowQuery]:
+        with self._lock:
+            return sorted(self._entries.values(), key=lambda e: e.max_ms, reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_MS,
+    top_n=settings.SLOW_QUERY_TOP_N,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+)
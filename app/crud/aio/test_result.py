@@ -0,0 +1,89 @@
+# AsyncSession counterparts of app/crud/test_result.py, used when ASYNC_DATABASE
+# is enabled. Statements are shared with the sync module so both paths write
+# the same rows and keep run counters in step the same way.
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.response_cache import invalidate_results
+from app.crud.test_case_stats import rebuild_case_stats, record_results
+from app.crud.test_result import (
+    invalid_result_refs,
+    result_counter_deltas,
+    result_ref_lookups,
+    results_insert,
+)
+from app.crud.test_run import run_counter_update
+from app.models.test_result import TestResult
+from app.schemas.test_result import TestResultCreate, TestResultUpdate
+
+
+async def get_result(db: AsyncSession, result_id: int) -> TestResult | None:
+    return await db.get(TestResult, result_id)
+
+
+async def get_results_by_run(
+    db: AsyncSession, run_id: int, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Row]:
+    query = select(*TestResult.__table__.columns).where(TestResult.run_id == run_id)
+    if after_id is not None:
+        query = query.where(TestResult.id > after_id)
+    result = await db.execute(query.order_by(TestResult.id).offset(skip).limit(limit))
+    return list(result)
+
+
+async def create_result(db: AsyncSession, result_in: TestResultCreate) -> TestResult:
+    result = TestResult(**result_in.model_dump())
+    db.add(result)
+    await db.execute(run_counter_update(result.run_id, result.status, 1, result.duration_ms or 0))
+    await db.run_sync(record_results, [(result.test_case_id, result.run_id, result.status)])
+    await db.commit()
+    invalidate_results([result.run_id], [result.test_case_id])
+    await db.refresh(result)
+    return result
+
+
+async def find_invalid_result_refs(db: AsyncSession, results_in: list[TestResultCreate]) -> dict[int, str]:
+    runs_query, cases_query = result_ref_lookups(results_in)
+    known_runs = set(await db.scalars(runs_query))
+    known_cases = set(await db.scalars(cases_query))
+    return invalid_result_refs(results_in, known_runs, known_cases)
+
+
+async def create_results_bulk(db: AsyncSession, results_in: list[TestResultCreate]) -> list[int]:
+    if not results_in:
+        return []
+    ids = (await db.scalars(*results_insert(results_in))).all()
+    for (run_id, status), (count, duration_ms) in result_counter_deltas(results_in).items():
+        await db.execute(run_counter_update(run_id, status, count, duration_ms))
+    await db.run_sync(record_results, [(r.test_case_id, r.run_id, r.status) for r in results_in])
+    await db.commit()
+    invalidate_results((r.run_id for r in results_in), (r.test_case_id for r in results_in))
+    return list(ids)
+
+
+async def update_result(
+    db: AsyncSession, result: TestResult, result_in: TestResultUpdate
+) -> TestResult:
+    old_status, old_duration = result.status, result.duration_ms or 0
+    for field, value in result_in.model_dump(exclude_unset=True).items():
+        setattr(result, field, value)
+    if (result.status, result.duration_ms or 0) != (old_status, old_duration):
+        await db.execute(run_counter_update(result.run_id, old_status, -1, -old_duration))
+        await db.execute(run_counter_update(result.run_id, result.status, 1, result.duration_ms or 0))
+    if result.status != old_status:
+        await db.run_sync(rebuild_case_stats, [result.test_case_id])
+    await db.commit()
+    invalidate_results([result.run_id], [result.test_case_id])
+    await db.refresh(result)
+    return result
+
+
+async def delete_result(db: AsyncSession, result_id: int) -> TestResult | None:
+    result = await db.get(TestResult, result_id)
+    if result:
+        await db.delete(result)
+        await db.execute(run_counter_update(result.run_id, result.status, -1, -(result.duration_ms or 0)))
+        await db.run_sync(rebuild_case_stats, [result.test_case_id])
+        await db.commit()
+        invalidate_results([result.run_id], [result.test_case_id])
+    return result
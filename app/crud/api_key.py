@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.principals import invalidate_api_key
+from app.core.security import generate_api_key, hash_api_key
+from app.models.api_key import ApiKey
+from app.schemas.api_key import ApiKeyCreate
+
+
+def get_api_key(db: Session, api_key_id: int) -> ApiKey | None:
+    return db.get(ApiKey, api_key_id)
+
+
+def get_api_key_by_prefix(db: Session, prefix: str) -> ApiKey | None:
+    return db.scalar(select(ApiKey).where(ApiKey.prefix == prefix))
+
+
+def get_api_keys_by_user(db: Session, user_id: int) -> list[ApiKey]:
+    return list(db.scalars(select(ApiKey).where(ApiKey.user_id == user_id).order_by(ApiKey.id)))
+
+
+def create_api_key(db: Session, key_in: ApiKeyCreate, user_id: int) -> tuple[ApiKey, str]:
+    # Returns the stored key and its plaintext, which is not recoverable later
+    plaintext, prefix = generate_api_key()
+    api_key = ApiKey(
+        name=key_in.name,
+        prefix=prefix,
+        key_hash=hash_api_key(plaintext),
+        scopes=",".join(sorted({scope.value for scope in key_in.scopes})),
+        user_id=user_id,
+    )
+    db.add(api_key)
+    db.commit()
+    db.refresh(api_key)
+    return api_key, plaintext
+
+
+def revoke_api_key(db: Session, api_key: ApiKey) -> ApiKey:
+    if api_key.revoked_at is None:
+        api_key.revoked_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(api_key)
+    invalidate_api_key(api_key.id)
+    return api_key
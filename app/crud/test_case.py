@@ -1,7 +1,23 @@
+import re
+from collections.abc import Collection
+
+from sqlalchemy import ColumnElement, Row, Select, delete, func, insert, literal_column, select, update
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import case_history_key, invalidate_results, response_cache, suite_report_key
+from app.crud.test_run import recount_runs
 from app.models.test_case import TestCase
-from app.schemas.test_case import TestCaseCreate, TestCaseUpdate
+from app.models.test_case_search import SEARCH_TABLE, postgresql_search, sqlite_search
+from app.models.test_case_stats import TestCaseStats
+from app.models.test_result import ResultStatus, TestResult
+from app.models.test_suite import TestSuite
+from app.schemas.test_case import (
+    TestCaseCreate,
+    TestCaseHistory,
+    TestCaseHistoryEntry,
+    TestCaseImportRow,
+    TestCaseUpdate,
+)
 
 
 def get_case(db: Session, case_id: int) -> TestCase | None:
@@ -9,29 +25,188 @@ def get_case(db: Session, case_id: int) -> TestCase | None:
 
 
 def get_cases_by_suite(
-    db: Session, suite_id: int, skip: int = 0, limit: int = 100
-) -> list[TestCase]:
-    return (
-        db.query(TestCase)
-        .filter(TestCase.suite_id == suite_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    db: Session, suite_id: int, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Row]:
+    # Plain column rows, not ORM instances: pages are read-only and go straight
+    # to JSON (see app/core/serialization.py), so the identity map is overhead
+    query = db.query(*TestCase.__table__.columns).filter(TestCase.suite_id == suite_id)
+    if after_id is not None:
+        query = query.filter(TestCase.id > after_id)
+    return query.order_by(TestCase.id).offset(skip).limit(limit).all()
+
+
+_SEARCHABLE = ("title", "description", "steps", "expected_result")
+_ENGLISH = literal_column("'english'::regconfig")
+
+
+def _search_document() -> ColumnElement:
+    # PostgreSQL: weighted so a hit in the title outranks one in the description,
+    # which outranks one in the steps or expected result
+    def weighted(text, weight: str):
+        # untyped literal: setweight() takes "char", which a bound VARCHAR doesn't cast to
+        return func.setweight(func.to_tsvector(_ENGLISH, func.coalesce(text, "")), literal_column(f"'{weight}'"))
+
+    return weighted(TestCase.title, "A").op("||")(weighted(TestCase.description, "B")).op("||")(
+        weighted(func.concat_ws(" ", TestCase.steps, TestCase.expected_result), "C")
     )
 
 
+def reindex_cases(db: Session, case_ids: Collection[int] | None = None) -> None:
+    # Rewrites the search rows of the given cases (or all) from test_cases.
+    # Does not commit: callers run it in the transaction that changed the cases.
+    unindex_cases(db, case_ids)
+    if db.get_bind().dialect.name == "postgresql":
+        source = select(TestCase.id, _search_document())
+        columns = ["test_case_id", "document"]
+        target = postgresql_search
+    else:
+        source = select(TestCase.id, *(func.coalesce(getattr(TestCase, name), "") for name in _SEARCHABLE))
+        columns = ["rowid", *_SEARCHABLE]
+        target = sqlite_search
+    if case_ids is not None:
+        source = source.where(TestCase.id.in_(case_ids))
+    db.execute(insert(target).from_select(columns, source))
+
+
+def unindex_cases(db: Session, case_ids: Collection[int] | None = None) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        stmt, key = delete(postgresql_search), postgresql_search.c.test_case_id
+    else:
+        stmt, key = delete(sqlite_search), sqlite_search.c.rowid
+    db.execute(stmt if case_ids is None else stmt.where(key.in_(case_ids)))
+
+
+def search_cases(
+    db: Session, owner_id: int, q: str, suite_id: int | None = None, skip: int = 0, limit: int = 100
+) -> list[Row]:
+    # Every word of q must match (stemmed, so "logins" finds "login"); best
+    # matches first. Words are quoted for FTS5, so operators in q are just text.
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return []
+    query = (
+        select(*TestCase.__table__.columns)
+        .join(TestSuite, TestSuite.id == TestCase.suite_id)
+        .where(TestSuite.owner_id == owner_id)
+    )
+    if suite_id is not None:
+        query = query.where(TestCase.suite_id == suite_id)
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = func.plainto_tsquery(_ENGLISH, " ".join(terms))
+        query = (
+            query.join(postgresql_search, postgresql_search.c.test_case_id == TestCase.id)
+            .where(postgresql_search.c.document.op("@@")(tsquery))
+            .order_by(func.ts_rank_cd(postgresql_search.c.document, tsquery).desc())
+        )
+    else:
+        fts = literal_column(SEARCH_TABLE)
+        query = (
+            query.join(sqlite_search, sqlite_search.c.rowid == TestCase.id)
+            .where(fts.op("MATCH")(" ".join(f'"{term}"' for term in terms)))
+            # bm25 is lower-is-better; weights per column, as for PostgreSQL
+            .order_by(func.bm25(fts, 10.0, 4.0, 1.0, 1.0))
+        )
+    return db.execute(query.order_by(TestCase.id).offset(skip).limit(limit)).all()
+
+
 def create_case(db: Session, case_in: TestCaseCreate) -> TestCase:
-    case = TestCase(**case_in.model_dump())
+    case = TestCase(**case_in.model_dump(), stats=TestCaseStats())
     db.add(case)
+    db.flush()
+    reindex_cases(db, [case.id])
     db.commit()
+    response_cache.invalidate(suite_report_key(case.suite_id))
     db.refresh(case)
     return case
 
 
+def get_case_ids_by_title(db: Session, suite_id: int, titles: set[str]) -> dict[str, int]:
+    # When a title is duplicated within the suite the oldest case wins
+    rows = db.execute(
+        select(TestCase.title, TestCase.id)
+        .where(TestCase.suite_id == suite_id, TestCase.title.in_(titles))
+        .order_by(TestCase.id.desc())
+    )
+    return dict(rows.all())
+
+
+def create_cases_bulk(db: Session, suite_id: int, titles: list[str]) -> dict[str, int]:
+    if not titles:
+        return {}
+    rows = db.execute(
+        insert(TestCase).returning(TestCase.title, TestCase.id),
+        [{"title": title, "suite_id": suite_id} for title in titles],
+    )
+    created = rows.all()
+    db.execute(insert(TestCaseStats), [{"test_case_id": case_id} for _, case_id in created])
+    reindex_cases(db, [case_id for _, case_id in created])
+    ids = dict(created)
+    db.commit()
+    response_cache.invalidate(suite_report_key(suite_id))
+    return ids
+
+
+def upsert_cases(db: Session, suite_id: int, rows: list[TestCaseImportRow]) -> tuple[int, int]:
+    # Suite import: cases are matched by title, new ones inserted and existing
+    # ones updated with just the fields each row sets, in one executemany each
+    # and one transaction. A title repeated in `rows` is applied in order.
+    # Returns (created, updated).
+    existing = get_case_ids_by_title(db, suite_id, {row.title for row in rows})
+    inserts: dict[str, dict] = {}
+    updates: dict[int, dict] = {}
+    for row in rows:
+        changes = row.model_dump(exclude_unset=True)
+        if row.title in existing:
+            updates.setdefault(existing[row.title], {"id": existing[row.title]}).update(changes)
+        elif row.title in inserts:
+            inserts[row.title].update(changes)
+        else:
+            inserts[row.title] = {**row.model_dump(), "suite_id": suite_id}
+
+    if updates:
+        db.execute(update(TestCase), list(updates.values()))
+    created = []
+    if inserts:
+        created = db.scalars(insert(TestCase).returning(TestCase.id), list(inserts.values())).all()
+        db.execute(insert(TestCaseStats), [{"test_case_id": case_id} for case_id in created])
+    # Titles are the match key, so an update only moves the index through the other fields
+    reindexed = set(_SEARCHABLE) - {"title"}
+    reindex = [*created, *(case_id for case_id, changes in updates.items() if changes.keys() & reindexed)]
+    if reindex:
+        reindex_cases(db, reindex)
+    db.commit()
+    response_cache.invalidate(suite_report_key(suite_id))
+    return len(created), len(updates)
+
+
+def suite_export_query(suite_id: int) -> Select:
+    # Every case of the suite in id order, in the columns an import reads back; for export_response()
+    return (
+        select(
+            TestCase.id,
+            TestCase.title,
+            TestCase.description,
+            TestCase.steps,
+            TestCase.expected_result,
+            TestCase.priority,
+            TestCase.severity,
+            TestCase.status,
+            TestCase.updated_at,
+        )
+        .where(TestCase.suite_id == suite_id)
+        .order_by(TestCase.id)
+    )
+
+
 def update_case(db: Session, case: TestCase, case_in: TestCaseUpdate) -> TestCase:
-    for field, value in case_in.model_dump(exclude_unset=True).items():
+    changes = case_in.model_dump(exclude_unset=True)
+    for field, value in changes.items():
         setattr(case, field, value)
+    if changes.keys() & set(_SEARCHABLE):
+        db.flush()
+        reindex_cases(db, [case.id])
     db.commit()
+    response_cache.invalidate(suite_report_key(case.suite_id))
     db.refresh(case)
     return case
 
@@ -39,6 +214,39 @@ def update_case(db: Session, case: TestCase, case_in: TestCaseUpdate) -> TestCas
 def delete_case(db: Session, case_id: int) -> TestCase | None:
     case = db.get(TestCase, case_id)
     if case:
+        # The case's results go with it (ORM cascade), so the runs they were
+        # counted in get their counters rebuilt in the same transaction
+        run_ids = set(db.scalars(select(TestResult.run_id).where(TestResult.test_case_id == case_id)))
         db.delete(case)
+        unindex_cases(db, [case_id])
+        if run_ids:
+            recount_runs(db, run_ids)
         db.commit()
+        response_cache.invalidate(suite_report_key(case.suite_id), case_history_key(case_id))
+        invalidate_results(run_ids)
     return case
+
+
+def case_history(db: Session, case_id: int, size: int) -> TestCaseHistory:
+    # Pass rate over every result of the case, plus the latest `size` results;
+    # both read off the (test_case_id, executed_at) index
+    total, passed = db.execute(
+        select(func.count(), func.count().filter(TestResult.status == ResultStatus.passed))
+        .where(TestResult.test_case_id == case_id)
+    ).one()
+    recent = db.execute(
+        select(TestResult.id, TestResult.run_id, TestResult.status, TestResult.duration_ms, TestResult.executed_at)
+        .where(TestResult.test_case_id == case_id)
+        .order_by(TestResult.executed_at.desc(), TestResult.id.desc())
+        .limit(size)
+    )
+    return TestCaseHistory(
+        case_id=case_id,
+        total=total,
+        passed=passed,
+        pass_rate=round(passed / total, 4) if total else 0.0,
+        recent=[
+            TestCaseHistoryEntry(result_id=id_, run_id=run_id, status=status, duration_ms=duration_ms, executed_at=executed_at)
+            for id_, run_id, status, duration_ms, executed_at in recent
+        ],
+    )
@@ -0,0 +1,199 @@
+import heapq
+from collections.abc import Collection, Iterable
+
+from sqlalchemy import Row, Select, bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.test_case import TestCase
+from app.models.test_case_stats import STATS_WINDOW, TestCaseStats
+from app.models.test_result import ResultStatus, TestResult
+from app.schemas.test_case import TestCaseStability
+
+STATUS_CODES = {
+    ResultStatus.passed: "P",
+    ResultStatus.failed: "F",
+    ResultStatus.error: "E",
+    ResultStatus.skipped: "S",
+    ResultStatus.blocked: "B",
+}
+FAILURE_STATUSES = (ResultStatus.failed, ResultStatus.error)
+# For flip counting: errors count as failures, skipped/blocked results are no outcome
+_OUTCOMES = str.maketrans({"E": "F", "S": None, "B": None})
+
+
+def append_recent(recent: str, status: ResultStatus) -> str:
+    return (recent + STATUS_CODES[status])[-STATS_WINDOW:]
+
+
+def stats_lookup(case_ids: Collection[int]) -> Select:
+    # Locks the rows (PostgreSQL) so concurrent batches append in turn; ordered
+    # so two batches always lock in the same order
+    return (
+        select(
+            TestCaseStats.test_case_id, TestCaseStats.total_count, TestCaseStats.failure_count,
+            TestCaseStats.recent, TestCaseStats.last_run_id,
+        )
+        .where(TestCaseStats.test_case_id.in_(case_ids))
+        .order_by(TestCaseStats.test_case_id)
+        .with_for_update()
+    )
+
+
+# executemany over stats_appends() rows; Core rather than an ORM bulk update,
+# which costs twice as much on this hot path
+_stats = TestCaseStats.__table__
+stats_update = (
+    update(_stats)
+    .where(_stats.c.test_case_id == bindparam("case_id"))
+    .values(
+        total_count=bindparam("total"), failure_count=bindparam("failures"),
+        recent=bindparam("window"), last_run_id=bindparam("last_run"),
+    )
+)
+
+
+def stats_appends(
+    rows: Iterable[Row], results: Iterable[tuple[int, int, ResultStatus]]
+) -> tuple[list[dict], set[int]]:
+    # New values for the stats rows after applying (case id, run id, status)
+    # results in order, and the cases that need rebuild_case_stats() instead.
+    # Results are always the newest of their case (executed_at is set on
+    # insert): one in the case's latest run replaces that run's code, one in a
+    # newer run appends. One in an older run belongs mid-window.
+    stats = {
+        case_id: {"case_id": case_id, "total": total, "failures": failures, "window": recent, "last_run": last_run}
+        for case_id, total, failures, recent, last_run in rows
+    }
+    rebuild = set()
+    for case_id, run_id, status in results:
+        row = stats.get(case_id)
+        if row is None:
+            # No stats row (case inserted outside the API): left to rebuild-case-stats
+            continue
+        row["total"] += 1
+        row["failures"] += status in FAILURE_STATUSES
+        if row["last_run"] is None or run_id > row["last_run"]:
+            row["window"] = append_recent(row["window"], status)
+            row["last_run"] = run_id
+        elif run_id == row["last_run"]:
+            row["window"] = row["window"][:-1] + STATUS_CODES[status]
+        else:
+            rebuild.add(case_id)
+    return [row for case_id, row in stats.items() if case_id not in rebuild], rebuild
+
+
+def record_results(db: Session, results: list[tuple[int, int, ResultStatus]]) -> None:
+    # Takes (case id, run id, status) per result. Does not commit: callers run
+    # it in the same transaction as the result insert it accounts for.
+    if not results:
+        return
+    rows = db.execute(stats_lookup({case_id for case_id, _, _ in results}))
+    changes, rebuild = stats_appends(rows, results)
+    if changes:
+        db.execute(stats_update, changes)
+    if rebuild:
+        rebuild_case_stats(db, rebuild)
+
+
+def rebuild_case_stats(db: Session, case_ids: Collection[int] | None = None) -> int:
+    # Recomputes the stats of the given cases (or all) from test_results, for
+    # result edits and deletes, which can change any point of the window.
+    # Does not commit. Returns the number of cases rebuilt.
+    db.flush()  # sessions don't autoflush; the caller's pending result changes must be visible
+    cases = select(TestCase.id)
+    results = select(TestResult.test_case_id)
+    if case_ids is not None:
+        cases = cases.where(TestCase.id.in_(case_ids))
+        results = results.where(TestResult.test_case_id.in_(case_ids))
+
+    stats = {
+        case_id: {"test_case_id": case_id, "total_count": 0, "failure_count": 0, "recent": "", "last_run_id": None}
+        for case_id in db.scalars(cases)
+    }
+    counts = db.execute(
+        results.add_columns(func.count(), func.count().filter(TestResult.status.in_(FAILURE_STATUSES)))
+        .group_by(TestResult.test_case_id)
+    )
+    for case_id, total, failures in counts:
+        if case_id in stats:
+            stats[case_id].update(total_count=total, failure_count=failures)
+
+    # The latest result of each (case, run), then each case's last
+    # STATS_WINDOW runs, so retries within a run take one slot
+    per_run = results.add_columns(
+        TestResult.run_id,
+        TestResult.status,
+        func.row_number().over(
+            partition_by=(TestResult.test_case_id, TestResult.run_id),
+            order_by=(TestResult.executed_at.desc(), TestResult.id.desc()),
+        ).label("latest"),
+    ).subquery()
+    ranked = (
+        select(
+            per_run.c.test_case_id,
+            per_run.c.run_id,
+            per_run.c.status,
+            func.row_number().over(
+                partition_by=per_run.c.test_case_id, order_by=per_run.c.run_id.desc()
+            ).label("age"),
+        )
+        .where(per_run.c.latest == 1)
+        .subquery()
+    )
+    latest = db.execute(
+        select(ranked.c.test_case_id, ranked.c.run_id, ranked.c.status)
+        .where(ranked.c.age <= STATS_WINDOW)
+        .order_by(ranked.c.test_case_id, ranked.c.age.desc())
+    )
+    for case_id, run_id, status in latest:
+        if case_id in stats:
+            stats[case_id]["recent"] += STATUS_CODES[status]
+            stats[case_id]["last_run_id"] = run_id
+
+    if case_ids is None:
+        db.execute(delete(TestCaseStats))
+    else:
+        db.execute(delete(TestCaseStats).where(TestCaseStats.test_case_id.in_(case_ids)))
+    if stats:
+        db.execute(insert(TestCaseStats), list(stats.values()))
+    return len(stats)
+
+
+def window_stability(recent: str, window: int) -> tuple[str, float, int]:
+    # (window, failure rate, pass↔fail flips) over the latest `window` runs
+    recent = recent[-window:]
+    outcomes = recent.translate(_OUTCOMES)
+    failure_rate = round(outcomes.count("F") / len(outcomes), 4) if outcomes else 0.0
+    # str.count runs in C; "PF" and "FP" occurrences can't overlap each other
+    flips = outcomes.count("PF") + outcomes.count("FP")
+    return recent, failure_rate, flips
+
+
+def suite_stability(
+    db: Session, suite_id: int, window: int, min_flips: int = 0, limit: int = 100
+) -> list[TestCaseStability]:
+    # Every case of the suite with its stats row (a covering index scan plus a
+    # primary key lookup each), most flips first: flaky tests flip, broken ones
+    # just fail. Titles are only fetched for the cases that make the cut.
+    rows = db.execute(
+        select(TestCase.id, TestCaseStats.total_count, TestCaseStats.failure_count, TestCaseStats.recent)
+        .outerjoin(TestCaseStats, TestCaseStats.test_case_id == TestCase.id)
+        .where(TestCase.suite_id == suite_id)
+    )
+    ranked = []
+    for case_id, total, failures, recent in rows:
+        recent, failure_rate, flips = window_stability(recent or "", window)
+        if flips >= min_flips:
+            ranked.append((flips, failure_rate, case_id, total or 0, failures or 0, recent))
+    ranked = heapq.nsmallest(limit, ranked, key=lambda row: (-row[0], -row[1], row[2]))
+
+    titles = dict(db.execute(
+        select(TestCase.id, TestCase.title).where(TestCase.id.in_([row[2] for row in ranked]))
+    ).all())
+    return [
+        TestCaseStability(
+            case_id=case_id, title=titles[case_id], total=total, failures=failures,
+            window_size=len(recent), failure_rate=failure_rate, flips=flips, recent=recent,
+        )
+        for flips, failure_rate, case_id, total, failures, recent in ranked
+    ]
@@ -1,7 +1,14 @@
+from sqlalchemy import Insert, Row, Select, case, func, insert, select
 from sqlalchemy.orm import Session
 
-from app.models.test_result import TestResult
+from app.core.response_cache import invalidate_results
+from app.crud.test_case_stats import rebuild_case_stats, record_results
+from app.crud.test_run import bump_run_counters
+from app.models.test_case import TestCase
+from app.models.test_result import ResultStatus, TestResult
+from app.models.test_run import TestRun
 from app.schemas.test_result import TestResultCreate, TestResultUpdate
+from app.schemas.test_run import TestRunSummary
 
 
 def get_result(db: Session, result_id: int) -> TestResult | None:
@@ -9,31 +16,158 @@ def get_result(db: Session, result_id: int) -> TestResult | None:
 
 
 def get_results_by_run(
-    db: Session, run_id: int, skip: int = 0, limit: int = 100
-) -> list[TestResult]:
+    db: Session, run_id: int, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Row]:
+    # Plain column rows, not ORM instances: pages are read-only and go straight
+    # to JSON (see app/core/serialization.py), so the identity map is overhead
+    query = db.query(*TestResult.__table__.columns).filter(TestResult.run_id == run_id)
+    if after_id is not None:
+        query = query.filter(TestResult.id > after_id)
+    return query.order_by(TestResult.id).offset(skip).limit(limit).all()
+
+
+def run_export_query(run_id: int) -> Select:
+    # Every result of the run with its case title, in id order; for export_response()
     return (
-        db.query(TestResult)
-        .filter(TestResult.run_id == run_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+        select(
+            TestResult.id,
+            TestResult.test_case_id,
+            TestCase.title.label("test_case_title"),
+            TestResult.status,
+            TestResult.duration_ms,
+            TestResult.executed_at,
+            TestResult.notes,
+        )
+        .join(TestCase, TestCase.id == TestResult.test_case_id)
+        .where(TestResult.run_id == run_id)
+        .order_by(TestResult.id)
+    )
+
+
+def _nearest_rank(timed, percent: int):
+    # ceil(timed * percent / 100) in integer arithmetic, portable across SQLite and PostgreSQL
+    return (timed * percent + 99) // 100
+
+
+def summarize_run(db: Session, run: TestRun) -> TestRunSummary:
+    # Counts and total duration come straight from the run's counters; only the
+    # duration percentiles need test_results, in a single windowed query over
+    # the run's timed results
+    ranked = (
+        select(
+            TestResult.duration_ms,
+            func.row_number().over(order_by=TestResult.duration_ms).label("rank"),
+            func.count().over().label("timed"),
+        )
+        .where(TestResult.run_id == run.id, TestResult.duration_ms.is_not(None))
+        .subquery()
+    )
+    p50, p95 = db.execute(
+        select(
+            func.max(case((ranked.c.rank == _nearest_rank(ranked.c.timed, 50), ranked.c.duration_ms))),
+            func.max(case((ranked.c.rank == _nearest_rank(ranked.c.timed, 95), ranked.c.duration_ms))),
+        )
+    ).one()
+
+    return TestRunSummary(
+        run_id=run.id,
+        total=run.total_count,
+        passed=run.passed_count,
+        failed=run.failed_count,
+        skipped=run.skipped_count,
+        blocked=run.blocked_count,
+        error=run.error_count,
+        pass_rate=round(run.passed_count / run.total_count, 4) if run.total_count else 0.0,
+        total_duration_ms=run.total_duration_ms,
+        p50_duration_ms=p50,
+        p95_duration_ms=p95,
     )
 
 
 def create_result(db: Session, result_in: TestResultCreate) -> TestResult:
     result = TestResult(**result_in.model_dump())
     db.add(result)
+    bump_run_counters(db, result.run_id, result.status, 1, result.duration_ms or 0)
+    record_results(db, [(result.test_case_id, result.run_id, result.status)])
     db.commit()
+    invalidate_results([result.run_id], [result.test_case_id])
     db.refresh(result)
     return result
 
 
+def result_ref_lookups(results_in: list[TestResultCreate]) -> tuple[Select, Select]:
+    # Two IN lookups for the whole batch instead of two gets per item
+    run_ids = {r.run_id for r in results_in}
+    case_ids = {r.test_case_id for r in results_in}
+    return (
+        select(TestRun.id).where(TestRun.id.in_(run_ids)),
+        select(TestCase.id).where(TestCase.id.in_(case_ids)),
+    )
+
+
+def invalid_result_refs(
+    results_in: list[TestResultCreate], known_runs: set[int], known_cases: set[int]
+) -> dict[int, str]:
+    errors: dict[int, str] = {}
+    for index, result_in in enumerate(results_in):
+        if result_in.run_id not in known_runs:
+            errors[index] = f"Test run {result_in.run_id} not found"
+        elif result_in.test_case_id not in known_cases:
+            errors[index] = f"Test case {result_in.test_case_id} not found"
+    return errors
+
+
+def find_invalid_result_refs(db: Session, results_in: list[TestResultCreate]) -> dict[int, str]:
+    runs_query, cases_query = result_ref_lookups(results_in)
+    return invalid_result_refs(results_in, set(db.scalars(runs_query)), set(db.scalars(cases_query)))
+
+
+def result_counter_deltas(
+    results_in: list[TestResultCreate],
+) -> dict[tuple[int, ResultStatus], tuple[int, int]]:
+    # (run_id, status) → (count, summed duration), so a batch costs one counter
+    # UPDATE per distinct pair rather than one per row
+    deltas: dict[tuple[int, ResultStatus], tuple[int, int]] = {}
+    for result_in in results_in:
+        count, duration_ms = deltas.get((result_in.run_id, result_in.status), (0, 0))
+        deltas[result_in.run_id, result_in.status] = (count + 1, duration_ms + (result_in.duration_ms or 0))
+    return deltas
+
+
+def results_insert(results_in: list[TestResultCreate]) -> tuple[Insert, list[dict]]:
+    # Multi-row INSERT ... RETURNING id; ids come back in the order of results_in
+    return (
+        insert(TestResult).returning(TestResult.id, sort_by_parameter_order=True),
+        [result_in.model_dump() for result_in in results_in],
+    )
+
+
+def create_results_bulk(db: Session, results_in: list[TestResultCreate]) -> list[int]:
+    # The whole batch is one INSERT plus its counter updates in a single commit
+    if not results_in:
+        return []
+    ids = db.scalars(*results_insert(results_in)).all()
+    for (run_id, status), (count, duration_ms) in result_counter_deltas(results_in).items():
+        bump_run_counters(db, run_id, status, count, duration_ms)
+    record_results(db, [(r.test_case_id, r.run_id, r.status) for r in results_in])
+    db.commit()
+    invalidate_results((r.run_id for r in results_in), (r.test_case_id for r in results_in))
+    return list(ids)
+
+
 def update_result(
     db: Session, result: TestResult, result_in: TestResultUpdate
 ) -> TestResult:
+    old_status, old_duration = result.status, result.duration_ms or 0
     for field, value in result_in.model_dump(exclude_unset=True).items():
         setattr(result, field, value)
+    if (result.status, result.duration_ms or 0) != (old_status, old_duration):
+        bump_run_counters(db, result.run_id, old_status, -1, -old_duration)
+        bump_run_counters(db, result.run_id, result.status, 1, result.duration_ms or 0)
+    if result.status != old_status:
+        rebuild_case_stats(db, [result.test_case_id])
     db.commit()
+    invalidate_results([result.run_id], [result.test_case_id])
     db.refresh(result)
     return result
 
@@ -42,5 +176,8 @@ def delete_result(db: Session, result_id: int) -> TestResult | None:
     result = db.get(TestResult, result_id)
     if result:
         db.delete(result)
+        bump_run_counters(db, result.run_id, result.status, -1, -(result.duration_ms or 0))
+        rebuild_case_stats(db, [result.test_case_id])
         db.commit()
+        invalidate_results([result.run_id], [result.test_case_id])
     return result
@@ -1,5 +1,11 @@
+from collections.abc import Collection
+
+from sqlalchemy import Row, Update, func, select, update
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import invalidate_results, response_cache, suite_report_key
+from app.crud.test_case_stats import rebuild_case_stats
+from app.models.test_result import ResultStatus, TestResult
 from app.models.test_run import TestRun
 from app.schemas.test_run import TestRunCreate, TestRunUpdate
 
@@ -8,14 +14,23 @@ def get_run(db: Session, run_id: int) -> TestRun | None:
     return db.get(TestRun, run_id)
 
 
-def get_runs(db: Session, skip: int = 0, limit: int = 100) -> list[TestRun]:
-    return db.query(TestRun).offset(skip).limit(limit).all()
+def get_runs(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Row]:
+    # Plain column rows, not ORM instances: pages are read-only and go straight
+    # to JSON (see app/core/serialization.py), so the identity map is overhead
+    query = db.query(*TestRun.__table__.columns)
+    if after_id is not None:
+        query = query.filter(TestRun.id > after_id)
+    return query.order_by(TestRun.id).offset(skip).limit(limit).all()
 
 
 def create_run(db: Session, run_in: TestRunCreate) -> TestRun:
     run = TestRun(**run_in.model_dump())
     db.add(run)
     db.commit()
+    if run.suite_id is not None:
+        response_cache.invalidate(suite_report_key(run.suite_id))
     db.refresh(run)
     return run
 
@@ -24,6 +39,8 @@ def update_run(db: Session, run: TestRun, run_in: TestRunUpdate) -> TestRun:
     for field, value in run_in.model_dump(exclude_unset=True).items():
         setattr(run, field, value)
     db.commit()
+    if run.suite_id is not None:
+        response_cache.invalidate(suite_report_key(run.suite_id))
     db.refresh(run)
     return run
 
@@ -31,6 +48,73 @@ def update_run(db: Session, run: TestRun, run_in: TestRunUpdate) -> TestRun:
 def delete_run(db: Session, run_id: int) -> TestRun | None:
     run = db.get(TestRun, run_id)
     if run:
+        # The run's results go with it, and with them a point in each case's history
+        case_ids = set(db.scalars(select(TestResult.test_case_id).where(TestResult.run_id == run_id)))
+        suite_id = run.suite_id
         db.delete(run)
+        rebuild_case_stats(db, case_ids)
         db.commit()
+        invalidate_results([run_id], case_ids)
+        if suite_id is not None:
+            response_cache.invalidate(suite_report_key(suite_id))
     return run
+
+
+def run_counter_update(run_id: int, status: ResultStatus, count: int, duration_ms: int) -> Update:
+    # Adds `count` results of `status` (negative to remove) and `duration_ms` to the
+    # run's counters as an atomic UPDATE ... SET x = x + n
+    status_count = getattr(TestRun, f"{status.value}_count")
+    return (
+        update(TestRun)
+        .where(TestRun.id == run_id)
+        .values({
+            status_count: status_count + count,
+            TestRun.total_count: TestRun.total_count + count,
+            TestRun.total_duration_ms: TestRun.total_duration_ms + duration_ms,
+        })
+    )
+
+
+def bump_run_counters(
+    db: Session, run_id: int, status: ResultStatus, count: int, duration_ms: int
+) -> None:
+    # Does not commit: callers run it in the same transaction as the result
+    # write it accounts for
+    db.execute(run_counter_update(run_id, status, count, duration_ms))
+
+
+def recount_runs(db: Session, run_ids: Collection[int] | None = None) -> int:
+    # Rebuilds the counters from test_results (all runs, or just run_ids) and
+    # returns how many runs were updated. Does not commit: deletes run it in
+    # the transaction that removed the results.
+    db.flush()
+
+    def results(*criteria):
+        return (
+            select(func.count())
+            .where(TestResult.run_id == TestRun.id, *criteria)
+            .scalar_subquery()
+        )
+
+    stmt = update(TestRun).values(
+        **{f"{status.value}_count": results(TestResult.status == status) for status in ResultStatus},
+        total_count=results(),
+        total_duration_ms=(
+            select(func.coalesce(func.sum(TestResult.duration_ms), 0))
+            .where(TestResult.run_id == TestRun.id)
+            .scalar_subquery()
+        ),
+    )
+    if run_ids is not None:
+        stmt = stmt.where(TestRun.id.in_(run_ids))
+    return db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+
+
+def recount_run_counters(db: Session, run_ids: Collection[int] | None = None) -> int:
+    updated = recount_runs(db, run_ids)
+    db.commit()
+    if run_ids is None:
+        response_cache.clear()
+    else:
+        invalidate_results(run_ids)
+    return updated
@@ -1,7 +1,14 @@
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import case_history_key, invalidate_results, response_cache, suite_report_key
+from app.crud.test_case import unindex_cases
+from app.crud.test_run import recount_runs
+from app.models.test_case import TestCase
+from app.models.test_result import TestResult
+from app.models.test_run import TestRun
 from app.models.test_suite import TestSuite
-from app.schemas.test_suite import TestSuiteCreate, TestSuiteUpdate
+from app.schemas.test_suite import TestSuiteCreate, TestSuiteReport, TestSuiteUpdate
 
 
 def get_suite(db: Session, suite_id: int) -> TestSuite | None:
@@ -9,15 +16,14 @@ def get_suite(db: Session, suite_id: int) -> TestSuite | None:
 
 
 def get_suites_by_owner(
-    db: Session, owner_id: int, skip: int = 0, limit: int = 100
-) -> list[TestSuite]:
-    return (
-        db.query(TestSuite)
-        .filter(TestSuite.owner_id == owner_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    db: Session, owner_id: int, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Row]:
+    # Plain column rows, not ORM instances: pages are read-only and go straight
+    # to JSON (see app/core/serialization.py), so the identity map is overhead
+    query = db.query(*TestSuite.__table__.columns).filter(TestSuite.owner_id == owner_id)
+    if after_id is not None:
+        query = query.filter(TestSuite.id > after_id)
+    return query.order_by(TestSuite.id).offset(skip).limit(limit).all()
 
 
 def create_suite(db: Session, suite_in: TestSuiteCreate, owner_id: int) -> TestSuite:
@@ -39,6 +45,35 @@ def update_suite(db: Session, suite: TestSuite, suite_in: TestSuiteUpdate) -> Te
 def delete_suite(db: Session, suite_id: int) -> TestSuite | None:
     suite = db.get(TestSuite, suite_id)
     if suite:
+        # Cascades to the suite's cases and their results; see delete_case
+        run_ids = set(db.scalars(
+            select(TestResult.run_id)
+            .join(TestCase, TestCase.id == TestResult.test_case_id)
+            .where(TestCase.suite_id == suite_id)
+        ))
+        case_ids = set(db.scalars(select(TestCase.id).where(TestCase.suite_id == suite_id)))
         db.delete(suite)
+        unindex_cases(db, case_ids)
+        if run_ids:
+            recount_runs(db, run_ids)
         db.commit()
+        response_cache.invalidate(suite_report_key(suite_id), *map(case_history_key, case_ids))
+        invalidate_results(run_ids)
     return suite
+
+
+def suite_report(db: Session, suite_id: int) -> TestSuiteReport:
+    def counts(column, *criteria) -> dict[str, int]:
+        rows = db.execute(select(column, func.count()).where(*criteria).group_by(column))
+        return {value.value: count for value, count in rows}
+
+    cases_by_status = counts(TestCase.status, TestCase.suite_id == suite_id)
+    runs_by_status = counts(TestRun.status, TestRun.suite_id == suite_id)
+    return TestSuiteReport(
+        suite_id=suite_id,
+        total_cases=sum(cases_by_status.values()),
+        cases_by_status=cases_by_status,
+        cases_by_priority=counts(TestCase.priority, TestCase.suite_id == suite_id),
+        total_runs=sum(runs_by_status.values()),
+        runs_by_status=runs_by_status,
+    )
@@ -1,18 +1,32 @@
 from sqlalchemy.orm import Session
 
-from app.core.security import hash_password, verify_password
+from app.core.principals import invalidate_user
+from app.core.security import hash_password
 from app.models.user import User
 from app.schemas.user import UserCreate
 
 
+def get_user(db: Session, user_id: int) -> User | None:
+    return db.get(User, user_id)
+
+
 def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
 
 
-def create_user(db: Session, user_in: UserCreate) -> User:
+def get_credentials(db: Session, email: str) -> tuple[int, str] | None:
+    # (id, password hash) of the user. The transaction is ended so the
+    # session's connection goes back to the pool while bcrypt runs.
+    user = get_user_by_email(db, email)
+    credentials = (user.id, user.hashed_password) if user else None
+    db.rollback()
+    return credentials
+
+
+def create_user(db: Session, user_in: UserCreate, hashed_password: str | None = None) -> User:
     user = User(
         email=user_in.email,
-        hashed_password=hash_password(user_in.password),
+        hashed_password=hashed_password or hash_password(user_in.password),
     )
     db.add(user)
     db.commit()
@@ -20,8 +34,10 @@ def create_user(db: Session, user_in: UserCreate) -> User:
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User | None:
-    user = get_user_by_email(db, email)
-    if user and verify_password(password, user.hashed_password):
-        return user
-    return None
+def deactivate_user(db: Session, user: User) -> User:
+    user.is_active = False
+    db.commit()
+    db.refresh(user)
+    # Tokens already issued to this user stop working on their next request
+    invalidate_user(user.id)
+    return user
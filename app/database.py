@@ -1,15 +1,120 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
+from app.core import metrics
+from app.core.slow_queries import slow_query_log
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-)
+# Sync driver → async driver used when ASYNC_DATABASE_URL isn't set explicitly
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}; set ASYNC_DATABASE_URL")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+class _TimedCheckout:
+    # Records how long each checkout waited for a free connection (including
+    # opening a new one); a growing tail means DB_POOL_SIZE is too small
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str) -> dict:
+    # create_engine()/create_async_engine() keyword arguments for the given URL
+    parsed = make_url(url)
+    pool = {
+        "poolclass": TimedAsyncQueuePool if parsed.get_dialect().is_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    if parsed.get_backend_name() != "sqlite":
+        return {**pool, "pool_recycle": settings.DB_POOL_RECYCLE, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+
+    options: dict = {}
+    if parsed.get_driver_name() == "pysqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if parsed.database not in (None, "", ":memory:"):
+        options.update(pool)
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.close()
+
+
+def configure_engine(engine: Engine) -> Engine:
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    event.listen(engine, "before_cursor_execute", metrics.count_statement)
+    if settings.SLOW_QUERY_MS > 0:
+        slow_query_log.install(engine)
+    return engine
+
+
+def _pool_metrics() -> list[str]:
+    lines = []
+    for name, help_text in (
+        ("db_pool_checked_out", "Connections currently checked out of the pool."),
+        ("db_pool_idle", "Idle connections held by the pool."),
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for label, bound in (("sync", engine), ("async", async_engine)):
+            pool = bound.pool if bound is not None else None
+            if isinstance(pool, QueuePool):
+                value = pool.checkedout() if name == "db_pool_checked_out" else pool.checkedin()
+                lines.append(f'{name}{{engine="{label}"}} {value}')
+    return lines
+
+
+engine = configure_engine(create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL)))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Only built when enabled, so the async drivers stay optional
+async_engine = None
+if settings.ASYNC_DATABASE:
+    _async_url = settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+    async_engine = create_async_engine(_async_url, **engine_options(_async_url))
+    configure_engine(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+metrics.register_collector(_pool_metrics)
+
 
 class Base(DeclarativeBase):
     pass
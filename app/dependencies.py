@@ -1,16 +1,25 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from datetime import datetime, timezone
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_token
-from app.database import SessionLocal
+from app.core.principals import Principal, is_admin, principal_cache
+from app.core.profiling import start_sampling
+from app.core.security import api_key_prefix, decode_token_claims, verify_api_key
+from app.crud.api_key import get_api_key_by_prefix
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.api_key import ApiKey, ApiKeyScope
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+_READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -20,21 +29,101 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _token_claims(token: str) -> tuple[int, float]:
+    # (user id, seconds until the token expires)
     try:
-        user_id = decode_token(token)
-    except JWTError:
-        raise credentials_exception
+        sub, expires_at = decode_token_claims(token)
+        return int(sub), (expires_at - datetime.now(timezone.utc)).total_seconds()
+    except (JWTError, ValueError):
+        raise _credentials_exception()
 
-    user = db.get(User, int(user_id))
+
+def _principal(user: User | None, api_key: ApiKey | None = None) -> Principal:
     if user is None or not user.is_active:
-        raise credentials_exception
+        raise _credentials_exception()
+    # Cache a detached copy: the session-bound instance is expired by the
+    # route's own commits and can't be read once its session closes
+    snapshot = User(id=user.id, email=user.email, is_active=user.is_active, created_at=user.created_at)
+    if api_key is None:
+        return Principal(snapshot)
+    return Principal(snapshot, frozenset(api_key.scopes.split(",")), api_key.id)
+
+
+def _check_api_key(token: str, api_key: ApiKey | None) -> ApiKey:
+    if api_key is None or api_key.revoked_at is not None or not verify_api_key(token, api_key.key_hash):
+        raise _credentials_exception()
+    return api_key
+
+
+def _authorize(request: Request, principal: Principal) -> User:
+    # API keys are limited to their scopes: `read` for safe methods, `write` otherwise
+    if principal.scopes is not None:
+        needed = ApiKeyScope.read if request.method in _READ_METHODS else ApiKeyScope.write
+        if needed.value not in principal.scopes:
+            raise HTTPException(status_code=403, detail=f"API key lacks the '{needed.value}' scope")
+    request.state.principal = principal
+    start_sampling(request)
+    return principal.user
+
+
+def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    # Accepts either a JWT from /auth/login or an API key ("qak_...")
+    principal = principal_cache.get(token)
+    if principal is None:
+        if (prefix := api_key_prefix(token)) is not None:
+            api_key = _check_api_key(token, get_api_key_by_prefix(db, prefix))
+            principal, ttl = _principal(db.get(User, api_key.user_id), api_key), None
+        else:
+            user_id, ttl = _token_claims(token)
+            principal = _principal(db.get(User, user_id))
+        principal_cache.set(token, principal, ttl=ttl)
+    return _authorize(request, principal)
+
+
+async def get_current_user_async(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    principal = principal_cache.get(token)
+    if principal is None:
+        if (prefix := api_key_prefix(token)) is not None:
+            stored = await db.scalar(select(ApiKey).where(ApiKey.prefix == prefix))
+            api_key = _check_api_key(token, stored)
+            principal, ttl = _principal(await db.get(User, api_key.user_id), api_key), None
+        else:
+            user_id, ttl = _token_claims(token)
+            principal = _principal(await db.get(User, user_id))
+        principal_cache.set(token, principal, ttl=ttl)
+    return _authorize(request, principal)
+
+
+def get_current_login_user(request: Request, user: User = Depends(get_current_user)) -> User:
+    # For routes that must not be reachable with an API key (e.g. minting more keys)
+    if request.state.principal.api_key_id is not None:
+        raise HTTPException(status_code=403, detail="This endpoint requires a user login, not an API key")
+    return user
+
+
+def get_current_admin(request: Request, user: User = Depends(get_current_login_user)) -> User:
+    # Diagnostics endpoints; admins are listed by email in ADMIN_EMAILS
+    if not is_admin(request.state.principal):
+        raise HTTPException(status_code=403, detail="Admin access required")
     return user
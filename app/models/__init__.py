@@ -2,5 +2,8 @@
 from app.models.user import User          # noqa: F401
 from app.models.test_suite import TestSuite   # noqa: F401
 from app.models.test_case import TestCase     # noqa: F401
+from app.models.test_case_search import SEARCH_TABLE  # noqa: F401
+from app.models.test_case_stats import TestCaseStats  # noqa: F401
 from app.models.test_run import TestRun       # noqa: F401
 from app.models.test_result import TestResult # noqa: F401
+from app.models.api_key import ApiKey         # noqa: F401
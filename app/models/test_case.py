@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -30,6 +30,10 @@ class CaseStatus(str, enum.Enum):
 
 class TestCase(Base):
     __tablename__ = "test_cases"
+    __table_args__ = (
+        Index("ix_test_cases_suite_id_id", "suite_id", "id"),
+        Index("ix_test_cases_suite_id_title", "suite_id", "title"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -53,3 +57,4 @@ class TestCase(Base):
     results: Mapped[list["TestResult"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="test_case", cascade="all, delete-orphan"
     )
+    stats: Mapped["TestCaseStats | None"] = relationship(cascade="all, delete-orphan")  # type: ignore[name-defined]  # noqa: F821
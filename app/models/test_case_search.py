@@ -0,0 +1,42 @@
+from sqlalchemy import DDL, column, event, table
+
+from app.models.test_case import TestCase
+
+# Full-text index over test case text, one row per case, kept in step by
+# app/crud/test_case.py. It isn't an ORM model: SQLite gets an FTS5 virtual
+# table (rowid = case id), PostgreSQL a tsvector column with a GIN index.
+# Created and dropped alongside test_cases, so create_all() and the migrations
+# both produce it.
+SEARCH_TABLE = "test_case_search"
+
+_SQLITE_CREATE = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "title, description, steps, expected_result, tokenize = 'porter unicode61')"
+)
+_POSTGRESQL_CREATE = (
+    f"CREATE TABLE {SEARCH_TABLE} ("
+    "test_case_id INTEGER PRIMARY KEY REFERENCES test_cases (id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)"
+)
+_POSTGRESQL_INDEX = f"CREATE INDEX ix_{SEARCH_TABLE}_document ON {SEARCH_TABLE} USING gin (document)"
+
+CREATE_STATEMENTS = {
+    "sqlite": [_SQLITE_CREATE],
+    "postgresql": [_POSTGRESQL_CREATE, _POSTGRESQL_INDEX],
+}
+
+# Lightweight handles for the CRUD queries
+sqlite_search = table(SEARCH_TABLE, column("rowid"), column("title"), column("description"),
+                      column("steps"), column("expected_result"))
+postgresql_search = table(SEARCH_TABLE, column("test_case_id"), column("document"))
+
+for _dialect, _statements in CREATE_STATEMENTS.items():
+    for _statement in _statements:
+        event.listen(TestCase.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(TestCase.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}"))
+
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    # For Alembic's autogenerate/compare_metadata: the search table (and FTS5's
+    # shadow tables) are managed here, not by Base.metadata
+    return not (type_ == "table" and name is not None and name.startswith(SEARCH_TABLE))
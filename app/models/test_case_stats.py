@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+# How many of a case's latest runs `recent` covers; the stability endpoint's
+# sliding window can be at most this long
+STATS_WINDOW = 50
+
+
+class TestCaseStats(Base):
+    # One row per test case, kept in step by app/crud/test_case_stats.py so the
+    # flaky-test analytics never have to scan test_results.
+    # `python -m app.cli rebuild-case-stats` rebuilds it from test_results.
+    __tablename__ = "test_case_stats"
+
+    test_case_id: Mapped[int] = mapped_column(ForeignKey("test_cases.id"), primary_key=True)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    failure_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)  # failed + error
+    # Status of the latest result in each of the case's last STATS_WINDOW runs,
+    # oldest run first: P(assed) F(ailed) E(rror) S(kipped) B(locked)
+    recent: Mapped[str] = mapped_column(String(STATS_WINDOW), default="", server_default="", nullable=False)
+    # The run behind the last code of `recent`; a retry in that run replaces it
+    last_run_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
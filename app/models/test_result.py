@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -17,6 +17,11 @@ class ResultStatus(str, enum.Enum):
 
 class TestResult(Base):
     __tablename__ = "test_results"
+    __table_args__ = (
+        Index("ix_test_results_run_id_id", "run_id", "id"),
+        Index("ix_test_results_run_id_status", "run_id", "status"),
+        Index("ix_test_results_test_case_id_executed_at", "test_case_id", "executed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     status: Mapped[ResultStatus] = mapped_column(Enum(ResultStatus), nullable=False)
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -16,6 +16,7 @@ class RunStatus(str, enum.Enum):
 
 class TestRun(Base):
     __tablename__ = "test_runs"
+    __table_args__ = (Index("ix_test_runs_suite_id_id", "suite_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -27,6 +28,17 @@ class TestRun(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
+    # Denormalized result counters, kept in step by app/crud/test_result.py.
+    # `python -m app.cli recount-runs` rebuilds them from test_results.
+    passed_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    failed_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    skipped_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    blocked_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    error_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    total_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    # Summed over a run's results, so it outgrows int4 (~24.8 days) on PostgreSQL
+    total_duration_ms: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
+
     suite: Mapped["TestSuite | None"] = relationship(back_populates="test_runs")  # type: ignore[name-defined]  # noqa: F821
     results: Mapped[list["TestResult"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="run", cascade="all, delete-orphan"
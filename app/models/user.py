@@ -20,3 +20,6 @@ class User(Base):
     test_suites: Mapped[list["TestSuite"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         back_populates="owner", cascade="all, delete-orphan"
     )
+    api_keys: Mapped[list["ApiKey"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
+        back_populates="user", cascade="all, delete-orphan"
+    )
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.core.profiling import Profile, get_profile, get_profiles
+from app.core.slow_queries import slow_query_log
+from app.crud.user import deactivate_user, get_user
+from app.dependencies import get_current_admin, get_db
+from app.schemas.admin import ProfileRead, ProfileSummary, SlowQueryRead
+from app.schemas.user import UserRead
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(get_current_admin)])
+
+
+@router.get("/slow-queries", response_model=list[SlowQueryRead])
+def list_slow_queries():
+    return slow_query_log.top()
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries():
+    slow_query_log.clear()
+
+
+def _profile_or_404(profile_id: str) -> Profile:
+    profile = get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+def list_profiles():
+    return get_profiles()
+
+
+@router.get("/profiles/{profile_id}", response_model=ProfileRead)
+def read_profile(profile_id: str):
+    profile = _profile_or_404(profile_id)
+    return ProfileRead(
+        **ProfileSummary.model_validate(profile).model_dump(),
+        top_functions=profile.top_functions(),
+    )
+
+
+@router.get("/profiles/{profile_id}/collapsed", response_class=PlainTextResponse)
+def read_profile_collapsed(profile_id: str):
+    # Folded stacks for flamegraph.pl / speedscope
+    return _profile_or_404(profile_id).collapsed()
+
+
+@router.post("/users/{user_id}/deactivate", response_model=UserRead)
+def deactivate_user_route(user_id: int, db: Session = Depends(get_db)):
+    user = get_user(db, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return deactivate_user(db, user)
@@ -0,0 +1,121 @@
+# Async twin of app/routers/test_results.py, mounted instead of it when
+# ASYNC_DATABASE is enabled. Handlers await an AsyncSession rather than holding
+# a threadpool worker, so concurrent CI reporters are limited by the database,
+# not by the number of threads.
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import cursor_after_id
+from app.core.serialization import list_page_response
+from app.crud.aio.test_result import (
+    create_result,
+    create_results_bulk,
+    delete_result,
+    find_invalid_result_refs,
+    get_result,
+    get_results_by_run,
+    update_result,
+)
+from app.dependencies import get_async_db, get_current_user_async
+from app.models.user import User
+from app.routers.test_results import (
+    BULK_BODY_OPENAPI,
+    IngestOutcome,
+    bulk_response,
+    ingest_ndjson,
+    read_bulk_items,
+    validate_bulk_items,
+)
+from app.schemas.test_result import (
+    TestResultBulkResponse,
+    TestResultCreate,
+    TestResultRead,
+    TestResultStreamResponse,
+    TestResultUpdate,
+)
+
+router = APIRouter(prefix="/test-results", tags=["Test Results"])
+
+
+async def _ingest(db: AsyncSession, results_in: list[TestResultCreate]) -> IngestOutcome:
+    errors = await find_invalid_result_refs(db, results_in)
+    valid = [i for i in range(len(results_in)) if i not in errors]
+    ids = dict(zip(valid, await create_results_bulk(db, [results_in[i] for i in valid])))
+    return ids, errors
+
+
+@router.get("/", response_model=list[TestResultRead])
+async def list_results(
+    run_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = Depends(cursor_after_id),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    results = await get_results_by_run(db, run_id=run_id, skip=skip, limit=limit, after_id=after_id)
+    return list_page_response(TestResultRead, results, limit)
+
+
+@router.post("/", response_model=TestResultRead, status_code=status.HTTP_201_CREATED)
+async def create_result_route(
+    result_in: TestResultCreate,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    return await create_result(db, result_in=result_in)
+
+
+@router.post("/bulk", response_model=TestResultBulkResponse, openapi_extra=BULK_BODY_OPENAPI)
+async def create_results_bulk_route(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    items = await read_bulk_items(request)
+    results_in, positions, invalid = validate_bulk_items(items)
+    return bulk_response(len(items), positions, invalid, await _ingest(db, results_in))
+
+
+@router.post("/stream", response_model=TestResultStreamResponse)
+async def stream_results_route(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    return await ingest_ndjson(request, lambda batch: _ingest(db, batch))
+
+
+@router.get("/{result_id}", response_model=TestResultRead)
+async def get_result_route(
+    result_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    result = await get_result(db, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Test result not found")
+    return result
+
+
+@router.patch("/{result_id}", response_model=TestResultRead)
+async def update_result_route(
+    result_id: int,
+    result_in: TestResultUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    result = await get_result(db, result_id)
+    if not result:
+        raise HTTPException(status_code=404, detail="Test result not found")
+    return await update_result(db, result=result, result_in=result_in)
+
+
+@router.delete("/{result_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_result_route(
+    result_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
+):
+    if not await delete_result(db, result_id=result_id):
+        raise HTTPException(status_code=404, detail="Test result not found")
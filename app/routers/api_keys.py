@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.crud.api_key import create_api_key, get_api_key, get_api_keys_by_user, revoke_api_key
+from app.dependencies import get_current_login_user, get_db
+from app.models.user import User
+from app.schemas.api_key import ApiKeyCreate, ApiKeyCreated, ApiKeyRead
+
+router = APIRouter(prefix="/api-keys", tags=["API Keys"])
+
+
+@router.get("/", response_model=list[ApiKeyRead])
+def list_api_keys(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_login_user),
+):
+    return get_api_keys_by_user(db, current_user.id)
+
+
+@router.post("/", response_model=ApiKeyCreated, status_code=status.HTTP_201_CREATED)
+def create_api_key_route(
+    key_in: ApiKeyCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_login_user),
+):
+    api_key, plaintext = create_api_key(db, key_in=key_in, user_id=current_user.id)
+    return ApiKeyCreated(**ApiKeyRead.model_validate(api_key).model_dump(), key=plaintext)
+
+
+@router.delete("/{api_key_id}", status_code=status.HTTP_204_NO_CONTENT)
+def revoke_api_key_route(
+    api_key_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_login_user),
+):
+    api_key = get_api_key(db, api_key_id)
+    if not api_key or api_key.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="API key not found")
+    revoke_api_key(db, api_key)
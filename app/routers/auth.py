@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.security import create_access_token
-from app.crud.user import authenticate_user, create_user, get_user_by_email
+from app.core.security import create_access_token, hash_password_async, verify_password_async
+from app.crud.user import create_user, get_credentials
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
 from app.schemas.auth import Token
@@ -12,24 +13,27 @@ from app.schemas.user import UserCreate, UserRead
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
+# register/login are async so a request waiting on bcrypt holds neither a
+# threadpool thread nor a DB connection; their DB calls run on the threadpool
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register(user_in: UserCreate, db: Session = Depends(get_db)):
-    if get_user_by_email(db, user_in.email):
+async def register(user_in: UserCreate, db: Session = Depends(get_db)):
+    if await run_in_threadpool(get_credentials, db, user_in.email):
         raise HTTPException(status_code=400, detail="Email already registered")
-    return create_user(db, user_in=user_in)
+    hashed = await hash_password_async(user_in.password)
+    return await run_in_threadpool(create_user, db, user_in, hashed)
 
 
 @router.post("/login", response_model=Token)
-def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     # OAuth2PasswordRequestForm sends username/password as form data (spec requirement)
-    user = authenticate_user(db, email=form.username, password=form.password)
-    if not user:
+    credentials = await run_in_threadpool(get_credentials, db, form.username)
+    if not credentials or not await verify_password_async(form.password, credentials[1]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return Token(access_token=create_access_token(user.id))
+    return Token(access_token=create_access_token(credentials[0]))
 
 
 @router.get("/me", response_model=UserRead)
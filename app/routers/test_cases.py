@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.crud.test_case import create_case, delete_case, get_case, get_cases_by_suite, update_case
+from app.config import settings
+from app.core.etag import ETAG_HEADER, check_if_match, conditional, entity_etag
+from app.core.pagination import cursor_after_id
+from app.core.response_cache import case_history_key, response_cache
+from app.core.serialization import list_page_response
+from app.crud.test_case import (
+    case_history,
+    create_case,
+    delete_case,
+    get_case,
+    get_cases_by_suite,
+    search_cases,
+    update_case,
+)
 from app.crud.test_suite import get_suite
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
-from app.schemas.test_case import TestCaseCreate, TestCaseRead, TestCaseUpdate
+from app.schemas.test_case import TestCaseCreate, TestCaseHistory, TestCaseRead, TestCaseUpdate
 
 router = APIRouter(prefix="/test-cases", tags=["Test Cases"])
 
@@ -20,13 +33,16 @@ def _assert_suite_access(db: Session, suite_id: int, user: User):
 @router.get("/", response_model=list[TestCaseRead])
 def list_cases(
     suite_id: int,
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = Depends(cursor_after_id),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     _assert_suite_access(db, suite_id, current_user)
-    return get_cases_by_suite(db, suite_id=suite_id, skip=skip, limit=limit)
+    cases = get_cases_by_suite(db, suite_id=suite_id, skip=skip, limit=limit, after_id=after_id)
+    return list_page_response(TestCaseRead, cases, limit, request)
 
 
 @router.post("/", response_model=TestCaseRead, status_code=status.HTTP_201_CREATED)
@@ -39,9 +55,27 @@ def create_case_route(
     return create_case(db, case_in=case_in)
 
 
+@router.get("/search", response_model=list[TestCaseRead])
+def search_cases_route(
+    q: str = Query(min_length=1, max_length=200),
+    suite_id: int | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Full-text search over title, description, steps and expected result in
+    # the caller's suites, best match first. Ranked, so pages go by `skip`.
+    if suite_id is not None:
+        _assert_suite_access(db, suite_id, current_user)
+    return search_cases(db, owner_id=current_user.id, q=q, suite_id=suite_id, skip=skip, limit=limit)
+
+
 @router.get("/{case_id}", response_model=TestCaseRead)
 def get_case_route(
     case_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -49,13 +83,30 @@ def get_case_route(
     if not case:
         raise HTTPException(status_code=404, detail="Test case not found")
     _assert_suite_access(db, case.suite_id, current_user)
-    return case
+    return conditional(request, response, entity_etag(case)) or case
+
+
+@router.get("/{case_id}/history", response_model=TestCaseHistory)
+def get_case_history_route(
+    case_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    case = get_case(db, case_id)
+    if not case:
+        raise HTTPException(status_code=404, detail="Test case not found")
+    _assert_suite_access(db, case.suite_id, current_user)
+    return response_cache.get_or_compute(
+        case_history_key(case_id), TestCaseHistory, lambda: case_history(db, case_id, settings.CASE_HISTORY_SIZE)
+    )
 
 
 @router.patch("/{case_id}", response_model=TestCaseRead)
 def update_case_route(
     case_id: int,
     case_in: TestCaseUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -63,7 +114,10 @@ def update_case_route(
     if not case:
         raise HTTPException(status_code=404, detail="Test case not found")
     _assert_suite_access(db, case.suite_id, current_user)
-    return update_case(db, case=case, case_in=case_in)
+    check_if_match(request, entity_etag(case))
+    case = update_case(db, case=case, case_in=case_in)
+    response.headers[ETAG_HEADER] = entity_etag(case)
+    return case
 
 
 @router.delete("/{case_id}", status_code=status.HTTP_204_NO_CONTENT)
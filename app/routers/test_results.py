@@ -1,23 +1,175 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from collections.abc import Awaitable, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.crud.test_result import create_result, delete_result, get_result, get_results_by_run, update_result
+from app.config import settings
+from app.core.ndjson import iter_ndjson_lines
+from app.core.pagination import cursor_after_id
+from app.core.serialization import list_page_response
+from app.crud.test_result import (
+    create_result,
+    create_results_bulk,
+    delete_result,
+    find_invalid_result_refs,
+    get_result,
+    get_results_by_run,
+    update_result,
+)
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
-from app.schemas.test_result import TestResultCreate, TestResultRead, TestResultUpdate
+from app.schemas.test_result import (
+    TestResultBulkItem,
+    TestResultBulkResponse,
+    TestResultCreate,
+    TestResultRead,
+    TestResultStreamError,
+    TestResultStreamResponse,
+    TestResultUpdate,
+)
 
 router = APIRouter(prefix="/test-results", tags=["Test Results"])
 
+# (index → new id, index → error) for one batch
+IngestOutcome = tuple[dict[int, int], dict[int, str]]
+
+# The bulk body is read by hand (see read_bulk_items), so document it explicitly
+BULK_BODY_OPENAPI = {"requestBody": {"required": True, "content": {"application/json": {"schema": {
+    "type": "array", "items": {"$ref": "#/components/schemas/TestResultCreate"},
+}}}}}
+
+
+def _ingest(db: Session, results_in: list[TestResultCreate]) -> IngestOutcome:
+    errors = find_invalid_result_refs(db, results_in)
+    valid = [i for i in range(len(results_in)) if i not in errors]
+    ids = dict(zip(valid, create_results_bulk(db, [results_in[i] for i in valid])))
+    return ids, errors
+
+
+def validation_message(exc: ValidationError) -> str:
+    err = exc.errors()[0]
+    field = " → ".join(str(loc) for loc in err["loc"])
+    return f"{field}: {err['msg']}" if field else err["msg"]
+
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
+async def read_bulk_items(request: Request) -> list:
+    # The raw JSON array of a bulk upload. The body size (Content-Length, then
+    # the bytes actually read) and the item count are checked before any item
+    # is validated, so an oversized batch is turned away cheaply.
+    too_big = f"Batch exceeds the limit of {settings.BULK_RESULTS_MAX_BYTES} bytes"
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > settings.BULK_RESULTS_MAX_BYTES:
+        raise _too_large(too_big)
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.BULK_RESULTS_MAX_BYTES:
+            raise _too_large(too_big)
+    try:
+        items = json.loads(body)
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=422, detail="Expected a JSON array of results")
+    if len(items) > settings.BULK_RESULTS_MAX_ITEMS:
+        raise _too_large(f"Batch exceeds the limit of {settings.BULK_RESULTS_MAX_ITEMS} results")
+    return items
+
+
+def validate_bulk_items(items: list) -> tuple[list[TestResultCreate], list[int], dict[int, str]]:
+    # (valid results, their indexes in `items`, index → error for the rest)
+    results_in, positions, errors = [], [], {}
+    for index, item in enumerate(items):
+        try:
+            results_in.append(TestResultCreate.model_validate(item))
+        except ValidationError as exc:
+            errors[index] = validation_message(exc)
+            continue
+        positions.append(index)
+    return results_in, positions, errors
+
+
+def bulk_response(
+    size: int, positions: list[int], invalid: dict[int, str], outcome: IngestOutcome
+) -> TestResultBulkResponse:
+    # `outcome` is indexed by position among the valid items; map it back
+    ids = {positions[i]: id_ for i, id_ in outcome[0].items()}
+    errors = {**invalid, **{positions[i]: error for i, error in outcome[1].items()}}
+    items = [TestResultBulkItem(index=i, id=ids.get(i), error=errors.get(i)) for i in range(size)]
+    return TestResultBulkResponse(created=len(ids), failed=len(errors), items=items)
+
+
+async def ingest_ndjson(
+    request: Request, ingest: Callable[[list[TestResultCreate]], Awaitable[IngestOutcome]]
+) -> TestResultStreamResponse:
+    # Reads application/x-ndjson (one TestResultCreate per line) straight off the
+    # socket and hands every INGEST_CHUNK_SIZE valid lines to `ingest`, so memory
+    # stays flat regardless of upload size
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != "application/x-ndjson":
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected Content-Type: application/x-ndjson",
+        )
+
+    report = TestResultStreamResponse(accepted=0, rejected=0, errors=[])
+
+    def reject(line_no: int, error: str) -> None:
+        report.rejected += 1
+        if len(report.errors) < settings.INGEST_MAX_REPORTED_ERRORS:
+            report.errors.append(TestResultStreamError(line=line_no, error=error))
+
+    async def flush(batch: list[TestResultCreate], line_nos: list[int]) -> None:
+        ids, errors = await ingest(batch)
+        report.accepted += len(ids)
+        for index, error in errors.items():
+            reject(line_nos[index], error)
+        batch.clear()
+        line_nos.clear()
+
+    batch: list[TestResultCreate] = []
+    line_nos: list[int] = []
+    line_no = 0
+    async for line in iter_ndjson_lines(request.stream(), settings.NDJSON_MAX_LINE_BYTES):
+        line_no += 1
+        if line is None:
+            reject(line_no, f"Line exceeds {settings.NDJSON_MAX_LINE_BYTES} bytes")
+            continue
+        if not line.strip():
+            continue
+        try:
+            batch.append(TestResultCreate.model_validate_json(line))
+        except ValidationError as exc:
+            reject(line_no, validation_message(exc))
+            continue
+        line_nos.append(line_no)
+        if len(batch) >= settings.INGEST_CHUNK_SIZE:
+            await flush(batch, line_nos)
+
+    if batch:
+        await flush(batch, line_nos)
+    report.errors.sort(key=lambda e: e.line)
+    return report
+
 
 @router.get("/", response_model=list[TestResultRead])
 def list_results(
     run_id: int,
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = Depends(cursor_after_id),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
-    return get_results_by_run(db, run_id=run_id, skip=skip, limit=limit)
+    results = get_results_by_run(db, run_id=run_id, skip=skip, limit=limit, after_id=after_id)
+    return list_page_response(TestResultRead, results, limit)
 
 
 @router.post("/", response_model=TestResultRead, status_code=status.HTTP_201_CREATED)
@@ -29,6 +181,33 @@ def create_result_route(
     return create_result(db, result_in=result_in)
 
 
+@router.post("/bulk", response_model=TestResultBulkResponse, openapi_extra=BULK_BODY_OPENAPI)
+async def create_results_bulk_route(
+    request: Request,
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    # Body: a JSON array of TestResultCreate. Items that fail validation or
+    # reference a missing run or case are reported back by index; everything
+    # else is inserted in a single transaction.
+    items = await read_bulk_items(request)
+
+    def ingest() -> TestResultBulkResponse:
+        results_in, positions, invalid = validate_bulk_items(items)
+        return bulk_response(len(items), positions, invalid, _ingest(db, results_in))
+
+    return await run_in_threadpool(ingest)
+
+
+@router.post("/stream", response_model=TestResultStreamResponse)
+async def stream_results_route(
+    request: Request,
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    return await ingest_ndjson(request, lambda batch: run_in_threadpool(_ingest, db, batch))
+
+
 @router.get("/{result_id}", response_model=TestResultRead)
 def get_result_route(
     result_id: int,
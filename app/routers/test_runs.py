@@ -1,22 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from itertools import islice
+from xml.etree.ElementTree import ParseError
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, UploadFile, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.etag import ETAG_HEADER, check_if_match, conditional, row_etag
+from app.core.export import ExportFormat, export_response
+from app.core.junit import JUnitCase, iter_junit_cases
+from app.core.pagination import cursor_after_id
+from app.core.response_cache import response_cache, run_summary_key
+from app.core.serialization import list_page_response
+from app.crud.test_case import create_cases_bulk, get_case_ids_by_title
+from app.crud.test_result import create_results_bulk, run_export_query, summarize_run
 from app.crud.test_run import create_run, delete_run, get_run, get_runs, update_run
+from app.crud.test_suite import get_suite
 from app.dependencies import get_current_user, get_db
 from app.models.user import User
-from app.schemas.test_run import TestRunCreate, TestRunRead, TestRunUpdate
+from app.schemas.test_result import TestResultCreate
+from app.schemas.test_run import (
+    JUnitImportResponse,
+    TestRunCreate,
+    TestRunRead,
+    TestRunSummary,
+    TestRunUpdate,
+)
 
 router = APIRouter(prefix="/test-runs", tags=["Test Runs"])
 
 
 @router.get("/", response_model=list[TestRunRead])
 def list_runs(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = Depends(cursor_after_id),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
-    return get_runs(db, skip=skip, limit=limit)
+    runs = get_runs(db, skip=skip, limit=limit, after_id=after_id)
+    return list_page_response(TestRunRead, runs, limit, request)
 
 
 @router.post("/", response_model=TestRunRead, status_code=status.HTTP_201_CREATED)
@@ -31,26 +54,60 @@ def create_run_route(
 @router.get("/{run_id}", response_model=TestRunRead)
 def get_run_route(
     run_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
     run = get_run(db, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Test run not found")
-    return run
+    return conditional(request, response, row_etag(run)) or run
+
+
+@router.get("/{run_id}/summary", response_model=TestRunSummary)
+def get_run_summary_route(
+    run_id: int,
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    run = get_run(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Test run not found")
+    return response_cache.get_or_compute(run_summary_key(run_id), TestRunSummary, lambda: summarize_run(db, run))
+
+
+@router.get("/{run_id}/export")
+def export_run_route(
+    run_id: int,
+    request: Request,
+    format: ExportFormat = ExportFormat.csv,
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    # All results of the run with their case titles, streamed as CSV or NDJSON
+    # (gzip-encoded if the client accepts it), in constant memory
+    if not get_run(db, run_id):
+        raise HTTPException(status_code=404, detail="Test run not found")
+    return export_response(request, db, run_export_query(run_id), format, f"run-{run_id}-results")
 
 
 @router.patch("/{run_id}", response_model=TestRunRead)
 def update_run_route(
     run_id: int,
     run_in: TestRunUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ):
     run = get_run(db, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Test run not found")
-    return update_run(db, run=run, run_in=run_in)
+    check_if_match(request, row_etag(run))
+    run = update_run(db, run=run, run_in=run_in)
+    response.headers[ETAG_HEADER] = row_etag(run)
+    return run
 
 
 @router.delete("/{run_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -61,3 +118,66 @@ def delete_run_route(
 ):
     if not delete_run(db, run_id=run_id):
         raise HTTPException(status_code=404, detail="Test run not found")
+
+
+@router.post("/{run_id}/junit", response_model=JUnitImportResponse)
+def import_junit_route(
+    run_id: int,
+    file: UploadFile,
+    create_missing: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # <testcase name="..."> is matched to a TestCase with the same title in the
+    # run's suite. The report is parsed incrementally and written in chunks of
+    # INGEST_CHUNK_SIZE results; a parse error stops the import, but chunks
+    # already written are kept.
+    run = get_run(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Test run not found")
+    if run.suite_id is None:
+        raise HTTPException(status_code=400, detail="Test run has no suite to match test cases against")
+    suite = get_suite(db, run.suite_id)
+    if not suite or suite.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+
+    report = JUnitImportResponse(imported=0, created_cases=0, unmatched=0, unmatched_titles=[], unnamed=0)
+
+    def import_chunk(chunk: list[JUnitCase]) -> None:
+        named = [case for case in chunk if case.title]
+        report.unnamed += len(chunk) - len(named)
+        chunk = named
+        titles = {case.title[:255] for case in chunk}
+        case_ids = get_case_ids_by_title(db, run.suite_id, titles)
+        missing = [title for title in titles if title not in case_ids]
+        if create_missing:
+            case_ids |= create_cases_bulk(db, run.suite_id, missing)
+            report.created_cases += len(missing)
+
+        results_in = []
+        for case in chunk:
+            case_id = case_ids.get(case.title[:255])
+            if case_id is None:
+                report.unmatched += 1
+                if len(report.unmatched_titles) < settings.INGEST_MAX_REPORTED_ERRORS:
+                    report.unmatched_titles.append(case.title)
+                continue
+            results_in.append(TestResultCreate(
+                run_id=run_id,
+                test_case_id=case_id,
+                status=case.status,
+                notes=case.message,
+                duration_ms=case.duration_ms,
+            ))
+        report.imported += len(create_results_bulk(db, results_in))
+
+    try:
+        cases = iter_junit_cases(file.file)
+        while chunk := list(islice(cases, settings.INGEST_CHUNK_SIZE)):
+            import_chunk(chunk)
+    except ParseError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Malformed JUnit XML ({exc}); {report.imported} results were imported before the error",
+        )
+    return report
@@ -1,22 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
-from app.crud.test_suite import create_suite, delete_suite, get_suite, get_suites_by_owner, update_suite
+from app.config import settings
+from app.core.csv_records import iter_csv_records
+from app.core.etag import ETAG_HEADER, check_if_match, conditional, entity_etag
+from app.core.export import ExportFormat, MEDIA_TYPES, export_response
+from app.core.ndjson import iter_ndjson_lines
+from app.core.pagination import cursor_after_id
+from app.core.response_cache import response_cache, suite_report_key
+from app.core.serialization import list_page_response
+from app.crud.test_case import suite_export_query, upsert_cases
+from app.crud.test_case_stats import suite_stability
+from app.crud.test_suite import (
+    create_suite,
+    delete_suite,
+    get_suite,
+    get_suites_by_owner,
+    suite_report,
+    update_suite,
+)
 from app.dependencies import get_current_user, get_db
+from app.models.test_case_stats import STATS_WINDOW
 from app.models.user import User
-from app.schemas.test_suite import TestSuiteCreate, TestSuiteRead, TestSuiteUpdate
+from app.schemas.test_case import (
+    TestCaseImportError,
+    TestCaseImportResponse,
+    TestCaseImportRow,
+    TestCaseStability,
+)
+from app.schemas.test_suite import TestSuiteCreate, TestSuiteRead, TestSuiteReport, TestSuiteUpdate
 
 router = APIRouter(prefix="/test-suites", tags=["Test Suites"])
 
 
 @router.get("/", response_model=list[TestSuiteRead])
 def list_suites(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = Depends(cursor_after_id),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    return get_suites_by_owner(db, owner_id=current_user.id, skip=skip, limit=limit)
+    suites = get_suites_by_owner(db, owner_id=current_user.id, skip=skip, limit=limit, after_id=after_id)
+    return list_page_response(TestSuiteRead, suites, limit, request)
 
 
 @router.post("/", response_model=TestSuiteRead, status_code=status.HTTP_201_CREATED)
@@ -31,26 +62,164 @@ def create_suite_route(
 @router.get("/{suite_id}", response_model=TestSuiteRead)
 def get_suite_route(
     suite_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     suite = get_suite(db, suite_id)
     if not suite or suite.owner_id != current_user.id:
         raise HTTPException(status_code=404, detail="Test suite not found")
-    return suite
+    return conditional(request, response, entity_etag(suite)) or suite
+
+
+@router.get("/{suite_id}/report", response_model=TestSuiteReport)
+def get_suite_report_route(
+    suite_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    suite = get_suite(db, suite_id)
+    if not suite or suite.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    return response_cache.get_or_compute(suite_report_key(suite_id), TestSuiteReport, lambda: suite_report(db, suite_id))
+
+
+@router.get("/{suite_id}/stability", response_model=list[TestCaseStability])
+def get_suite_stability_route(
+    suite_id: int,
+    window: int = Query(20, ge=2, le=STATS_WINDOW),
+    min_flips: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Flaky-test report: each case's failure rate and pass↔fail flips over its
+    # latest `window` runs, most flips first. Reads one stats row per case.
+    suite = get_suite(db, suite_id)
+    if not suite or suite.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    return suite_stability(db, suite_id, window=window, min_flips=min_flips, limit=limit)
+
+
+def _validated(raw: bytes | dict) -> TestCaseImportRow | str:
+    try:
+        if isinstance(raw, bytes):
+            return TestCaseImportRow.model_validate_json(raw)
+        return TestCaseImportRow.model_validate(raw)
+    except ValidationError as exc:
+        err = exc.errors()[0]
+        field = " → ".join(str(loc) for loc in err["loc"])
+        return f"{field}: {err['msg']}" if field else err["msg"]
+
+
+async def _import_rows(
+    request: Request, export_format: ExportFormat
+) -> AsyncIterator[tuple[int, TestCaseImportRow | str]]:
+    # (line number, validated row or error) for each record of the body, read
+    # straight off the socket. CSV needs a header row with at least `title`;
+    # empty cells count as unset.
+    lines = iter_ndjson_lines(request.stream(), settings.NDJSON_MAX_LINE_BYTES)
+    if export_format == ExportFormat.ndjson:
+        line_no = 0
+        async for line in lines:
+            line_no += 1
+            if line is None:
+                yield line_no, f"Line exceeds {settings.NDJSON_MAX_LINE_BYTES} bytes"
+            elif line.strip():
+                yield line_no, _validated(line)
+        return
+
+    header = None
+    async for line_no, fields in iter_csv_records(lines, settings.NDJSON_MAX_LINE_BYTES):
+        if fields is None:
+            yield line_no, f"Record exceeds {settings.NDJSON_MAX_LINE_BYTES} bytes or is not UTF-8"
+        elif not any(fields):
+            continue
+        elif header is None:
+            header = [name.strip().lower() for name in fields]
+            if "title" not in header:
+                raise HTTPException(status_code=400, detail="CSV header has no title column")
+        else:
+            yield line_no, _validated({name: value for name, value in zip(header, fields) if value != ""})
+
+
+@router.post("/{suite_id}/cases/import", response_model=TestCaseImportResponse)
+async def import_cases_route(
+    suite_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Bulk create/update of the suite's cases from text/csv or
+    # application/x-ndjson, matched by title. Valid rows are written every
+    # INGEST_CHUNK_SIZE lines, one transaction per chunk; invalid ones are
+    # reported by line and skipped.
+    suite = await run_in_threadpool(get_suite, db, suite_id)
+    if not suite or suite.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    formats = {MEDIA_TYPES[fmt].split(";")[0]: fmt for fmt in ExportFormat}
+    if content_type not in formats:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected Content-Type: text/csv or application/x-ndjson",
+        )
+
+    report = TestCaseImportResponse(created=0, updated=0, rejected=0, errors=[])
+    batch: list[TestCaseImportRow] = []
+
+    async def flush() -> None:
+        created, updated = await run_in_threadpool(upsert_cases, db, suite_id, batch)
+        report.created += created
+        report.updated += updated
+        batch.clear()
+
+    async for line_no, row in _import_rows(request, formats[content_type]):
+        if isinstance(row, str):
+            report.rejected += 1
+            if len(report.errors) < settings.INGEST_MAX_REPORTED_ERRORS:
+                report.errors.append(TestCaseImportError(line=line_no, error=row))
+            continue
+        batch.append(row)
+        if len(batch) >= settings.INGEST_CHUNK_SIZE:
+            await flush()
+    if batch:
+        await flush()
+    return report
+
+
+@router.get("/{suite_id}/cases/export")
+def export_cases_route(
+    suite_id: int,
+    request: Request,
+    format: ExportFormat = ExportFormat.csv,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Every case of the suite, streamed in the format the import reads back
+    suite = get_suite(db, suite_id)
+    if not suite or suite.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Test suite not found")
+    return export_response(request, db, suite_export_query(suite_id), format, f"suite-{suite_id}-cases")
 
 
 @router.patch("/{suite_id}", response_model=TestSuiteRead)
 def update_suite_route(
     suite_id: int,
     suite_in: TestSuiteUpdate,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     suite = get_suite(db, suite_id)
     if not suite or suite.owner_id != current_user.id:
         raise HTTPException(status_code=404, detail="Test suite not found")
-    return update_suite(db, suite=suite, suite_in=suite_in)
+    check_if_match(request, entity_etag(suite))
+    suite = update_suite(db, suite=suite, suite_in=suite_in)
+    response.headers[ETAG_HEADER] = entity_etag(suite)
+    return suite
 
 
 @router.delete("/{suite_id}", status_code=status.HTTP_204_NO_CONTENT)
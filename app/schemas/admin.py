@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class SlowQueryRead(BaseModel):
+    statement: str
+    params_shape: Any
+    route: str | None
+    request_id: str | None
+    plan: list[str]
+    max_ms: float
+    total_ms: float
+    count: int
+    last_seen: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    method: str
+    path: str
+    request_id: str | None
+    status_code: int
+    duration_ms: float
+    samples: int
+    interval_ms: float
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ProfileFunction(BaseModel):
+    function: str
+    file: str
+    line: int
+    self: int
+    total: int
+
+
+class ProfileRead(ProfileSummary):
+    top_functions: list[ProfileFunction]
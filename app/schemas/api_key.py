@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.api_key import ApiKeyScope
+
+
+class ApiKeyCreate(BaseModel):
+    name: str
+    scopes: list[ApiKeyScope] = Field(default=[ApiKeyScope.read, ApiKeyScope.write], min_length=1)
+
+    @field_validator("scopes")
+    @classmethod
+    def dedupe_scopes(cls, value: list[ApiKeyScope]) -> list[ApiKeyScope]:
+        return list(dict.fromkeys(value))
+
+
+class ApiKeyRead(BaseModel):
+    id: int
+    name: str
+    prefix: str
+    scopes: list[ApiKeyScope]
+    created_at: datetime
+    revoked_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+    @field_validator("scopes", mode="before")
+    @classmethod
+    def split_scopes(cls, value):
+        return value.split(",") if isinstance(value, str) else value
+
+
+class ApiKeyCreated(ApiKeyRead):
+    # The plaintext key; only ever returned once, at creation
+    key: str
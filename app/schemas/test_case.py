@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.test_case import CaseStatus, Priority, Severity
+from app.models.test_result import ResultStatus
 
 
 class TestCaseCreate(BaseModel):
@@ -26,6 +27,30 @@ class TestCaseUpdate(BaseModel):
     status: CaseStatus | None = None
 
 
+class TestCaseImportRow(BaseModel):
+    # One line of a suite import. Fields left out keep their value on an
+    # existing case (matched by title) and take the default on a new one.
+    title: str = Field(min_length=1, max_length=255)
+    description: str | None = None
+    steps: str | None = None
+    expected_result: str | None = None
+    priority: Priority = Priority.medium
+    severity: Severity = Severity.major
+    status: CaseStatus = CaseStatus.draft
+
+
+class TestCaseImportError(BaseModel):
+    line: int
+    error: str
+
+
+class TestCaseImportResponse(BaseModel):
+    created: int
+    updated: int
+    rejected: int
+    errors: list[TestCaseImportError]
+
+
 class TestCaseRead(BaseModel):
     id: int
     title: str
@@ -40,3 +65,30 @@ class TestCaseRead(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TestCaseHistoryEntry(BaseModel):
+    result_id: int
+    run_id: int
+    status: ResultStatus
+    duration_ms: int | None
+    executed_at: datetime
+
+
+class TestCaseHistory(BaseModel):
+    case_id: int
+    total: int
+    passed: int
+    pass_rate: float
+    recent: list[TestCaseHistoryEntry]
+
+
+class TestCaseStability(BaseModel):
+    case_id: int
+    title: str
+    total: int          # all results ever recorded
+    failures: int       # failed + error, all time
+    window_size: int    # runs in the window (at most `window`)
+    failure_rate: float # failures / (passed + failed + error) within the window
+    flips: int          # pass↔fail transitions within the window
+    recent: str         # latest status per run, oldest run first: P F E S B
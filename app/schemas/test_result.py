@@ -29,3 +29,26 @@ class TestResultRead(BaseModel):
     executed_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TestResultBulkItem(BaseModel):
+    index: int
+    id: int | None = None
+    error: str | None = None
+
+
+class TestResultBulkResponse(BaseModel):
+    created: int
+    failed: int
+    items: list[TestResultBulkItem]
+
+
+class TestResultStreamError(BaseModel):
+    line: int
+    error: str
+
+
+class TestResultStreamResponse(BaseModel):
+    accepted: int
+    rejected: int
+    errors: list[TestResultStreamError]
@@ -25,5 +25,34 @@ class TestRunRead(BaseModel):
     started_at: datetime | None
     completed_at: datetime | None
     created_at: datetime
+    passed_count: int
+    failed_count: int
+    skipped_count: int
+    blocked_count: int
+    error_count: int
+    total_count: int
+    total_duration_ms: int
 
     model_config = {"from_attributes": True}
+
+
+class JUnitImportResponse(BaseModel):
+    imported: int
+    created_cases: int
+    unmatched: int
+    unmatched_titles: list[str]
+    unnamed: int = 0  # <testcase> elements with no name, skipped: there is nothing to match them by
+
+
+class TestRunSummary(BaseModel):
+    run_id: int
+    total: int
+    passed: int
+    failed: int
+    skipped: int
+    blocked: int
+    error: int
+    pass_rate: float
+    total_duration_ms: int
+    p50_duration_ms: int | None
+    p95_duration_ms: int | None
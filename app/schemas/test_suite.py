@@ -22,3 +22,12 @@ class TestSuiteRead(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class TestSuiteReport(BaseModel):
+    suite_id: int
+    total_cases: int
+    cases_by_status: dict[str, int]
+    cases_by_priority: dict[str, int]
+    total_runs: int
+    runs_by_status: dict[str, int]
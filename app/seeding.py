@@ -0,0 +1,273 @@
+import math
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import exists, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.crud.test_case import reindex_cases
+from app.crud.test_case_stats import FAILURE_STATUSES, append_recent
+from app.models.test_case import TestCase
+from app.models.test_case_stats import TestCaseStats
+from app.models.test_result import TestResult
+from app.models.test_run import TestRun
+from app.models.test_suite import TestSuite
+from app.models.user import User
+
+# Synthetic data at production scale for local profiling and benchmarks.
+# Everything is drawn from one random.Random(seed), so the same config always
+# yields the same rows; ids are assigned here rather than by the database so
+# runs and cases of suite N sit at predictable ids (see suite_case_ids()).
+
+SEED_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+RESULT_STATUSES = ("passed", "failed", "skipped", "blocked", "error")
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    users: int = 5
+    suites: int = 100
+    cases_per_suite: int = 50
+    runs_per_suite: int = 20
+    seed: int = 0
+    password: str = "password123"
+    batch_size: int = 50_000
+
+    @property
+    def cases(self) -> int:
+        return self.suites * self.cases_per_suite
+
+    @property
+    def runs(self) -> int:
+        return self.suites * self.runs_per_suite
+
+    @property
+    def results(self) -> int:
+        # Every run records one result per case of its suite
+        return self.runs * self.cases_per_suite
+
+    @classmethod
+    def for_results(cls, results: int, suites: int, cases_per_suite: int, **kwargs) -> "SeedConfig":
+        runs_per_suite = max(1, math.ceil(results / (suites * cases_per_suite)))
+        return cls(suites=suites, cases_per_suite=cases_per_suite, runs_per_suite=runs_per_suite, **kwargs)
+
+
+def user_email(user_id: int) -> str:
+    return f"user{user_id}@seed.example.com"
+
+
+def case_title(suite_id: int, index: int) -> str:
+    return f"suite_{suite_id}::test_{index:04d}"
+
+
+def suite_case_ids(config: SeedConfig, suite_id: int) -> range:
+    first = (suite_id - 1) * config.cases_per_suite + 1
+    return range(first, first + config.cases_per_suite)
+
+
+def suite_run_ids(config: SeedConfig, suite_id: int) -> range:
+    first = (suite_id - 1) * config.runs_per_suite + 1
+    return range(first, first + config.runs_per_suite)
+
+
+@dataclass(frozen=True)
+class _CaseProfile:
+    fail: float      # chance of failed/error on a run
+    skip: float      # chance of skipped
+    base_ms: int     # typical duration
+
+
+def _case_profile(rng: random.Random) -> _CaseProfile:
+    # Most tests are stable; a tail is flaky, persistently broken or usually skipped
+    base_ms = int(rng.lognormvariate(5.5, 1.1)) + 1
+    kind = rng.random()
+    if kind < 0.80:
+        return _CaseProfile(fail=0.005, skip=0.01, base_ms=base_ms)
+    if kind < 0.92:
+        return _CaseProfile(fail=rng.uniform(0.05, 0.4), skip=0.01, base_ms=base_ms)
+    if kind < 0.96:
+        return _CaseProfile(fail=0.9, skip=0.0, base_ms=base_ms)
+    return _CaseProfile(fail=0.0, skip=0.7, base_ms=base_ms)
+
+
+@dataclass
+class SeedStats:
+    users: int = 0
+    suites: int = 0
+    cases: int = 0
+    runs: int = 0
+    results: int = 0
+
+
+class _BatchWriter:
+    # Buffers rows per table and flushes them as one executemany, committing
+    # after every flush so the WAL/transaction log never holds the whole seed
+    def __init__(self, conn: Connection, batch_size: int, stats: SeedStats, progress: Callable[[SeedStats], None] | None):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.stats = stats
+        self.progress = progress
+        self.buffers: dict[str, list[dict]] = {}
+        self.tables = {t.name: t for t in (User.__table__, TestSuite.__table__, TestCase.__table__,
+                                             TestCaseStats.__table__, TestRun.__table__, TestResult.__table__)}
+
+    def add(self, table: str, row: dict) -> None:
+        buffer = self.buffers.setdefault(table, [])
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        # Parents before children, for databases that enforce foreign keys
+        for name in ("users", "test_suites", "test_cases", "test_case_stats", "test_runs", "test_results"):
+            rows = self.buffers.pop(name, None)
+            if rows:
+                self.conn.execute(insert(self.tables[name]), rows)
+        self.conn.commit()
+        if self.progress is not None:
+            self.progress(self.stats)
+
+
+def _drop_result_indexes(conn: Connection) -> list:
+    # Loading into an unindexed table and building each index once at the end
+    # is several times faster than maintaining four indexes row by row
+    indexes = list(TestResult.__table__.indexes)
+    for index in indexes:
+        index.drop(conn)
+    return indexes
+
+
+def seed_database(engine: Engine, config: SeedConfig, progress: Callable[[SeedStats], None] | None = None) -> SeedStats:
+    rng = random.Random(config.seed)
+    stats = SeedStats()
+
+    with engine.connect() as conn:
+        if conn.scalar(select(exists().select_from(User))):
+            raise ValueError("Seeding needs an empty database (run `alembic upgrade head` on a fresh one)")
+        if conn.dialect.name == "sqlite":
+            # Throwaway data: skip the fsync per commit
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        indexes = _drop_result_indexes(conn)
+        conn.commit()
+
+        writer = _BatchWriter(conn, config.batch_size, stats, progress)
+        try:
+            # One bcrypt hash shared by every seeded user
+            hashed = hash_password(config.password)
+            for user_id in range(1, config.users + 1):
+                writer.add("users", {
+                    "id": user_id, "email": user_email(user_id), "hashed_password": hashed,
+                    "is_active": True, "created_at": SEED_EPOCH,
+                })
+                stats.users += 1
+
+            result_id = 0
+            for suite_id in range(1, config.suites + 1):
+                writer.add("test_suites", {
+                    "id": suite_id, "name": f"Suite {suite_id}", "description": None,
+                    "owner_id": (suite_id - 1) % config.users + 1,
+                    "created_at": SEED_EPOCH, "updated_at": SEED_EPOCH,
+                })
+                stats.suites += 1
+
+                case_ids = suite_case_ids(config, suite_id)
+                profiles = []
+                # Per-case analytics rows (app/crud/test_case_stats.py), built as
+                # the results are generated in execution order
+                case_stats = {
+                    case_id: {
+                        "test_case_id": case_id, "total_count": 0, "failure_count": 0,
+                        "recent": "", "last_run_id": None,
+                    }
+                    for case_id in case_ids
+                }
+                for index, case_id in enumerate(case_ids):
+                    profiles.append(_case_profile(rng))
+                    writer.add("test_cases", {
+                        "id": case_id, "suite_id": suite_id, "title": case_title(suite_id, index),
+                        "description": None, "steps": "1. Arrange\n2. Act\n3. Assert",
+                        "expected_result": "All assertions pass",
+                        "priority": rng.choice(("low", "medium", "medium", "medium", "high", "critical")),
+                        "severity": rng.choice(("trivial", "minor", "major", "major", "critical", "blocker")),
+                        "status": "active" if rng.random() < 0.9 else rng.choice(("draft", "deprecated")),
+                        "created_at": SEED_EPOCH, "updated_at": SEED_EPOCH,
+                    })
+                    stats.cases += 1
+
+                for n, run_id in enumerate(suite_run_ids(config, suite_id)):
+                    started = SEED_EPOCH + timedelta(days=n, minutes=suite_id % 1440)
+                    # ~3% of runs are aborted part-way; the cases left unrun are blocked
+                    aborted_at = rng.randrange(len(case_ids)) if rng.random() < 0.03 else None
+                    counts = dict.fromkeys(RESULT_STATUSES, 0)
+                    total_ms = 0
+                    executed_at = started
+                    results = []
+                    for position, (case_id, profile) in enumerate(zip(case_ids, profiles)):
+                        roll = rng.random()
+                        if aborted_at is not None and position >= aborted_at:
+                            status, duration = "blocked", 0
+                        elif roll < profile.skip:
+                            status, duration = "skipped", 0
+                        elif roll < profile.skip + profile.fail:
+                            # A fifth of failures are infrastructure errors; failures run long
+                            status = "error" if rng.random() < 0.2 else "failed"
+                            duration = int(profile.base_ms * rng.uniform(1.0, 3.0))
+                        else:
+                            status = "passed"
+                            duration = int(profile.base_ms * rng.uniform(0.7, 1.4))
+                        counts[status] += 1
+                        total_ms += duration
+                        case_row = case_stats[case_id]
+                        case_row["total_count"] += 1
+                        case_row["failure_count"] += status in FAILURE_STATUSES
+                        # One result per case per run, so each run appends
+                        case_row["recent"] = append_recent(case_row["recent"], status)
+                        case_row["last_run_id"] = run_id
+                        executed_at += timedelta(milliseconds=duration)
+                        result_id += 1
+                        results.append({
+                            "id": result_id, "run_id": run_id, "test_case_id": case_id, "status": status,
+                            "notes": None, "duration_ms": duration, "executed_at": executed_at,
+                        })
+                    # The run is buffered before its results so a flush never writes
+                    # a result whose run isn't in the database yet
+                    writer.add("test_runs", {
+                        "id": run_id, "name": f"Suite {suite_id} nightly #{n + 1}",
+                        "status": "aborted" if aborted_at is not None else "completed",
+                        "suite_id": suite_id, "started_at": started, "completed_at": executed_at,
+                        "created_at": started, "total_count": len(case_ids), "total_duration_ms": total_ms,
+                        **{f"{status}_count": count for status, count in counts.items()},
+                    })
+                    stats.runs += 1
+                    for row in results:
+                        writer.add("test_results", row)
+                    stats.results += len(results)
+                for row in case_stats.values():
+                    writer.add("test_case_stats", row)
+            writer.flush()
+        finally:
+            # Rebuild the indexes even when the load fails part-way; batches
+            # already flushed are committed and would otherwise be left unindexed
+            conn.rollback()
+            for index in indexes:
+                index.create(conn)
+            conn.commit()
+
+        # Full-text index over every case in one INSERT ... SELECT
+        with Session(bind=conn) as db:
+            reindex_cases(db)
+        if conn.dialect.name == "postgresql":
+            # Explicit ids don't advance the serial sequences; test_case_stats
+            # is keyed by test_case_id and has none
+            for table in writer.tables:
+                if "id" not in writer.tables[table].c:
+                    continue
+                conn.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT max(id) FROM {table}))"
+                )
+        conn.commit()
+    return stats
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Compares two benchmarks.run reports endpoint by endpoint. Exits 1 when any
+# endpoint's p95 latency or throughput regressed by more than --threshold percent.
+#
+#   python -m benchmarks.compare before.json after.json --threshold 15
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(before: dict, after: dict, threshold: float) -> tuple[list[str], list[str]]:
+    lines, regressions = [], []
+    old_endpoints = {e["name"]: e for e in before["endpoints"]}
+    for new in after["endpoints"]:
+        old = old_endpoints.get(new["name"])
+        if old is None:
+            lines.append(f"{new['name']:<32} (new)")
+            continue
+        p95 = _change(old["latency_ms"]["p95"], new["latency_ms"]["p95"])
+        p99 = _change(old["latency_ms"]["p99"], new["latency_ms"]["p99"])
+        rps = _change(old["throughput_rps"], new["throughput_rps"])
+        lines.append(
+            f"{new['name']:<32} p50 {old['latency_ms']['p50']:>8.2f} → {new['latency_ms']['p50']:>8.2f} ms  "
+            f"p95 {p95:>+7.1f}%  p99 {p99:>+7.1f}%  rps {rps:>+7.1f}%"
+        )
+        if p95 > threshold or rps < -threshold:
+            regressions.append(new["name"])
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare")
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed regression, percent")
+    args = parser.parse_args(argv)
+
+    before = json.loads(args.before.read_text())
+    after = json.loads(args.after.read_text())
+    if before["meta"]["scale"] != after["meta"]["scale"] or before["meta"]["seed"] != after["meta"]["seed"]:
+        print("warning: reports were run against different datasets", file=sys.stderr)
+
+    lines, regressions = compare(before, after, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\nRegressed beyond {args.threshold}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# Benchmark dataset sizes. Kept free of app imports: benchmarks.run has to point
+# DATABASE_URL at its own database before anything reads app.config.
+
+SCALES = {
+    "tiny": {"suites": 5, "cases_per_suite": 20, "runs_per_suite": 4},          # 400 results
+    "small": {"suites": 200, "cases_per_suite": 50, "runs_per_suite": 10},      # 100k results
+    "medium": {"suites": 2000, "cases_per_suite": 50, "runs_per_suite": 10},    # 1M results
+    "large": {"suites": 4000, "cases_per_suite": 50, "runs_per_suite": 25},     # 5M results
+}
+
+
+def bench_config(scale: str, seed: int):
+    # A single seeded user owns every suite, so the benchmark can reach all of them
+    from app.seeding import SeedConfig
+
+    return SeedConfig(users=1, seed=seed, **SCALES[scale])
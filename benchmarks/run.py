@@ -0,0 +1,204 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# In-process load benchmark: seeds a deterministic dataset, then drives every
+# router through httpx's ASGI transport at a fixed concurrency and reports
+# throughput and latency percentiles per endpoint as JSON.
+#
+#   python -m benchmarks.run --scale small --concurrency 16 --output before.json
+#   python -m benchmarks.compare before.json after.json
+
+DATA_DIR = Path(__file__).parent / ".data"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    # Nearest-rank, matching the run summary endpoint
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(scenario, latencies_ms: list[float], errors: int, wall_seconds: float) -> dict:
+    ordered = sorted(latencies_ms)
+    count = len(ordered)
+    return {
+        "name": scenario.name,
+        "method": scenario.method,
+        "route": scenario.route,
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 50), 3),
+            "p95": round(percentile(ordered, 95), 3),
+            "p99": round(percentile(ordered, 99), 3),
+            "mean": round(sum(ordered) / count, 3) if count else 0.0,
+            "max": round(ordered[-1], 3) if count else 0.0,
+        },
+    }
+
+
+async def run_scenario(client, scenario, scale, requests: int, concurrency: int, seed: int) -> dict:
+    rng = random.Random(f"{seed}:{scenario.name}")
+    specs = [scenario.build(rng, scale) for _ in range(requests)]
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < len(specs):
+            url, kwargs = specs[next_index]
+            next_index += 1
+            start = time.perf_counter()
+            response = await client.request(scenario.method, url, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code != scenario.expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(scenario, latencies, errors, time.perf_counter() - started)
+
+
+async def run_benchmarks(app, scale, *, requests: int, warmup: int, concurrency: int, seed: int, only: list[str]) -> list[dict]:
+    import httpx
+
+    from app.seeding import user_email
+    from benchmarks.scenarios import API, SCENARIOS
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        login = await client.post(f"{API}/auth/login", data={"username": user_email(1), "password": scale.password})
+        login.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+        report = []
+        for scenario in SCENARIOS:
+            if only and not any(pattern in scenario.name for pattern in only):
+                continue
+            count = min(requests, scenario.max_requests or requests)
+            if warmup:
+                await run_scenario(client, scenario, scale, min(warmup, count), concurrency, seed + 1)
+            result = await run_scenario(client, scenario, scale, count, concurrency, seed)
+            print(
+                f"{scenario.name:<32} {result['throughput_rps']:>9.1f} rps  "
+                f"p50 {result['latency_ms']['p50']:>8.2f}  p95 {result['latency_ms']['p95']:>8.2f}  "
+                f"p99 {result['latency_ms']['p99']:>8.2f} ms  errors {result['errors']}",
+                file=sys.stderr,
+            )
+            report.append(result)
+    return report
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _prepare_database(config, template: Path, reseed: bool, working: Path) -> None:
+    # Seeding is the slow part, so the seeded file is kept as a template and
+    # every benchmark run works on a fresh copy of it (write scenarios change data)
+    from sqlalchemy import create_engine, inspect, text
+
+    from app.database import Base, configure_engine, engine_options
+    from app.models.test_case_search import SEARCH_TABLE
+    from app.seeding import seed_database
+
+    if template.exists() and not reseed:
+        # A template seeded before a schema change is rebuilt rather than reused
+        engine = create_engine(f"sqlite:///{template}")
+        reseed = not {*Base.metadata.tables, SEARCH_TABLE} <= set(inspect(engine).get_table_names())
+        engine.dispose()
+    if reseed or not template.exists():
+        # Seed under a temporary name so an interrupted seed never leaves a
+        # half-filled template behind
+        partial = template.with_suffix(".partial")
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{partial}{suffix}").unlink(missing_ok=True)
+        url = f"sqlite:///{partial}"
+        engine = configure_engine(create_engine(url, **engine_options(url)))
+        Base.metadata.create_all(engine)
+        started = time.perf_counter()
+        seed_database(engine, config)
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+        engine.dispose()
+        partial.replace(template)
+        print(f"Seeded {template.stem} dataset in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{working}{suffix}").unlink(missing_ok=True)
+    shutil.copyfile(template, working)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from benchmarks.dataset import SCALES, bench_config
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Per-endpoint load benchmark")
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reseed", action="store_true", help="Rebuild the cached dataset")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per endpoint")
+    parser.add_argument("--only", action="append", default=[], help="Only scenarios whose name contains this")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    # The app reads its settings at import time, so configure it before importing it
+    DATA_DIR.mkdir(exist_ok=True)
+    working = DATA_DIR / f"{args.scale}-{args.seed}.run.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{working}"
+    os.environ.setdefault("BCRYPT_ROUNDS", "4")
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+    from app.config import settings
+    from app.seeding import user_email
+    from main import app
+
+    settings.ADMIN_EMAILS = [user_email(1)]
+    scale = bench_config(args.scale, args.seed)
+    _prepare_database(scale, DATA_DIR / f"{args.scale}-{args.seed}.db", args.reseed, working)
+    endpoints = asyncio.run(run_benchmarks(
+        app, scale, requests=args.requests, warmup=args.warmup,
+        concurrency=args.concurrency, seed=args.seed, only=args.only,
+    ))
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": {"name": args.scale, "suites": scale.suites, "cases": scale.cases,
+                      "runs": scale.runs, "results": scale.results},
+            "seed": args.seed,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+        },
+        "endpoints": endpoints,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
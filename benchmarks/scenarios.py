@@ -0,0 +1,168 @@
+import json
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.pagination import encode_cursor
+from app.seeding import SeedConfig, case_title, suite_case_ids, suite_run_ids, user_email
+
+API = "/api/v1"
+
+# (url, extra httpx.request kwargs) for one request
+RequestSpec = tuple[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    route: str
+    build: Callable[[random.Random, SeedConfig], RequestSpec]
+    expected_status: int = 200
+    # Caps the request count for inherently slow endpoints (bcrypt logins)
+    max_requests: int | None = None
+
+
+def _suite(rng: random.Random, scale: SeedConfig) -> int:
+    return rng.randint(1, scale.suites)
+
+
+def _run(rng: random.Random, scale: SeedConfig) -> int:
+    return rng.randint(1, scale.runs)
+
+
+def _result(rng: random.Random, scale: SeedConfig) -> int:
+    return rng.randint(1, scale.results)
+
+
+def _results_payload(rng: random.Random, scale: SeedConfig, size: int) -> list[dict]:
+    suite_id = _suite(rng, scale)
+    run_id = rng.choice(suite_run_ids(scale, suite_id))
+    case_ids = suite_case_ids(scale, suite_id)
+    return [
+        {"run_id": run_id, "test_case_id": rng.choice(case_ids), "status": "passed", "duration_ms": rng.randint(5, 900)}
+        for _ in range(size)
+    ]
+
+
+def _junit_report(rng: random.Random, scale: SeedConfig) -> RequestSpec:
+    suite_id = _suite(rng, scale)
+    run_id = rng.choice(suite_run_ids(scale, suite_id))
+    cases = "".join(
+        f'<testcase name="{case_title(suite_id, i)}" time="0.{rng.randint(10, 99)}"/>'
+        for i in range(scale.cases_per_suite)
+    )
+    xml = f'<testsuite name="bench">{cases}</testsuite>'.encode()
+    return f"{API}/test-runs/{run_id}/junit", {"files": {"file": ("report.xml", xml, "application/xml")}}
+
+
+def _cases_csv(rng: random.Random, scale: SeedConfig) -> RequestSpec:
+    # 500 rows, half updating existing cases and half creating new ones
+    suite_id = _suite(rng, scale)
+    titles = [case_title(suite_id, rng.randrange(scale.cases_per_suite)) for _ in range(250)]
+    titles += [f"bench_{rng.random()}" for _ in range(250)]
+    body = "title,steps,priority\n" + "".join(f"{title},\"1. Arrange\n2. Act\",high\n" for title in titles)
+    return f"{API}/test-suites/{suite_id}/cases/import", {
+        "content": body.encode(), "headers": {"Content-Type": "text/csv"},
+    }
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("health", "GET", "/health", lambda rng, s: ("/health", {})),
+    Scenario("auth.login", "POST", f"{API}/auth/login", lambda rng, s: (f"{API}/auth/login", {
+        "data": {"username": user_email(1), "password": s.password},
+    }), max_requests=50),
+    Scenario("auth.me", "GET", f"{API}/auth/me", lambda rng, s: (f"{API}/auth/me", {})),
+    Scenario("api_keys.list", "GET", f"{API}/api-keys/", lambda rng, s: (f"{API}/api-keys/", {})),
+
+    Scenario("suites.list", "GET", f"{API}/test-suites/", lambda rng, s: (f"{API}/test-suites/", {})),
+    Scenario("suites.list.last_page_cursor", "GET", f"{API}/test-suites/", lambda rng, s: (
+        f"{API}/test-suites/", {"params": {"cursor": encode_cursor(max(s.suites - 100, 0))}},
+    )),
+    Scenario("suites.list.last_page_offset", "GET", f"{API}/test-suites/", lambda rng, s: (
+        f"{API}/test-suites/", {"params": {"skip": max(s.suites - 100, 0)}},
+    )),
+    Scenario("suites.get", "GET", f"{API}/test-suites/{{suite_id}}", lambda rng, s: (
+        f"{API}/test-suites/{_suite(rng, s)}", {},
+    )),
+    Scenario("suites.report", "GET", f"{API}/test-suites/{{suite_id}}/report", lambda rng, s: (
+        f"{API}/test-suites/{_suite(rng, s)}/report", {},
+    )),
+    Scenario("suites.stability", "GET", f"{API}/test-suites/{{suite_id}}/stability", lambda rng, s: (
+        f"{API}/test-suites/{_suite(rng, s)}/stability", {},
+    )),
+    Scenario("suites.cases.import", "POST", f"{API}/test-suites/{{suite_id}}/cases/import", _cases_csv),
+    Scenario("suites.cases.export", "GET", f"{API}/test-suites/{{suite_id}}/cases/export", lambda rng, s: (
+        f"{API}/test-suites/{_suite(rng, s)}/cases/export", {},
+    )),
+
+    Scenario("cases.list", "GET", f"{API}/test-cases/", lambda rng, s: (
+        f"{API}/test-cases/", {"params": {"suite_id": _suite(rng, s)}},
+    )),
+    Scenario("cases.get", "GET", f"{API}/test-cases/{{case_id}}", lambda rng, s: (
+        f"{API}/test-cases/{rng.randint(1, s.cases)}", {},
+    )),
+    Scenario("cases.history", "GET", f"{API}/test-cases/{{case_id}}/history", lambda rng, s: (
+        f"{API}/test-cases/{rng.randint(1, s.cases)}/history", {},
+    )),
+    Scenario("cases.search", "GET", f"{API}/test-cases/search", lambda rng, s: (
+        f"{API}/test-cases/search", {"params": {"q": f"test {rng.randint(0, s.cases_per_suite - 1):04d}"}},
+    )),
+    Scenario("cases.create", "POST", f"{API}/test-cases/", lambda rng, s: (
+        f"{API}/test-cases/", {"json": {"suite_id": _suite(rng, s), "title": f"bench_{rng.random()}"}},
+    ), expected_status=201),
+
+    Scenario("runs.list", "GET", f"{API}/test-runs/", lambda rng, s: (f"{API}/test-runs/", {})),
+    Scenario("runs.list.limit_1000", "GET", f"{API}/test-runs/", lambda rng, s: (
+        f"{API}/test-runs/", {"params": {"limit": 1000}},
+    )),
+    Scenario("runs.list.last_page_cursor", "GET", f"{API}/test-runs/", lambda rng, s: (
+        f"{API}/test-runs/", {"params": {"cursor": encode_cursor(max(s.runs - 100, 0))}},
+    )),
+    Scenario("runs.list.last_page_offset", "GET", f"{API}/test-runs/", lambda rng, s: (
+        f"{API}/test-runs/", {"params": {"skip": max(s.runs - 100, 0)}},
+    )),
+    Scenario("runs.get", "GET", f"{API}/test-runs/{{run_id}}", lambda rng, s: (f"{API}/test-runs/{_run(rng, s)}", {})),
+    Scenario("runs.summary", "GET", f"{API}/test-runs/{{run_id}}/summary", lambda rng, s: (
+        f"{API}/test-runs/{_run(rng, s)}/summary", {},
+    )),
+    # Dashboards: many viewers polling the same few runs
+    Scenario("runs.summary.hot", "GET", f"{API}/test-runs/{{run_id}}/summary", lambda rng, s: (
+        f"{API}/test-runs/{rng.randint(1, 5)}/summary", {},
+    )),
+    Scenario("runs.export", "GET", f"{API}/test-runs/{{run_id}}/export", lambda rng, s: (
+        f"{API}/test-runs/{_run(rng, s)}/export", {},
+    )),
+    Scenario("runs.export.ndjson_gzip", "GET", f"{API}/test-runs/{{run_id}}/export", lambda rng, s: (
+        f"{API}/test-runs/{_run(rng, s)}/export", {"params": {"format": "ndjson"}, "headers": {"Accept-Encoding": "gzip"}},
+    )),
+    Scenario("runs.create", "POST", f"{API}/test-runs/", lambda rng, s: (
+        f"{API}/test-runs/", {"json": {"name": "bench run", "suite_id": _suite(rng, s)}},
+    ), expected_status=201),
+    Scenario("runs.junit", "POST", f"{API}/test-runs/{{run_id}}/junit", _junit_report),
+
+    Scenario("results.list", "GET", f"{API}/test-results/", lambda rng, s: (
+        f"{API}/test-results/", {"params": {"run_id": _run(rng, s)}},
+    )),
+    Scenario("results.get", "GET", f"{API}/test-results/{{result_id}}", lambda rng, s: (
+        f"{API}/test-results/{_result(rng, s)}", {},
+    )),
+    Scenario("results.create", "POST", f"{API}/test-results/", lambda rng, s: (
+        f"{API}/test-results/", {"json": _results_payload(rng, s, 1)[0]},
+    ), expected_status=201),
+    Scenario("results.bulk", "POST", f"{API}/test-results/bulk", lambda rng, s: (
+        f"{API}/test-results/bulk", {"json": _results_payload(rng, s, 100)},
+    )),
+    Scenario("results.stream", "POST", f"{API}/test-results/stream", lambda rng, s: (
+        f"{API}/test-results/stream", {
+            "content": "\n".join(json.dumps(item) for item in _results_payload(rng, s, 100)),
+            "headers": {"Content-Type": "application/x-ndjson"},
+        },
+    )),
+
+    Scenario("admin.slow_queries", "GET", f"{API}/admin/slow-queries", lambda rng, s: (
+        f"{API}/admin/slow-queries", {},
+    )),
+    Scenario("metrics", "GET", "/metrics", lambda rng, s: ("/metrics", {})),
+]
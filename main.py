@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -8,21 +8,27 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.config import settings
 from app.core.exceptions import (
     http_exception_handler,
+    password_hashing_busy_handler,
     unhandled_exception_handler,
     validation_exception_handler,
 )
-from app.core.logging import RequestLoggingMiddleware, configure_logging
-from app.routers import auth, test_cases, test_results, test_runs, test_suites
+from app.core import metrics
+from app.core.etag import ETAG_HEADER
+from app.core.logging import REQUEST_ID_HEADER, RequestLoggingMiddleware, configure_logging
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.profiling import PROFILE_ID_HEADER, ProfilingMiddleware
+from app.core.security import PasswordHashingBusy, shutdown_password_hashing
+from app.routers import admin, api_keys, auth, test_cases, test_results, test_runs, test_suites
+from app.routers.aio import test_results as aio_test_results
 
-configure_logging()
+configure_logging(settings.LOG_LEVEL, json_logs=settings.LOG_JSON)
 
 
+# The schema is owned by Alembic (`alembic upgrade head`); the app never creates tables
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    import app.models  # noqa: F401 — ensure all models are registered before create_all
-    from app.database import Base, engine
-    Base.metadata.create_all(bind=engine)
     yield
+    shutdown_password_hashing()
 
 
 app = FastAPI(
@@ -32,26 +38,38 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Innermost first: the profiler needs the request id the logging middleware sets
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[ETAG_HEADER, NEXT_CURSOR_HEADER, REQUEST_ID_HEADER, PROFILE_ID_HEADER],
 )
 
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(PasswordHashingBusy, password_hashing_busy_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 
 _PREFIX = settings.API_V1_STR
 
 app.include_router(auth.router, prefix=_PREFIX)
+app.include_router(api_keys.router, prefix=_PREFIX)
+app.include_router(admin.router, prefix=_PREFIX)
 app.include_router(test_suites.router, prefix=_PREFIX)
 app.include_router(test_cases.router, prefix=_PREFIX)
 app.include_router(test_runs.router, prefix=_PREFIX)
-app.include_router(test_results.router, prefix=_PREFIX)
+app.include_router(
+    aio_test_results.router if settings.ASYNC_DATABASE else test_results.router,
+    prefix=_PREFIX,
+)
 
 
 @app.get("/health", tags=["Health"])
@@ -59,6 +77,12 @@ def health():
     return {"status": "ok"}
 
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return Response(metrics.render_metrics(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/", include_in_schema=False)
 def root():
     return {"message": settings.PROJECT_NAME, "docs": "/docs"}
@@ -0,0 +1,114 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+Matches what Base.metadata.create_all() produced before migrations existed;
+databases created that way can be adopted with `alembic stamp 0001`.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "test_suites",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_test_suites_id", "test_suites", ["id"])
+    op.create_index("ix_test_suites_name", "test_suites", ["name"])
+
+    op.create_table(
+        "test_cases",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("steps", sa.Text(), nullable=True),
+        sa.Column("expected_result", sa.Text(), nullable=True),
+        sa.Column("priority", sa.Enum("low", "medium", "high", "critical", name="priority"), nullable=False),
+        sa.Column(
+            "severity",
+            sa.Enum("trivial", "minor", "major", "critical", "blocker", name="severity"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.Enum("draft", "active", "deprecated", name="casestatus"), nullable=False),
+        sa.Column("suite_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["suite_id"], ["test_suites.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_test_cases_id", "test_cases", ["id"])
+    op.create_index("ix_test_cases_title", "test_cases", ["title"])
+
+    op.create_table(
+        "test_runs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("pending", "running", "completed", "aborted", name="runstatus"),
+            nullable=False,
+        ),
+        sa.Column("suite_id", sa.Integer(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["suite_id"], ["test_suites.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_test_runs_id", "test_runs", ["id"])
+
+    op.create_table(
+        "test_results",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("passed", "failed", "skipped", "blocked", "error", name="resultstatus"),
+            nullable=False,
+        ),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("duration_ms", sa.Integer(), nullable=True),
+        sa.Column("executed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("test_case_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["test_runs.id"]),
+        sa.ForeignKeyConstraint(["test_case_id"], ["test_cases.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_test_results_id", "test_results", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("test_results")
+    op.drop_table("test_runs")
+    op.drop_table("test_cases")
+    op.drop_table("test_suites")
+    op.drop_table("users")
+    for enum_name in ("resultstatus", "runstatus", "casestatus", "severity", "priority"):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
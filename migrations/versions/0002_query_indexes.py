@@ -0,0 +1,35 @@
+"""composite indexes for list, ownership and history queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+Each index leads with the foreign key the CRUD layer filters on and ends with
+the column it orders or seeks by (see app/core/pagination.py).
+"""
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_INDEXES = [
+    ("ix_test_results_run_id_id", "test_results", ["run_id", "id"]),
+    ("ix_test_results_run_id_status", "test_results", ["run_id", "status"]),
+    ("ix_test_results_test_case_id_executed_at", "test_results", ["test_case_id", "executed_at"]),
+    ("ix_test_cases_suite_id_id", "test_cases", ["suite_id", "id"]),
+    ("ix_test_cases_suite_id_title", "test_cases", ["suite_id", "title"]),
+    ("ix_test_runs_suite_id_id", "test_runs", ["suite_id", "id"]),
+    ("ix_test_suites_owner_id_id", "test_suites", ["owner_id", "id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,44 @@
+"""denormalized result counters on test_runs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_STATUSES = ["passed", "failed", "skipped", "blocked", "error"]
+_COLUMNS = [f"{status}_count" for status in _STATUSES] + ["total_count", "total_duration_ms"]
+# Summed over a run's results, so it outgrows int4 on PostgreSQL
+_BIG_COLUMNS = {"total_duration_ms"}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("test_runs") as batch_op:
+        for column in _COLUMNS:
+            column_type = sa.BigInteger() if column in _BIG_COLUMNS else sa.Integer()
+            batch_op.add_column(sa.Column(column, column_type, server_default="0", nullable=False))
+
+    # Backfill from existing results (same as `python -m app.cli recount-runs`)
+    assignments = [
+        f"{status}_count = (SELECT COUNT(*) FROM test_results tr "
+        f"WHERE tr.run_id = test_runs.id AND tr.status = '{status}')"
+        for status in _STATUSES
+    ]
+    assignments += [
+        "total_count = (SELECT COUNT(*) FROM test_results tr WHERE tr.run_id = test_runs.id)",
+        "total_duration_ms = (SELECT COALESCE(SUM(tr.duration_ms), 0) FROM test_results tr "
+        "WHERE tr.run_id = test_runs.id)",
+    ]
+    op.execute(f"UPDATE test_runs SET {', '.join(assignments)}")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("test_runs") as batch_op:
+        for column in reversed(_COLUMNS):
+            batch_op.drop_column(column)
@@ -0,0 +1,35 @@
+"""per-case result stats for flaky-test analytics
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Existing cases get an empty stats row; fill them from existing results with
+`python -m app.cli rebuild-case-stats` (the rolling status window needs window
+functions and string building that don't translate to one portable UPDATE).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "test_case_stats",
+        sa.Column("test_case_id", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failure_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("recent", sa.String(length=50), server_default="", nullable=False),
+        sa.Column("last_run_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["test_case_id"], ["test_cases.id"]),
+        sa.PrimaryKeyConstraint("test_case_id"),
+    )
+    op.execute("INSERT INTO test_case_stats (test_case_id) SELECT id FROM test_cases")
+
+
+def downgrade() -> None:
+    op.drop_table("test_case_stats")
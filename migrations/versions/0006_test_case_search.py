@@ -0,0 +1,45 @@
+"""full-text search index over test cases
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+SQLite gets an FTS5 virtual table, PostgreSQL a tsvector table with a GIN index
+(see app/models/test_case_search.py); both are filled from existing cases.
+"""
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+_SQLITE = [
+    "CREATE VIRTUAL TABLE test_case_search USING fts5("
+    "title, description, steps, expected_result, tokenize = 'porter unicode61')",
+    "INSERT INTO test_case_search (rowid, title, description, steps, expected_result) "
+    "SELECT id, title, COALESCE(description, ''), COALESCE(steps, ''), COALESCE(expected_result, '') "
+    "FROM test_cases",
+]
+_POSTGRESQL = [
+    "CREATE TABLE test_case_search ("
+    "test_case_id INTEGER PRIMARY KEY REFERENCES test_cases (id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)",
+    "CREATE INDEX ix_test_case_search_document ON test_case_search USING gin (document)",
+    "INSERT INTO test_case_search (test_case_id, document) "
+    "SELECT id, "
+    "setweight(to_tsvector('english'::regconfig, COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, COALESCE(description, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, COALESCE(concat_ws(' ', steps, expected_result), '')), 'C') "
+    "FROM test_cases",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for statement in {"sqlite": _SQLITE, "postgresql": _POSTGRESQL}.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS test_case_search")
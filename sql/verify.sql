@@ -47,3 +47,31 @@ SELECT run.id, run.name, run.status, COUNT(tr.id) AS result_count
 FROM test_runs run
 LEFT JOIN test_results tr ON tr.run_id = run.id
 GROUP BY run.id, run.name, run.status;
+
+-- Pass/fail breakdown and duration percentiles for one run in a single pass,
+-- recomputed from test_results (replace 1 with the run id); the status counts
+-- should match the run's denormalized counters
+SELECT
+    status,
+    COUNT(*)                                                              AS count,
+    COALESCE(SUM(duration_ms), 0)                                         AS total_duration_ms,
+    MAX(CASE WHEN rnk = (timed * 50 + 99) / 100 THEN duration_ms END)    AS p50_duration_ms,
+    MAX(CASE WHEN rnk = (timed * 95 + 99) / 100 THEN duration_ms END)    AS p95_duration_ms
+FROM (
+    SELECT
+        status,
+        duration_ms,
+        ROW_NUMBER() OVER (ORDER BY duration_ms ASC NULLS LAST) AS rnk,
+        COUNT(duration_ms) OVER ()                              AS timed
+    FROM test_results
+    WHERE run_id = 1
+) AS ranked
+GROUP BY status;
+
+-- Runs whose denormalized counters disagree with test_results
+-- (should return no rows; fix with: python -m app.cli recount-runs)
+SELECT run.id, run.name, run.total_count, COUNT(tr.id) AS actual_count
+FROM test_runs run
+LEFT JOIN test_results tr ON tr.run_id = run.id
+GROUP BY run.id, run.name, run.total_count
+HAVING run.total_count <> COUNT(tr.id);
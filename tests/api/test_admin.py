@@ -0,0 +1,68 @@
+from collections import Counter
+from datetime import datetime, timezone
+
+from app.config import settings
+from app.core import profiling
+from app.core.slow_queries import slow_query_log
+
+
+def test_admin_requires_listed_email(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [])
+    assert client.get("/api/v1/admin/slow-queries", headers=auth_headers).status_code == 403
+
+
+def test_list_and_clear_slow_queries(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["Tester@example.com"])
+    slow_query_log.record("SELECT * FROM test_results", ["int"], "GET /x", ["SCAN test_results"], 812.5)
+
+    res = client.get("/api/v1/admin/slow-queries", headers=auth_headers)
+    assert res.status_code == 200
+    entry = next(e for e in res.json() if e["statement"] == "SELECT * FROM test_results")
+    assert entry["max_ms"] == 812.5
+    assert entry["plan"] == ["SCAN test_results"]
+
+    assert client.delete("/api/v1/admin/slow-queries", headers=auth_headers).status_code == 204
+    assert client.get("/api/v1/admin/slow-queries", headers=auth_headers).json() == []
+
+
+def test_read_profile(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["tester@example.com"])
+    stack = (("list_runs", "app/routers/test_runs.py", 20), ("get_runs", "app/crud/test_run.py", 12))
+    profile = profiling.Profile(
+        id="abc123", method="GET", path="/api/v1/test-runs/", request_id=None, interval_ms=1.0,
+        created_at=datetime.now(timezone.utc), status_code=200, duration_ms=12.0, samples=4,
+        stacks=Counter({stack: 3, stack[:1]: 1}),
+    )
+    monkeypatch.setattr(profiling, "_profiles", [profile])
+
+    assert [p["id"] for p in client.get("/api/v1/admin/profiles", headers=auth_headers).json()] == ["abc123"]
+    body = client.get("/api/v1/admin/profiles/abc123", headers=auth_headers).json()
+    top = {fn["function"]: fn for fn in body["top_functions"]}
+    assert top["list_runs"] == {**top["list_runs"], "self": 1, "total": 4}
+    assert top["get_runs"]["self"] == 3
+    collapsed = client.get("/api/v1/admin/profiles/abc123/collapsed", headers=auth_headers).text
+    assert collapsed.splitlines()[0].endswith(" 3")
+    assert client.get("/api/v1/admin/profiles/nope", headers=auth_headers).status_code == 404
+
+
+def test_deactivate_user_revokes_cached_principal(client, auth_headers, monkeypatch):
+    from app.core.principals import principal_cache
+
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["tester@example.com"])
+    client.post("/api/v1/auth/register", json={"email": "leaver@example.com", "password": "pw-123456"})
+    token = client.post(
+        "/api/v1/auth/login", data={"username": "leaver@example.com", "password": "pw-123456"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    me = client.get("/api/v1/auth/me", headers=headers)
+    assert me.status_code == 200
+    hits = principal_cache.hits
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    assert principal_cache.hits == hits + 1
+
+    assert client.post(f"/api/v1/admin/users/{me.json()['id']}/deactivate", headers=headers).status_code == 403
+    res = client.post(f"/api/v1/admin/users/{me.json()['id']}/deactivate", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["is_active"] is False
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+    assert client.post("/api/v1/admin/users/999999/deactivate", headers=auth_headers).status_code == 404
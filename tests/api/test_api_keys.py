@@ -0,0 +1,63 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def api_key(client, auth_headers):
+    resp = client.post("/api/v1/api-keys/", json={"name": "ci-reporter"}, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def _key_headers(key: str) -> dict:
+    return {"Authorization": f"Bearer {key}"}
+
+
+def test_create_api_key(api_key):
+    assert api_key["key"].startswith(f"qak_{api_key['prefix']}_")
+    assert sorted(api_key["scopes"]) == ["read", "write"]
+
+
+def test_api_key_authenticates(client, api_key):
+    resp = client.post("/api/v1/test-suites/", json={"name": "Key Suite"}, headers=_key_headers(api_key["key"]))
+    assert resp.status_code == 201
+    assert client.get("/api/v1/auth/me", headers=_key_headers(api_key["key"])).status_code == 200
+
+
+def test_api_key_wrong_secret(client, api_key):
+    forged = f"qak_{api_key['prefix']}_not-the-secret"
+    assert client.get("/api/v1/auth/me", headers=_key_headers(forged)).status_code == 401
+
+
+def test_read_only_api_key_cannot_write(client, auth_headers):
+    key = client.post("/api/v1/api-keys/", json={"name": "dashboard", "scopes": ["read"]},
+                      headers=auth_headers).json()["key"]
+    assert client.get("/api/v1/test-suites/", headers=_key_headers(key)).status_code == 200
+    resp = client.post("/api/v1/test-suites/", json={"name": "Nope"}, headers=_key_headers(key))
+    assert resp.status_code == 403
+
+
+def test_api_key_cannot_manage_keys(client, api_key):
+    resp = client.post("/api/v1/api-keys/", json={"name": "escalate"}, headers=_key_headers(api_key["key"]))
+    assert resp.status_code == 403
+
+
+def test_revoked_api_key_rejected(client, auth_headers):
+    created = client.post("/api/v1/api-keys/", json={"name": "temp"}, headers=auth_headers).json()
+    assert client.get("/api/v1/auth/me", headers=_key_headers(created["key"])).status_code == 200
+
+    resp = client.delete(f"/api/v1/api-keys/{created['id']}", headers=auth_headers)
+    assert resp.status_code == 204
+    assert client.get("/api/v1/auth/me", headers=_key_headers(created["key"])).status_code == 401
+
+    listed = {k["id"]: k for k in client.get("/api/v1/api-keys/", headers=auth_headers).json()}
+    assert listed[created["id"]]["revoked_at"] is not None
+    assert "key" not in listed[created["id"]]
+
+
+def test_api_key_scopes_validated(client, auth_headers):
+    resp = client.post("/api/v1/api-keys/", json={"name": "useless", "scopes": []}, headers=auth_headers)
+    assert resp.status_code == 422
+    resp = client.post("/api/v1/api-keys/", json={"name": "repeated", "scopes": ["read", "read"]},
+                       headers=auth_headers)
+    assert resp.status_code == 201
+    assert resp.json()["scopes"] == ["read"]
@@ -0,0 +1,96 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.dependencies import get_async_db, get_current_user_async
+from app.models.test_case import TestCase
+from app.models.test_run import TestRun
+from app.models.test_suite import TestSuite
+from app.models.user import User
+from app.routers.aio import test_results
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+@pytest.fixture(scope="module")
+def sessions(engine):
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture(scope="module")
+def async_client(engine, sessions):
+    async def override_get_async_db():
+        async with sessions() as db:
+            yield db
+
+    async def seed():
+        import app.models  # noqa: F401
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with sessions() as db:
+            user = User(email="async@example.com", hashed_password="x")
+            suite = TestSuite(name="Async Suite", owner=user)
+            db.add_all([
+                user,
+                TestCase(title="Async case", suite=suite),
+                TestRun(name="Async run", suite=suite),
+            ])
+            await db.commit()
+            return user
+
+    api = FastAPI()
+    api.include_router(test_results.router, prefix="/api/v1")
+    api.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(api) as client:
+        user = client.portal.call(seed)
+        api.dependency_overrides[get_current_user_async] = lambda: user
+        yield client
+        client.portal.call(engine.dispose)
+
+
+def test_async_create_and_list_results(async_client):
+    resp = async_client.post("/api/v1/test-results/", json={
+        "run_id": 1, "test_case_id": 1, "status": "failed", "duration_ms": 30,
+    })
+    assert resp.status_code == 201
+    result_id = resp.json()["id"]
+
+    resp = async_client.patch(f"/api/v1/test-results/{result_id}", json={"status": "passed"})
+    assert resp.json()["status"] == "passed"
+
+    resp = async_client.get("/api/v1/test-results/?run_id=1")
+    assert [r["id"] for r in resp.json()] == [result_id]
+
+
+def test_async_bulk_results_update_run_counters(async_client, sessions):
+    async def run_counters():
+        async with sessions() as db:
+            run = await db.get(TestRun, 1)
+            return run.passed_count, run.total_count, run.total_duration_ms
+
+    before = async_client.portal.call(run_counters)
+    resp = async_client.post("/api/v1/test-results/bulk", json=[
+        {"run_id": 1, "test_case_id": 1, "status": "passed", "duration_ms": 5},
+        {"run_id": 1, "test_case_id": 404, "status": "passed"},
+    ])
+    assert resp.json()["created"] == 1
+    assert resp.json()["failed"] == 1
+    after = async_client.portal.call(run_counters)
+    assert tuple(a - b for a, b in zip(after, before)) == (1, 1, 5)
+
+    resp = async_client.delete(f"/api/v1/test-results/{resp.json()['items'][0]['id']}")
+    assert resp.status_code == 204
+    assert async_client.portal.call(run_counters) == before
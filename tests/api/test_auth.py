@@ -1,3 +1,6 @@
+import asyncio
+
+
 def test_register(client):
     resp = client.post("/api/v1/auth/register", json={
         "email": "newuser@example.com",
@@ -30,3 +33,52 @@ def test_login_wrong_password(client, registered_user):
         "password": "wrongpassword",
     })
     assert resp.status_code == 401
+
+
+def _login(client, email, password="pw-123456"):
+    client.post("/api/v1/auth/register", json={"email": email, "password": password})
+    resp = client.post("/api/v1/auth/login", data={"username": email, "password": password})
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_principal_cache_hits(client):
+    from app.core.principals import principal_cache
+
+    headers = _login(client, "cached@example.com")
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    hits = principal_cache.hits
+    resp = client.get("/api/v1/auth/me", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "cached@example.com"
+    assert principal_cache.hits == hits + 1
+
+
+def test_password_hashing_in_process_pool(monkeypatch):
+    from app.core import security
+
+    monkeypatch.setattr(security.settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(security.settings, "BCRYPT_ROUNDS", 4)
+    try:
+        hashed = security.hash_password("pool-secret")
+        assert hashed.startswith("$2b$04$")
+        assert security.verify_password("pool-secret", hashed)
+        assert asyncio.run(security.verify_password_async("pool-secret", hashed))
+        assert not asyncio.run(security.verify_password_async("wrong", hashed))
+    finally:
+        security.shutdown_password_hashing()
+
+
+def test_login_returns_503_when_hashing_saturated(client, registered_user, monkeypatch):
+    import threading
+
+    from app.core import security
+
+    monkeypatch.setattr(security.settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(security, "_hash_slots", threading.BoundedSemaphore(1))
+    security._hash_slots.acquire()
+    resp = client.post("/api/v1/auth/login", data={
+        "username": "tester@example.com",
+        "password": "testpassword123",
+    })
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
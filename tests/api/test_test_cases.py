@@ -54,3 +54,108 @@ def test_delete_case(client, auth_headers, suite_id):
 
     resp = client.delete(f"/api/v1/test-cases/{case_id}", headers=auth_headers)
     assert resp.status_code == 204
+
+
+def test_list_cases_cursor_pagination(client, auth_headers):
+    suite = client.post("/api/v1/test-suites/", json={"name": "Paged Suite"}, headers=auth_headers).json()
+    created = [
+        client.post("/api/v1/test-cases/", json={"title": f"Case {n}", "suite_id": suite["id"]},
+                    headers=auth_headers).json()["id"]
+        for n in range(5)
+    ]
+
+    seen, cursor = [], None
+    while True:
+        params = {"suite_id": suite["id"], "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/test-cases/", params=params, headers=auth_headers)
+        assert resp.status_code == 200
+        seen += [c["id"] for c in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == created
+
+
+def test_list_cases_invalid_cursor(client, auth_headers, suite_id):
+    resp = client.get(f"/api/v1/test-cases/?suite_id={suite_id}&cursor=not-a-cursor", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_case_etag_and_conditional_requests(client, auth_headers, suite_id):
+    case_id = client.post("/api/v1/test-cases/", json={"title": "Tagged case", "suite_id": suite_id},
+                          headers=auth_headers).json()["id"]
+    resp = client.get(f"/api/v1/test-cases/{case_id}", headers=auth_headers)
+    etag = resp.headers["ETag"]
+
+    cached = client.get(f"/api/v1/test-cases/{case_id}", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    updated = client.patch(f"/api/v1/test-cases/{case_id}", json={"title": "Retitled"},
+                           headers={**auth_headers, "If-Match": etag})
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] != etag
+
+    stale = client.patch(f"/api/v1/test-cases/{case_id}", json={"title": "Lost update"},
+                         headers={**auth_headers, "If-Match": etag})
+    assert stale.status_code == 412
+    fresh = client.get(f"/api/v1/test-cases/{case_id}", headers={**auth_headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["title"] == "Retitled"
+    assert fresh.headers["ETag"] == updated.headers["ETag"]
+
+
+def test_list_cases_etag(client, auth_headers, suite_id):
+    resp = client.get("/api/v1/test-cases/", params={"suite_id": suite_id}, headers=auth_headers)
+    etag = resp.headers["ETag"]
+    cached = client.get("/api/v1/test-cases/", params={"suite_id": suite_id},
+                        headers={**auth_headers, "If-None-Match": f'W/"other", {etag}'})
+    assert cached.status_code == 304
+
+    client.post("/api/v1/test-cases/", json={"title": "Another case", "suite_id": suite_id}, headers=auth_headers)
+    changed = client.get("/api/v1/test-cases/", params={"suite_id": suite_id},
+                         headers={**auth_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_search_cases(client, auth_headers):
+    suite = client.post("/api/v1/test-suites/", json={"name": "Search Suite"}, headers=auth_headers).json()["id"]
+
+    def make(**fields):
+        resp = client.post("/api/v1/test-cases/", json={"suite_id": suite, **fields}, headers=auth_headers)
+        return resp.json()["id"]
+
+    in_steps = make(title="Open settings page", steps="1. Reset the password\n2. Log out")
+    in_title = make(title="Password reset email is sent")
+    make(title="Unrelated checkout flow", description="Card payments")
+
+    def search(q, **params):
+        resp = client.get("/api/v1/test-cases/search", params={"q": q, "suite_id": suite, **params},
+                          headers=auth_headers)
+        assert resp.status_code == 200
+        return [item["id"] for item in resp.json()]
+
+    # Title matches outrank matches in the steps; "resets" stems to "reset"
+    assert search("password resets") == [in_title, in_steps]
+    assert search("password", limit=1, skip=1) == [in_steps]
+    # FTS operators and quotes in q are plain text
+    assert search('password" OR "checkout*') == []
+    assert search("-(") == []
+
+    client.patch(f"/api/v1/test-cases/{in_title}", json={"title": "Email verification"}, headers=auth_headers)
+    client.delete(f"/api/v1/test-cases/{in_steps}", headers=auth_headers)
+    assert search("password") == []
+    assert search("verification") == [in_title]
+
+    other = client.post("/api/v1/auth/register", json={"email": "searcher@example.com", "password": "secret123"})
+    assert other.status_code == 201
+    token = client.post("/api/v1/auth/login", data={"username": "searcher@example.com", "password": "secret123"})
+    other_headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+    assert client.get("/api/v1/test-cases/search", params={"q": "verification"}, headers=other_headers).json() == []
+    resp = client.get("/api/v1/test-cases/search", params={"q": "verification", "suite_id": suite},
+                      headers=other_headers)
+    assert resp.status_code == 404
@@ -0,0 +1,123 @@
+import pytest
+
+from app.config import settings
+
+
+@pytest.fixture(scope="module")
+def suite_id(client, auth_headers):
+    resp = client.post("/api/v1/test-suites/", json={"name": "Results Suite"}, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+@pytest.fixture(scope="module")
+def case_id(client, auth_headers, suite_id):
+    resp = client.post("/api/v1/test-cases/", json={
+        "title": "Checkout with saved card",
+        "suite_id": suite_id,
+    }, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+@pytest.fixture(scope="module")
+def run_id(client, auth_headers, suite_id):
+    resp = client.post("/api/v1/test-runs/", json={
+        "name": "Nightly regression",
+        "suite_id": suite_id,
+    }, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def test_create_result(client, auth_headers, run_id, case_id):
+    resp = client.post("/api/v1/test-results/", json={
+        "run_id": run_id,
+        "test_case_id": case_id,
+        "status": "passed",
+    }, headers=auth_headers)
+    assert resp.status_code == 201
+    assert resp.json()["status"] == "passed"
+
+
+def test_bulk_create_results(client, auth_headers, run_id, case_id):
+    resp = client.post("/api/v1/test-results/bulk", json=[
+        {"run_id": run_id, "test_case_id": case_id, "status": "passed", "duration_ms": 12},
+        {"run_id": 99999, "test_case_id": case_id, "status": "failed"},
+        {"run_id": run_id, "test_case_id": case_id, "status": "failed", "notes": "timeout"},
+    ], headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["created"] == 2
+    assert data["failed"] == 1
+
+    first, missing, last = data["items"]
+    assert first["id"] is not None and last["id"] > first["id"]
+    assert missing["id"] is None
+    assert "99999" in missing["error"]
+
+    resp = client.get(f"/api/v1/test-results/{last['id']}", headers=auth_headers)
+    assert resp.json()["notes"] == "timeout"
+
+
+def test_bulk_create_results_over_limit(client, auth_headers, run_id, case_id, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_RESULTS_MAX_ITEMS", 1)
+    item = {"run_id": run_id, "test_case_id": case_id, "status": "passed"}
+    resp = client.post("/api/v1/test-results/bulk", json=[item, item], headers=auth_headers)
+    assert resp.status_code == 413
+
+
+def test_bulk_create_results_reports_invalid_items(client, auth_headers, run_id, case_id):
+    resp = client.post("/api/v1/test-results/bulk", json=[
+        {"run_id": run_id, "test_case_id": case_id, "status": "passed"},
+        {"run_id": run_id, "test_case_id": case_id, "status": "exploded"},
+        {"run_id": run_id, "status": "passed"},
+        {"run_id": 99999, "test_case_id": case_id, "status": "passed"},
+    ], headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["created"], data["failed"]) == (1, 3)
+    ok, bad_status, no_case, missing_run = data["items"]
+    assert ok["id"] is not None and ok["error"] is None
+    assert bad_status["error"].startswith("status")
+    assert no_case["error"].startswith("test_case_id")
+    assert "99999" in missing_run["error"]
+
+    resp = client.post("/api/v1/test-results/bulk", json={"run_id": run_id}, headers=auth_headers)
+    assert resp.status_code == 422
+
+
+def test_bulk_create_results_body_too_large(client, auth_headers, run_id, case_id, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_RESULTS_MAX_BYTES", 100)
+    item = {"run_id": run_id, "test_case_id": case_id, "status": "passed", "notes": "x" * 200}
+    resp = client.post("/api/v1/test-results/bulk", json=[item], headers=auth_headers)
+    assert resp.status_code == 413
+
+
+def test_stream_results(client, auth_headers, run_id, case_id, monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_CHUNK_SIZE", 2)
+    good = f'{{"run_id": {run_id}, "test_case_id": {case_id}, "status": "passed"}}'
+    body = "\n".join([
+        good,
+        '{"run_id": 1, "status": "passed"}',
+        "",
+        good,
+        f'{{"run_id": 99999, "test_case_id": {case_id}, "status": "failed"}}',
+        "not json",
+        good,
+    ])
+    resp = client.post(
+        "/api/v1/test-results/stream",
+        content=body,
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["accepted"] == 3
+    assert data["rejected"] == 3
+    assert [e["line"] for e in data["errors"]] == [2, 5, 6]
+
+
+def test_stream_results_requires_ndjson(client, auth_headers):
+    resp = client.post("/api/v1/test-results/stream", content="{}", headers=auth_headers)
+    assert resp.status_code == 415
@@ -0,0 +1,294 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.config import settings
+
+JUNIT_REPORT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+  <testsuite name="checkout" tests="3">
+    <testcase classname="checkout" name="Pay with card" time="1.250"/>
+    <testcase classname="checkout" name="Pay with voucher" time="0.040">
+      <failure message="voucher rejected">AssertionError</failure>
+    </testcase>
+    <testcase classname="checkout" name="Pay with crypto">
+      <skipped/>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+@pytest.fixture(scope="module")
+def suite_id(client, auth_headers):
+    resp = client.post("/api/v1/test-suites/", json={"name": "Runs Suite"}, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+@pytest.fixture(scope="module")
+def case_id(client, auth_headers, suite_id):
+    resp = client.post("/api/v1/test-cases/", json={
+        "title": "Pay with card",
+        "suite_id": suite_id,
+    }, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def _create_run(client, auth_headers, suite_id, name="Release candidate"):
+    resp = client.post("/api/v1/test-runs/", json={"name": name, "suite_id": suite_id}, headers=auth_headers)
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def test_import_junit_matches_existing_cases(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id)
+    resp = client.post(
+        f"/api/v1/test-runs/{run_id}/junit",
+        files={"file": ("report.xml", JUNIT_REPORT, "application/xml")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["imported"] == 1
+    assert data["created_cases"] == 0
+    assert sorted(data["unmatched_titles"]) == ["Pay with crypto", "Pay with voucher"]
+
+    results = client.get(f"/api/v1/test-results/?run_id={run_id}", headers=auth_headers).json()
+    assert [(r["test_case_id"], r["duration_ms"]) for r in results] == [(case_id, 1250)]
+
+
+def test_import_junit_creates_missing_cases(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id)
+    resp = client.post(
+        f"/api/v1/test-runs/{run_id}/junit?create_missing=true",
+        files={"file": ("report.xml", JUNIT_REPORT, "application/xml")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"imported": 3, "created_cases": 2, "unmatched": 0, "unmatched_titles": [], "unnamed": 0}
+
+    results = client.get(f"/api/v1/test-results/?run_id={run_id}", headers=auth_headers).json()
+    assert sorted(r["status"] for r in results) == ["failed", "passed", "skipped"]
+
+
+def test_import_junit_rejects_bad_durations(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id)
+    report = b"""<testsuite name="times">
+      <testcase name="Forever" time="inf"/>
+      <testcase name="Too long" time="1e400"/>
+      <testcase name="Backwards" time="-2.5"/>
+    </testsuite>"""
+    resp = client.post(
+        f"/api/v1/test-runs/{run_id}/junit?create_missing=true",
+        files={"file": ("report.xml", report, "application/xml")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["imported"] == 3
+    results = client.get(f"/api/v1/test-results/?run_id={run_id}", headers=auth_headers).json()
+    assert [r["duration_ms"] for r in results] == [None, None, None]
+    assert client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()["total_duration_ms"] == 0
+
+
+def test_import_junit_skips_unnamed_testcases(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id)
+    report = b"""<testsuite name="names">
+      <testcase classname="anon" time="0.1"/>
+      <testcase name="   "/>
+      <testcase name="Named one"/>
+    </testsuite>"""
+    resp = client.post(
+        f"/api/v1/test-runs/{run_id}/junit?create_missing=true",
+        files={"file": ("report.xml", report, "application/xml")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["imported"], data["created_cases"], data["unnamed"]) == (1, 1, 2)
+    titles = [c["title"] for c in client.get("/api/v1/test-cases/", params={"suite_id": suite_id, "limit": 1000},
+                                             headers=auth_headers).json()]
+    assert "" not in titles and "Named one" in titles
+
+
+def test_import_junit_malformed(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id)
+    resp = client.post(
+        f"/api/v1/test-runs/{run_id}/junit",
+        files={"file": ("report.xml", b"<testsuites><testcase", "application/xml")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 400
+
+
+def test_run_summary(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Summary run")
+    results = [("passed", 100), ("passed", 300), ("failed", 200), ("skipped", None), ("passed", 400)]
+    resp = client.post("/api/v1/test-results/bulk", json=[
+        {"run_id": run_id, "test_case_id": case_id, "status": status, "duration_ms": duration}
+        for status, duration in results
+    ], headers=auth_headers)
+    assert resp.json()["created"] == 5
+
+    resp = client.get(f"/api/v1/test-runs/{run_id}/summary", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "run_id": run_id,
+        "total": 5,
+        "passed": 3,
+        "failed": 1,
+        "skipped": 1,
+        "blocked": 0,
+        "error": 0,
+        "pass_rate": 0.6,
+        "total_duration_ms": 1000,
+        "p50_duration_ms": 200,
+        "p95_duration_ms": 400,
+    }
+
+
+def test_run_summary_empty_run(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Empty run")
+    resp = client.get(f"/api/v1/test-runs/{run_id}/summary", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 0
+    assert resp.json()["p50_duration_ms"] is None
+
+
+def test_run_counters_follow_result_writes(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Counter run")
+    payload = {"run_id": run_id, "test_case_id": case_id}
+    first = client.post("/api/v1/test-results/", json={**payload, "status": "failed", "duration_ms": 50},
+                        headers=auth_headers).json()
+    client.post("/api/v1/test-results/bulk", json=[
+        {**payload, "status": "passed", "duration_ms": 10},
+        {**payload, "status": "passed", "duration_ms": 20},
+    ], headers=auth_headers)
+    client.patch(f"/api/v1/test-results/{first['id']}", json={"status": "passed"}, headers=auth_headers)
+    second = client.post("/api/v1/test-results/", json={**payload, "status": "error"}, headers=auth_headers).json()
+    client.delete(f"/api/v1/test-results/{second['id']}", headers=auth_headers)
+
+    run = client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()
+    assert (run["passed_count"], run["failed_count"], run["error_count"]) == (3, 0, 0)
+    assert run["total_count"] == 3
+    assert run["total_duration_ms"] == 80
+
+
+def test_recount_run_counters(client, auth_headers, suite_id, case_id, db):
+    from app.crud.test_run import recount_run_counters
+    from app.models.test_run import TestRun
+
+    run_id = _create_run(client, auth_headers, suite_id, name="Drifted run")
+    client.post("/api/v1/test-results/", json={
+        "run_id": run_id, "test_case_id": case_id, "status": "blocked", "duration_ms": 7,
+    }, headers=auth_headers)
+    db.get(TestRun, run_id).total_count = 42
+    db.commit()
+
+    assert recount_run_counters(db, [run_id]) == 1
+    run = client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()
+    assert (run["blocked_count"], run["total_count"], run["total_duration_ms"]) == (1, 1, 7)
+
+
+def test_list_runs_matches_get(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Listed run")
+    resp = client.get("/api/v1/test-runs/", params={"limit": 1000}, headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    listed = next(r for r in resp.json() if r["id"] == run_id)
+    assert listed == client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()
+
+
+def test_run_etag_follows_result_writes(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Tagged run")
+    etag = client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).headers["ETag"]
+    conditional = {**auth_headers, "If-None-Match": etag}
+    assert client.get(f"/api/v1/test-runs/{run_id}", headers=conditional).status_code == 304
+
+    client.post("/api/v1/test-results/", json={"run_id": run_id, "test_case_id": case_id, "status": "passed"},
+                headers=auth_headers)
+    resp = client.get(f"/api/v1/test-runs/{run_id}", headers=conditional)
+    assert resp.status_code == 200
+    assert resp.json()["passed_count"] == 1
+
+
+def test_run_summary_cache_follows_writes(client, auth_headers, suite_id, case_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Cached summary run")
+    summary_url = f"/api/v1/test-runs/{run_id}/summary"
+    assert client.get(summary_url, headers=auth_headers).json()["total"] == 0
+
+    result = client.post("/api/v1/test-results/", json={
+        "run_id": run_id, "test_case_id": case_id, "status": "failed", "duration_ms": 70,
+    }, headers=auth_headers).json()
+    assert client.get(summary_url, headers=auth_headers).json()["failed"] == 1
+
+    client.patch(f"/api/v1/test-results/{result['id']}", json={"status": "passed"}, headers=auth_headers)
+    summary = client.get(summary_url, headers=auth_headers).json()
+    assert (summary["passed"], summary["failed"]) == (1, 0)
+
+    history = client.get(f"/api/v1/test-cases/{case_id}/history", headers=auth_headers).json()
+    assert history["recent"][0]["result_id"] == result["id"]
+    assert history["recent"][0]["status"] == "passed"
+
+    client.delete(f"/api/v1/test-results/{result['id']}", headers=auth_headers)
+    assert client.get(summary_url, headers=auth_headers).json()["total"] == 0
+    history = client.get(f"/api/v1/test-cases/{case_id}/history", headers=auth_headers).json()
+    assert result["id"] not in [entry["result_id"] for entry in history["recent"]]
+
+
+def test_export_run_results(client, auth_headers, suite_id, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_YIELD_PER", 1)
+    run_id = _create_run(client, auth_headers, suite_id, name="Export run")
+    client.post(
+        f"/api/v1/test-runs/{run_id}/junit?create_missing=true",
+        files={"file": ("report.xml", JUNIT_REPORT, "application/xml")},
+        headers=auth_headers,
+    )
+    results = client.get(f"/api/v1/test-results/?run_id={run_id}", headers=auth_headers).json()
+    client.patch(f"/api/v1/test-results/{results[1]['id']}", json={"notes": 'Rejected, "expired"\nsee log'},
+                 headers=auth_headers)
+
+    resp = client.get(f"/api/v1/test-runs/{run_id}/export", headers={**auth_headers, "Accept-Encoding": "identity"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "content-encoding" not in resp.headers
+    assert f'filename="run-{run_id}-results.csv"' in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [(int(row["id"]), row["test_case_title"], row["status"]) for row in rows] == [
+        (r["id"], title, r["status"])
+        for r, title in zip(results, ["Pay with card", "Pay with voucher", "Pay with crypto"])
+    ]
+    assert rows[1]["notes"] == 'Rejected, "expired"\nsee log'
+    assert rows[2]["duration_ms"] == ""
+
+    resp = client.get(f"/api/v1/test-runs/{run_id}/export", params={"format": "ndjson"},
+                      headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["id"] for line in lines] == [r["id"] for r in results]
+    assert lines[0]["executed_at"] == rows[0]["executed_at"]
+    assert lines[2]["duration_ms"] is None
+
+    assert client.get("/api/v1/test-runs/999999/export", headers=auth_headers).status_code == 404
+    assert client.get(f"/api/v1/test-runs/{run_id}/export", params={"format": "xml"},
+                      headers=auth_headers).status_code == 422
+
+
+def test_deleting_a_case_recounts_its_runs(client, auth_headers, suite_id):
+    run_id = _create_run(client, auth_headers, suite_id, name="Recount on delete")
+    doomed = client.post("/api/v1/test-cases/", json={"title": "Doomed", "suite_id": suite_id},
+                         headers=auth_headers).json()["id"]
+    client.post("/api/v1/test-results/", json={
+        "run_id": run_id, "test_case_id": doomed, "status": "failed", "duration_ms": 3_000_000_000,
+    }, headers=auth_headers)
+    run = client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()
+    assert (run["failed_count"], run["total_duration_ms"]) == (1, 3_000_000_000)
+
+    client.delete(f"/api/v1/test-cases/{doomed}", headers=auth_headers)
+    run = client.get(f"/api/v1/test-runs/{run_id}", headers=auth_headers).json()
+    assert (run["failed_count"], run["total_count"], run["total_duration_ms"]) == (0, 0, 0)
+    assert client.get(f"/api/v1/test-runs/{run_id}/summary", headers=auth_headers).json()["total"] == 0
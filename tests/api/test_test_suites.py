@@ -1,5 +1,11 @@
+import csv
+import io
+import json
+
 import pytest
 
+from app.config import settings
+
 
 @pytest.fixture(scope="module")
 def suite(client, auth_headers):
@@ -40,3 +46,153 @@ def test_delete_suite(client, auth_headers):
 
     resp = client.get(f"/api/v1/test-suites/{suite_id}", headers=auth_headers)
     assert resp.status_code == 404
+
+
+def test_suite_report_follows_writes(client, auth_headers):
+    suite_id = client.post("/api/v1/test-suites/", json={"name": "Report Suite"}, headers=auth_headers).json()["id"]
+    report_url = f"/api/v1/test-suites/{suite_id}/report"
+    assert client.get(report_url, headers=auth_headers).json() == {
+        "suite_id": suite_id, "total_cases": 0, "cases_by_status": {}, "cases_by_priority": {},
+        "total_runs": 0, "runs_by_status": {},
+    }
+
+    case = client.post("/api/v1/test-cases/", json={"title": "Reported", "suite_id": suite_id, "priority": "high"},
+                       headers=auth_headers).json()
+    client.post("/api/v1/test-runs/", json={"name": "Reported run", "suite_id": suite_id}, headers=auth_headers)
+    report = client.get(report_url, headers=auth_headers).json()
+    assert report["cases_by_priority"] == {"high": 1}
+    assert report["runs_by_status"] == {"pending": 1}
+
+    client.patch(f"/api/v1/test-cases/{case['id']}", json={"status": "active"}, headers=auth_headers)
+    assert client.get(report_url, headers=auth_headers).json()["cases_by_status"] == {"active": 1}
+
+
+def test_suite_stability(client, auth_headers):
+    suite_id = client.post("/api/v1/test-suites/", json={"name": "Flaky Suite"}, headers=auth_headers).json()["id"]
+    cases = {
+        title: client.post("/api/v1/test-cases/", json={"title": title, "suite_id": suite_id},
+                           headers=auth_headers).json()["id"]
+        for title in ("flaky", "broken", "stable", "never run")
+    }
+    sequences = {"flaky": "PFPSFP", "broken": "FFEFFF", "stable": "PPPPPP"}
+    names = {"P": "passed", "F": "failed", "E": "error", "S": "skipped"}
+    for n in range(6):
+        run_id = client.post("/api/v1/test-runs/", json={"name": f"Nightly {n}", "suite_id": suite_id},
+                             headers=auth_headers).json()["id"]
+        client.post("/api/v1/test-results/bulk", json=[
+            {"run_id": run_id, "test_case_id": cases[title], "status": names[codes[n]]}
+            for title, codes in sequences.items()
+        ], headers=auth_headers)
+
+    resp = client.get(f"/api/v1/test-suites/{suite_id}/stability", headers=auth_headers)
+    assert resp.status_code == 200
+    report = resp.json()
+    assert [row["title"] for row in report] == ["flaky", "broken", "stable", "never run"]
+    assert report[0] == {
+        "case_id": cases["flaky"], "title": "flaky", "total": 6, "failures": 2,
+        "window_size": 6, "failure_rate": 0.4, "flips": 4, "recent": "PFPSFP",
+    }
+    assert (report[1]["failure_rate"], report[1]["flips"], report[1]["failures"]) == (1.0, 0, 6)
+    assert report[3]["window_size"] == 0
+
+    windowed = client.get(f"/api/v1/test-suites/{suite_id}/stability", params={"window": 3, "min_flips": 1},
+                          headers=auth_headers).json()
+    assert [(row["title"], row["recent"], row["flips"]) for row in windowed] == [("flaky", "SFP", 1)]
+
+    # Editing or deleting a result rebuilds the case's window
+    flaky_results = client.get("/api/v1/test-results/", params={"run_id": run_id}, headers=auth_headers).json()
+    last = next(r for r in flaky_results if r["test_case_id"] == cases["flaky"])
+    client.patch(f"/api/v1/test-results/{last['id']}", json={"status": "failed"}, headers=auth_headers)
+    report = client.get(f"/api/v1/test-suites/{suite_id}/stability", headers=auth_headers).json()
+    assert report[0]["recent"] == "PFPSFF"
+    client.delete(f"/api/v1/test-results/{last['id']}", headers=auth_headers)
+    report = client.get(f"/api/v1/test-suites/{suite_id}/stability", headers=auth_headers).json()
+    assert (report[0]["recent"], report[0]["total"]) == ("PFPSF", 5)
+
+
+def test_stability_window_counts_runs_not_results(client, auth_headers):
+    suite_id = client.post("/api/v1/test-suites/", json={"name": "Retried"}, headers=auth_headers).json()["id"]
+    case_id = client.post("/api/v1/test-cases/", json={"title": "retried", "suite_id": suite_id},
+                          headers=auth_headers).json()["id"]
+    runs = [client.post("/api/v1/test-runs/", json={"name": f"CI {n}", "suite_id": suite_id},
+                        headers=auth_headers).json()["id"] for n in range(3)]
+
+    def record(run_id, *statuses):
+        for status in statuses:
+            client.post("/api/v1/test-results/", json={"run_id": run_id, "test_case_id": case_id, "status": status},
+                        headers=auth_headers)
+
+    def window():
+        row = client.get(f"/api/v1/test-suites/{suite_id}/stability", headers=auth_headers).json()[0]
+        return row["recent"], row["flips"], row["total"]
+
+    # Retries within a run take that run's slot: its latest result counts
+    record(runs[0], "passed")
+    record(runs[2], "failed", "failed", "passed")
+    assert window() == ("PP", 0, 4)
+    # A late result for an earlier run lands in that run's place
+    record(runs[1], "failed")
+    assert window() == ("PFP", 2, 5)
+    record(runs[2], "error")
+    assert window() == ("PFE", 1, 6)
+
+
+def test_import_and_export_cases(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_CHUNK_SIZE", 2)
+    suite_id = client.post("/api/v1/test-suites/", json={"name": "Imported"}, headers=auth_headers).json()["id"]
+    existing = client.post("/api/v1/test-cases/", json={
+        "suite_id": suite_id, "title": "Login works", "description": "Kept", "priority": "high",
+    }, headers=auth_headers).json()
+
+    csv_body = (
+        "\ufeffTitle,steps,priority,severity\r\n"
+        'Login works,"1. Open\r\n2. Sign in, then wait",,\r\n'
+        "Logout works,,low,minor\r\n"
+        ",no title,,\r\n"
+        "Reset password,,urgent,\r\n"
+    ).encode()
+    resp = client.post(f"/api/v1/test-suites/{suite_id}/cases/import", content=csv_body,
+                       headers={**auth_headers, "Content-Type": "text/csv"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["created"], data["updated"], data["rejected"]) == (1, 1, 2)
+    assert [error["line"] for error in data["errors"]] == [5, 6]
+
+    updated = client.get(f"/api/v1/test-cases/{existing['id']}", headers=auth_headers).json()
+    assert updated["steps"] == "1. Open\n2. Sign in, then wait"
+    assert (updated["description"], updated["priority"]) == ("Kept", "high")
+    assert updated["updated_at"] != existing["updated_at"]
+
+    ndjson_body = "\n".join([
+        json.dumps({"title": "Reset password", "priority": "critical"}),
+        json.dumps({"title": "Logout works", "status": "active"}),
+        "{not json",
+    ])
+    resp = client.post(f"/api/v1/test-suites/{suite_id}/cases/import", content=ndjson_body,
+                       headers={**auth_headers, "Content-Type": "application/x-ndjson"})
+    assert (resp.json()["created"], resp.json()["updated"], resp.json()["rejected"]) == (1, 1, 1)
+
+    search = client.get("/api/v1/test-cases/search", params={"q": "sign", "suite_id": suite_id}, headers=auth_headers)
+    assert [case["id"] for case in search.json()] == [existing["id"]]
+
+    resp = client.get(f"/api/v1/test-suites/{suite_id}/cases/export", headers=auth_headers)
+    assert resp.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [(row["title"], row["priority"], row["status"]) for row in rows] == [
+        ("Login works", "high", "draft"),
+        ("Logout works", "low", "active"),
+        ("Reset password", "critical", "draft"),
+    ]
+
+    exported = client.get(f"/api/v1/test-suites/{suite_id}/cases/export", params={"format": "ndjson"},
+                          headers=auth_headers).content
+    resp = client.post(f"/api/v1/test-suites/{suite_id}/cases/import", content=exported,
+                       headers={**auth_headers, "Content-Type": "application/x-ndjson"})
+    assert (resp.json()["created"], resp.json()["updated"], resp.json()["rejected"]) == (0, 3, 0)
+
+    resp = client.post(f"/api/v1/test-suites/{suite_id}/cases/import", content=b"name\nx\n",
+                       headers={**auth_headers, "Content-Type": "text/csv"})
+    assert resp.status_code == 400
+    resp = client.post(f"/api/v1/test-suites/{suite_id}/cases/import", content=b"[]",
+                       headers={**auth_headers, "Content-Type": "application/json"})
+    assert resp.status_code == 415
@@ -4,17 +4,17 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base
+from app.database import Base, configure_engine
 from app.dependencies import get_db
 from main import app
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
-_engine = create_engine(
+_engine = configure_engine(create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
-)
+))
 _TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
 
 
@@ -37,6 +37,15 @@ def create_tables():
     Base.metadata.drop_all(bind=_engine)
 
 
+@pytest.fixture
+def db():
+    session = _TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 @pytest.fixture(scope="session")
 def client(create_tables):
     with TestClient(app) as c:
@@ -0,0 +1,20 @@
+from benchmarks.compare import compare
+from benchmarks.run import percentile
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_compare_flags_regressions():
+    def report(p95, rps):
+        return {"endpoints": [{"name": "runs.list", "throughput_rps": rps,
+                               "latency_ms": {"p50": 1.0, "p95": p95, "p99": p95}}]}
+
+    _, regressions = compare(report(10.0, 100.0), report(10.5, 98.0), threshold=10)
+    assert regressions == []
+    _, regressions = compare(report(10.0, 100.0), report(15.0, 100.0), threshold=10)
+    assert regressions == ["runs.list"]
@@ -0,0 +1,42 @@
+from sqlalchemy import create_engine, text
+
+from app.core import metrics
+from app.database import TimedQueuePool, configure_engine, engine_options
+
+
+def test_engine_options_sqlite_file():
+    options = engine_options("sqlite:///./qa.db")
+    assert options["connect_args"] == {"check_same_thread": False}
+    assert "pool_size" in options
+    assert "pool_pre_ping" not in options
+
+
+def test_engine_options_sqlite_memory_keeps_default_pool():
+    assert engine_options("sqlite:///:memory:") == {"connect_args": {"check_same_thread": False}}
+
+
+def test_engine_options_postgresql():
+    options = engine_options("postgresql+psycopg2://user:pw@localhost/qa")
+    assert options["pool_pre_ping"] is True
+    assert "connect_args" not in options
+
+
+def test_sqlite_pragmas_applied(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pragmas.db'}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
+
+
+def test_pool_checkout_wait_recorded(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    assert isinstance(engine.pool, TimedQueuePool)
+    before = metrics.DB_POOL_CHECKOUT_WAIT._series.get((), [0])[-1]
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert metrics.DB_POOL_CHECKOUT_WAIT._series[()][-1] == before + 1
+    engine.dispose()
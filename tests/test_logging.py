@@ -0,0 +1,26 @@
+import json
+import logging
+
+from app.core.logging import JsonFormatter, RequestIdFilter, request_id_var
+
+
+def test_request_id_generated_and_echoed(client):
+    res = client.get("/health")
+    assert len(res.headers["X-Request-ID"]) == 32
+
+    res = client.get("/health", headers={"X-Request-ID": "ci-build-42"})
+    assert res.headers["X-Request-ID"] == "ci-build-42"
+
+
+def test_json_formatter_includes_request_id():
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    token = request_id_var.set("abc123")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "hello world"
+    assert entry["request_id"] == "abc123"
+    assert entry["level"] == "INFO"
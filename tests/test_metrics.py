@@ -0,0 +1,30 @@
+import re
+
+
+def _sample(text, name, **labels):
+    label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    match = re.search(rf"^{re.escape(name)}\{{{re.escape(label_text)}\}} (\S+)$", text, re.M)
+    return float(match.group(1)) if match else None
+
+
+def test_metrics_by_route_template(client, auth_headers):
+    suite = client.post("/api/v1/test-suites/", json={"name": "Metrics"}, headers=auth_headers).json()
+    client.get(f"/api/v1/test-suites/{suite['id']}", headers=auth_headers)
+    client.get("/api/v1/test-suites/999999", headers=auth_headers)
+
+    text = client.get("/metrics").text
+    route = "/api/v1/test-suites/{suite_id}"
+    assert _sample(text, "http_requests_total", method="GET", route=route, status="200") >= 1
+    assert _sample(text, "http_requests_total", method="GET", route=route, status="404") >= 1
+    assert _sample(text, "http_request_duration_seconds_count", method="GET", route=route) >= 2
+    assert _sample(text, "http_request_db_statements_sum", method="GET", route=route) >= 2
+    assert "http_requests_in_flight" in text
+    assert "principal_cache_hits_total" in text
+
+
+def test_metrics_unmatched_paths_share_one_label(client):
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+    text = client.get("/metrics").text
+    assert _sample(text, "http_requests_total", method="GET", route="unmatched", status="404") >= 2
+    assert "/no/such/path" not in text
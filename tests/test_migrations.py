@@ -0,0 +1,32 @@
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+
+import app.models  # noqa: F401
+from app.database import Base
+from app.models.test_case_search import include_name
+
+
+def _alembic_config(url: str) -> Config:
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+def test_migrations_match_models(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    command.upgrade(_alembic_config(url), "head")
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn, opts={"include_name": include_name}), Base.metadata)
+    engine.dispose()
+    assert diff == []
+
+
+def test_migrations_downgrade_to_base(tmp_path):
+    config = _alembic_config(f"sqlite:///{tmp_path / 'migrated.db'}")
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
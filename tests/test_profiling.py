@@ -0,0 +1,55 @@
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.principals import Principal
+from app.core.profiling import ProfilingMiddleware, get_profile, start_sampling
+from app.models.user import User
+
+
+def _busy(ms: float) -> None:
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+
+    @app.get("/work")
+    def work(request: Request, who: str):
+        # What the auth dependency does once the caller is known
+        request.state.principal = Principal(User(id=1, email=who, is_active=True))
+        start_sampling(request)
+        _busy(50)
+        return {"sampled": any(t.name.startswith("profiler-") for t in threading.enumerate())}
+
+    return app
+
+
+def test_admin_request_is_profiled(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["admin@example.com"])
+    with TestClient(_app()) as client:
+        res = client.get("/work", params={"who": "admin@example.com"}, headers={"X-Profile": "1"})
+
+    profile = get_profile(res.headers["X-Profile-Id"])
+    assert profile.status_code == 200
+    assert profile.samples > 0
+    names = {fn["function"] for fn in profile.top_functions()}
+    assert {"work", "_busy"} <= names
+    assert "_busy" in profile.collapsed()
+
+
+def test_unflagged_or_non_admin_requests_not_profiled(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["admin@example.com"])
+    with TestClient(_app()) as client:
+        plain = client.get("/work", params={"who": "admin@example.com"})
+        other = client.get("/work", params={"who": "dev@example.com", "profile": "1"})
+    assert "X-Profile-Id" not in plain.headers
+    assert "X-Profile-Id" not in other.headers
+    # No sampler thread is ever started for a non-admin
+    assert other.json() == {"sampled": False}
@@ -0,0 +1,132 @@
+import sys
+import threading
+import time
+import types
+
+from pydantic import BaseModel
+
+from app.core.response_cache import LocalBackend, RedisBackend, ResponseCache
+
+
+class Report(BaseModel):
+    value: int
+
+
+def test_concurrent_misses_run_one_query():
+    cache = ResponseCache(LocalBackend(maxsize=10, ttl=60))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return Report(value=len(calls))
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", Report, compute)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [r.value for r in results] == [1] * 8
+    assert cache.misses == 1
+    assert cache.coalesced + cache.hits == 7
+    assert cache.get_or_compute("k", Report, compute).value == 1
+
+
+def test_invalidation_during_compute_is_not_stored():
+    cache = ResponseCache(LocalBackend(maxsize=10, ttl=60))
+
+    def compute_then_write():
+        value = Report(value=1)
+        cache.invalidate("k")   # a write lands while the query is running
+        return value
+
+    assert cache.get_or_compute("k", Report, compute_then_write).value == 1
+    assert cache.get_or_compute("k", Report, lambda: Report(value=2)).value == 2
+    assert cache.get_or_compute("k", Report, lambda: Report(value=3)).value == 2
+
+
+def test_invalidation_from_another_worker_drops_the_store():
+    # Two workers sharing one backend, as with Redis
+    shared = LocalBackend(maxsize=10, ttl=60)
+    worker_a, worker_b = ResponseCache(shared), ResponseCache(shared)
+
+    def compute_then_write_elsewhere():
+        value = Report(value=1)
+        worker_b.invalidate("k")
+        return value
+
+    assert worker_a.get_or_compute("k", Report, compute_then_write_elsewhere).value == 1
+    assert worker_b.get_or_compute("k", Report, lambda: Report(value=2)).value == 2
+    assert worker_a.get_or_compute("k", Report, lambda: Report(value=3)).value == 2
+
+
+def test_request_after_invalidation_does_not_join_older_flight():
+    cache = ResponseCache(LocalBackend(maxsize=10, ttl=60))
+    started, release = threading.Event(), threading.Event()
+
+    def slow_compute():
+        started.set()
+        release.wait()
+        return Report(value=1)
+
+    first = threading.Thread(target=lambda: cache.get_or_compute("k", Report, slow_compute))
+    first.start()
+    started.wait()
+    cache.invalidate("k")
+    assert cache.get_or_compute("k", Report, lambda: Report(value=2)).value == 2
+    release.set()
+    first.join()
+    assert cache.get_or_compute("k", Report, lambda: Report(value=3)).value == 2
+
+
+def test_stamps_are_bounded():
+    backend = LocalBackend(maxsize=2, ttl=60)
+    _, generation = backend.load("k", Report)
+    backend.delete(["a", "b", "k", "c", "d"])
+    assert len(backend._stamps) == 2
+    backend.store("k", Report(value=1), generation)
+    assert backend.load("k", Report)[0] is None
+
+
+def test_errors_are_not_cached():
+    cache = ResponseCache(LocalBackend(maxsize=10, ttl=60))
+
+    def fail():
+        raise RuntimeError("boom")
+
+    try:
+        cache.get_or_compute("k", Report, fail)
+    except RuntimeError:
+        pass
+    assert cache.get_or_compute("k", Report, lambda: Report(value=5)).value == 5
+
+
+def test_redis_outage_degrades_to_misses(monkeypatch):
+    class RedisError(Exception):
+        pass
+
+    def fail(*args, **kwargs):
+        raise RedisError("Connection refused")
+
+    class DownClient:
+        def register_script(self, script):
+            return fail
+
+        def __getattr__(self, name):
+            return fail
+
+    fake = types.SimpleNamespace(
+        RedisError=RedisError,
+        Redis=types.SimpleNamespace(from_url=lambda url: DownClient()),
+    )
+    monkeypatch.setitem(sys.modules, "redis", fake)
+    cache = ResponseCache(RedisBackend("redis://localhost:1", ttl=60))
+
+    assert cache.get_or_compute("k", Report, lambda: Report(value=1)) == Report(value=1)
+    assert cache.get_or_compute("k", Report, lambda: Report(value=2)) == Report(value=2)
+    cache.invalidate("k")
+    cache.clear()
@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.crud.test_case_stats import rebuild_case_stats
+from app.database import Base, configure_engine, engine_options
+from app.models.test_case_stats import TestCaseStats
+from app.models.test_result import TestResult
+from app.models.test_run import TestRun
+from app.models.test_suite import TestSuite
+from app.seeding import SeedConfig, seed_database
+
+CONFIG = SeedConfig(users=2, suites=4, cases_per_suite=25, runs_per_suite=6, seed=7, batch_size=100)
+
+
+def _seeded(tmp_path, name):
+    url = f"sqlite:///{tmp_path / name}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    Base.metadata.create_all(engine)
+    seed_database(engine, CONFIG)
+    return engine
+
+
+def test_seed_is_deterministic(tmp_path):
+    first, second = _seeded(tmp_path, "a.db"), _seeded(tmp_path, "b.db")
+    rows = select(TestResult.id, TestResult.status, TestResult.duration_ms, TestResult.executed_at)
+    with first.connect() as a, second.connect() as b:
+        assert a.execute(rows.order_by(TestResult.id)).all() == b.execute(rows.order_by(TestResult.id)).all()
+        assert a.scalar(select(func.count()).select_from(TestResult)) == CONFIG.results
+        owners = a.execute(select(TestSuite.owner_id).order_by(TestSuite.id)).scalars().all()
+        assert owners == [1, 2, 1, 2]
+    first.dispose()
+    second.dispose()
+
+
+def test_seed_counters_and_indexes(tmp_path):
+    engine = _seeded(tmp_path, "seed.db")
+    with engine.connect() as conn:
+        actual = dict(conn.execute(
+            select(TestResult.run_id, func.count()).where(TestResult.status == "failed").group_by(TestResult.run_id)
+        ).all())
+        durations = dict(conn.execute(
+            select(TestResult.run_id, func.sum(TestResult.duration_ms)).group_by(TestResult.run_id)
+        ).all())
+        for run_id, failed, total_ms in conn.execute(select(TestRun.id, TestRun.failed_count, TestRun.total_duration_ms)):
+            assert failed == actual.get(run_id, 0)
+            assert total_ms == durations[run_id]
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("test_results")}
+    assert {index.name for index in TestResult.__table__.indexes} <= indexes
+
+    with pytest.raises(ValueError):
+        seed_database(engine, CONFIG)
+    engine.dispose()
+
+
+def test_failed_seed_recreates_indexes(tmp_path):
+    url = f"sqlite:///{tmp_path / 'failed.db'}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    Base.metadata.create_all(engine)
+
+    def progress(stats):
+        if stats.results:
+            raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        seed_database(engine, CONFIG, progress)
+    indexes = {index["name"] for index in inspect(engine).get_indexes("test_results")}
+    assert {index.name for index in TestResult.__table__.indexes} <= indexes
+    engine.dispose()
+
+
+def test_seeded_case_stats_match_rebuild(tmp_path):
+    engine = _seeded(tmp_path, "stats.db")
+    rows = select(TestCaseStats).order_by(TestCaseStats.test_case_id)
+    with Session(engine) as db:
+        seeded = [(s.test_case_id, s.total_count, s.failure_count, s.recent, s.last_run_id) for s in db.scalars(rows)]
+        assert len(seeded) == CONFIG.cases
+        rebuild_case_stats(db)
+        db.expire_all()
+        assert [(s.test_case_id, s.total_count, s.failure_count, s.recent, s.last_run_id) for s in db.scalars(rows)] == seeded
+    engine.dispose()
+
+
+def test_config_for_results():
+    config = SeedConfig.for_results(10_000_000, suites=2000, cases_per_suite=100)
+    assert config.runs_per_suite == 50
+    assert config.results == 10_000_000
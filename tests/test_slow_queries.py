@@ -0,0 +1,48 @@
+from sqlalchemy import create_engine, text
+
+from app.core.slow_queries import SlowQueryLog, params_shape
+from app.database import configure_engine, engine_options
+
+
+def _engine(tmp_path):
+    url = f"sqlite:///{tmp_path / 'slow.db'}"
+    engine = configure_engine(create_engine(url, **engine_options(url)))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (name) VALUES (:name)"), [{"name": f"n{i}"} for i in range(5)])
+    return engine
+
+
+def test_slow_statements_recorded_with_plan(tmp_path):
+    engine = _engine(tmp_path)
+    log = SlowQueryLog(threshold_ms=0, top_n=10)
+    log.install(engine)
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            conn.execute(text("SELECT * FROM items WHERE name = :name"), {"name": "n3"}).all()
+
+    entry = next(e for e in log.top() if e.statement.startswith("SELECT * FROM items"))
+    assert entry.count == 3
+    assert entry.params_shape == ["str"]
+    assert any("SCAN" in line for line in entry.plan)
+    engine.dispose()
+
+
+def test_threshold_and_top_n(tmp_path):
+    engine = _engine(tmp_path)
+    log = SlowQueryLog(threshold_ms=60_000, top_n=2)
+    log.install(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert log.top() == []
+
+    for ms, sql in ((5, "a"), (50, "b"), (20, "c")):
+        log.record(sql, [], None, [], ms)
+    assert [e.statement for e in log.top()] == ["b", "c"]
+    engine.dispose()
+
+
+def test_params_shape_hides_values():
+    assert params_shape({"email": "x@y.z", "id": 3}, False) == {"email": "str", "id": "int"}
+    assert params_shape([(1, "a"), (2, "b")], True) == {"rows": 2, "each": ["int", "str"]}